@@ -3,11 +3,17 @@
 Wraps environment variables and provides defaults.
 """
 
+import importlib.util
 from typing import Optional
 
 from pydantic import PostgresDsn, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 
+# Digest algorithms an entity hash can use. sha256 is the default, blake2b and xxh3_128 are
+# faster for large entities but give different hashes, so switching makes every stored
+# entity look changed once.
+ENTITY_HASH_ALGORITHMS = ("sha256", "blake2b", "xxh3_128")
+
 
 class Settings(BaseSettings):
     """Pydantic settings class.
@@ -35,8 +41,55 @@ class Settings(BaseSettings):
         QDRANT_PORT (int): The Qdrant port.
         QDRANT_URL (str): The Qdrant URL.
         TEXT2VEC_INFERENCE_URL (str): The URL for text2vec-transformers inference service.
+        TEXT2VEC_BATCH_SIZE (int): Texts per request to the `/embed` batch endpoint of the
+            inference service (the Hugging Face text-embeddings-inference API), 0 to send
+            texts one by one to the `/vectors` endpoint of text2vec-transformers.
+        TEXT2VEC_MAX_CONCURRENCY (int): Maximum number of concurrent requests to the
+            inference service per batch of texts.
+        ONNX_EMBEDDING_MODEL_DIR (Optional[str]): Directory of a MiniLM-class model exported
+            to ONNX (model.onnx, model_quantized.onnx and tokenizer.json). When set, and no
+            OpenAI API key is, embeddings are computed in process instead of by the
+            text2vec-transformers service. Requires the "onnx" extra
+            (`poetry install --extras onnx`).
+        ONNX_EMBEDDING_QUANTIZED (bool): Whether to use the int8 quantized weights of the
+            ONNX model.
+        ONNX_EMBEDDING_WORKERS (int): Number of ONNX inference batches run at the same time.
+        ONNX_EMBEDDING_THREADS (int): Threads per ONNX inference batch, 0 to share the CPU
+            cores between the workers.
+        ONNX_EMBEDDING_BATCH_SIZE (int): Maximum number of texts per ONNX inference batch.
         OPENAI_API_KEY (Optional[str]): The OpenAI API key.
+        OPENAI_EMBEDDING_RPM (int): Requests per minute of the OpenAI account's embedding
+            rate limit, shared by all syncs and searches of the process.
+        OPENAI_EMBEDDING_TPM (int): Tokens per minute of the OpenAI account's embedding rate
+            limit, shared by all syncs and searches of the process.
         MISTRAL_API_KEY (Optional[str]): The Mistral AI API key.
+        MISTRAL_OCR_MAX_CONCURRENCY (int): Maximum number of PDFs and PDF page batches
+            processed by Mistral OCR at the same time.
+        SYNC_MAX_CONCURRENCY (int): Global number of concurrently processed entity batches,
+            shared fairly by all syncs running in this process.
+        SYNC_ORGANIZATION_WEIGHTS (dict[str, float]): Relative share of the sync concurrency
+            budget per organization id. Organizations not listed have weight 1.0.
+        ENTITY_HASH_ALGORITHM (str): Digest used for entity change detection: sha256,
+            blake2b or xxh3_128 (`poetry install --extras xxhash`). Changing it marks
+            every entity as updated on its next sync.
+        FILE_STORE_DIR (str): Directory downloaded files are stored in.
+        FILE_STORE_DISK_BUDGET (int): Maximum total size of the downloaded files on disk,
+            in bytes. Downloads wait for space once it is reached.
+        FILE_STORE_MEMORY_THRESHOLD (int): Files up to this size in bytes are kept in
+            memory instead of on disk.
+        CONVERSION_WORKERS (int): Number of processes converting documents to markdown,
+            0 to convert in a thread of the server process.
+        CONVERSION_TIMEOUT (float): Maximum duration of a document conversion, in seconds.
+        CONVERSION_MEMORY_LIMIT (int): Maximum memory of a conversion process in bytes,
+            0 for no limit.
+        CONVERSION_CACHE_DIR (str): Directory converted documents are cached in, by
+            checksum, so files with the same contents are converted once.
+        CONVERSION_CACHE_SIZE (int): Maximum total size of the conversion cache in bytes,
+            0 to disable it.
+        EMBEDDING_CACHE_PATH (str): SQLite database embedding vectors are cached in, by
+            model and text.
+        EMBEDDING_CACHE_SIZE (int): Maximum total size of the embedding cache in bytes,
+            0 to disable it.
     """
 
     PROJECT_NAME: str = "Airweave"
@@ -71,9 +124,38 @@ class Settings(BaseSettings):
     QDRANT_URL: str = f"http://{QDRANT_HOST}:{QDRANT_PORT}"
 
     TEXT2VEC_INFERENCE_URL: str = "http://localhost:9878"
+    TEXT2VEC_BATCH_SIZE: int = 0
+    TEXT2VEC_MAX_CONCURRENCY: int = 8
+
+    ONNX_EMBEDDING_MODEL_DIR: Optional[str] = None
+    ONNX_EMBEDDING_QUANTIZED: bool = False
+    ONNX_EMBEDDING_WORKERS: int = 1
+    ONNX_EMBEDDING_THREADS: int = 0
+    ONNX_EMBEDDING_BATCH_SIZE: int = 32
 
     OPENAI_API_KEY: Optional[str] = None
+    OPENAI_EMBEDDING_RPM: int = 3000
+    OPENAI_EMBEDDING_TPM: int = 1_000_000
     MISTRAL_API_KEY: Optional[str] = None
+    MISTRAL_OCR_MAX_CONCURRENCY: int = 4
+
+    SYNC_MAX_CONCURRENCY: int = 60
+    SYNC_ORGANIZATION_WEIGHTS: dict[str, float] = {}
+
+    ENTITY_HASH_ALGORITHM: str = "sha256"
+
+    FILE_STORE_DIR: str = "/tmp/airweave"
+    FILE_STORE_DISK_BUDGET: int = 10 * 1024 * 1024 * 1024  # 10GB
+    FILE_STORE_MEMORY_THRESHOLD: int = 1024 * 1024  # 1MB
+
+    CONVERSION_WORKERS: int = 4
+    CONVERSION_TIMEOUT: float = 300.0
+    CONVERSION_MEMORY_LIMIT: int = 4 * 1024 * 1024 * 1024  # 4GB
+    CONVERSION_CACHE_DIR: str = "/tmp/airweave-conversions"
+    CONVERSION_CACHE_SIZE: int = 5 * 1024 * 1024 * 1024  # 5GB
+
+    EMBEDDING_CACHE_PATH: str = "/tmp/airweave-embeddings.db"
+    EMBEDDING_CACHE_SIZE: int = 2 * 1024 * 1024 * 1024  # 2GB
 
     @field_validator("AUTH0_DOMAIN", "AUTH0_AUDIENCE", "AUTH0_RULE_NAMESPACE", mode="before")
     def validate_auth0_settings(cls, v: str, info: ValidationInfo) -> str:
@@ -99,6 +181,33 @@ class Settings(BaseSettings):
             raise ValueError(f"{field_name} must be set when AUTH_ENABLED is True")
         return v
 
+    @field_validator("ENTITY_HASH_ALGORITHM")
+    def validate_entity_hash_algorithm(cls, v: str) -> str:
+        """Check that the entity hash algorithm is known and its package is installed.
+
+        Args:
+        ----
+            v (str): The value of the ENTITY_HASH_ALGORITHM setting.
+
+        Returns:
+        -------
+            str: The validated algorithm name.
+
+        Raises:
+        ------
+            ValueError: If the algorithm is unknown, or is xxh3_128 without xxhash installed.
+        """
+        if v not in ENTITY_HASH_ALGORITHMS:
+            raise ValueError(
+                f"ENTITY_HASH_ALGORITHM must be one of {ENTITY_HASH_ALGORITHMS}, got {v!r}"
+            )
+        if v == "xxh3_128" and importlib.util.find_spec("xxhash") is None:
+            raise ValueError(
+                "ENTITY_HASH_ALGORITHM xxh3_128 requires the xxhash package, "
+                "install it with `poetry install --extras xxhash`"
+            )
+        return v
+
     @field_validator("SQLALCHEMY_ASYNC_DATABASE_URI", mode="before")
     def assemble_db_connection(cls, v: Optional[str], info: ValidationInfo) -> PostgresDsn:
         """Build the SQLAlchemy database URI.
@@ -70,6 +70,42 @@ class TokenRefreshError(Exception):
         super().__init__(self.message)
 
 
+class CursorExpiredError(Exception):
+    """Exception raised when a source can no longer read changes from a stored cursor."""
+
+    def __init__(self, message: Optional[str] = "Change cursor expired"):
+        """Create a new CursorExpiredError instance.
+
+        Args:
+        ----
+            message (str, optional): The error message. Has default message.
+
+        """
+        self.message = message
+        super().__init__(self.message)
+
+
+class EmbeddingError(Exception):
+    """Exception raised when some texts could not be embedded."""
+
+    def __init__(self, failures: dict[int, Exception], total: int):
+        """Create a new EmbeddingError instance.
+
+        Args:
+        ----
+            failures (dict[int, Exception]): The error of every failed text, by its index.
+            total (int): The number of texts that were embedded.
+
+        """
+        self.failures = failures
+        details = "; ".join(
+            f"text {i}: {type(e).__name__}: {e}" for i, e in list(failures.items())[:5]
+        )
+        more = f" (and {len(failures) - 5} more)" if len(failures) > 5 else ""
+        self.message = f"Could not embed {len(failures)} of {total} texts, {details}{more}"
+        super().__init__(self.message)
+
+
 def unpack_validation_error(exc: ValidationError) -> dict:
     """Unpack a Pydantic validation error into a dictionary.
 
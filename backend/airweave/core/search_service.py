@@ -8,7 +8,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from airweave import crud, schemas
 from airweave.core.config import settings
 from airweave.core.exceptions import NotFoundException
+from airweave.platform.embedding_models._base import BaseEmbeddingModel
+from airweave.platform.embedding_models.cache import embedding_cache
 from airweave.platform.embedding_models.local_text2vec import LocalText2Vec
+from airweave.platform.embedding_models.onnx_text2vec import OnnxText2Vec
 from airweave.platform.embedding_models.openai_text2vec import OpenAIText2Vec
 from airweave.platform.locator import resource_locator
 
@@ -87,15 +90,12 @@ class SearchService:
             # Initialize destination class
             destination_class = resource_locator.get_destination(destination_model)
 
-            # Use OpenAI embeddings if API key is available
-            if settings.OPENAI_API_KEY:
-                logger.info(f"Using OpenAI embedding model for search in sync {sync_id}")
-                embedding_model = OpenAIText2Vec(api_key=settings.OPENAI_API_KEY)
-            else:
-                logger.info(f"Using local embedding model for search in sync {sync_id}")
-                embedding_model = LocalText2Vec()
+            embedding_model = self._get_embedding_model(sync_id)
 
-            vector = await embedding_model.embed(query)
+            # Repeated queries reuse their cached vector
+            (vector,) = await embedding_cache.embed_many(
+                embedding_model, [query], embedding_model.embed_many
+            )
             destination = await destination_class.create(sync_id=sync_id)
 
             # Perform search
@@ -107,6 +107,19 @@ class SearchService:
             logger.error(f"Search error: {str(e)}")
             raise
 
+    @staticmethod
+    def _get_embedding_model(sync_id: UUID) -> BaseEmbeddingModel:
+        """Get the embedding model syncs embed with, so queries match their vectors."""
+        # Use OpenAI embeddings if API key is available
+        if settings.OPENAI_API_KEY:
+            logger.info(f"Using OpenAI embedding model for search in sync {sync_id}")
+            return OpenAIText2Vec(api_key=settings.OPENAI_API_KEY)
+        if settings.ONNX_EMBEDDING_MODEL_DIR:
+            logger.info(f"Using in-process ONNX embedding model for search in sync {sync_id}")
+            return OnnxText2Vec()
+        logger.info(f"Using local embedding model for search in sync {sync_id}")
+        return LocalText2Vec()
+
 
 # Create singleton instance
 search_service = SearchService()
@@ -57,6 +57,30 @@ class SyncJobService:
         except Exception as e:
             logger.error(f"Failed to update sync job status: {e}")
 
+    async def update_checkpoint(
+        self,
+        sync_job_id: UUID,
+        checkpoint: dict,
+        current_user: schemas.User,
+    ) -> None:
+        """Persist the latest durable checkpoint of a sync job.
+
+        Unlike status updates, errors are raised: a checkpoint that silently failed to save
+        would make a resumed job start from an older position than expected.
+        """
+        async with get_db_context() as db:
+            db_sync_job = await crud.sync_job.get(db=db, id=sync_job_id)
+            if not db_sync_job:
+                logger.error(f"Sync job {sync_job_id} not found")
+                return
+
+            await crud.sync_job.update(
+                db=db,
+                db_obj=db_sync_job,
+                obj_in=schemas.SyncJobUpdate(checkpoint=checkpoint),
+                current_user=current_user,
+            )
+
 
 # Singleton instance
 sync_job_service = SyncJobService()
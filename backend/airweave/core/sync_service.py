@@ -1,6 +1,7 @@
 """Service for data synchronization."""
 
 from datetime import datetime
+from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,7 +12,11 @@ from airweave.core.shared_models import SyncJobStatus
 from airweave.core.sync_job_service import sync_job_service
 from airweave.db.session import get_db_context
 from airweave.db.unit_of_work import UnitOfWork
+from airweave.platform.embedding_models.cache import embedding_cache
+from airweave.platform.embedding_models.openai_client import openai_embedding_clients
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sync.context import SyncContextFactory
+from airweave.platform.sync.dry_run import DryRun
 from airweave.platform.sync.orchestrator import sync_orchestrator
 
 
@@ -55,15 +60,21 @@ class SyncService:
         sync_job: schemas.SyncJob,
         dag: schemas.SyncDag,
         current_user: schemas.User,
+        dry_run: Optional[DryRun] = None,
     ) -> schemas.Sync:
         """Run a sync.
 
+        With a dry run, the sync runs without writing to its destinations or keeping any
+        database writes, and its throughput report is available from `dry_run.report()`
+        afterwards.
+
         Args:
         ----
             sync (schemas.Sync): The sync to run.
             sync_job (schemas.SyncJob): The sync job to run.
             dag (schemas.SyncDag): The DAG to run.
             current_user (schemas.User): The current user.
+            dry_run (Optional[DryRun]): The dry run to run the sync as, if any.
 
         Returns:
         -------
@@ -72,9 +83,23 @@ class SyncService:
         try:
             async with get_db_context() as db:
                 sync_context = await SyncContextFactory.create(
-                    db, sync, sync_job, dag, current_user
+                    db, sync, sync_job, dag, current_user, dry_run=dry_run
+                )
+            result = await sync_orchestrator.run(sync_context)
+            logger.info(f"HTTP client usage after sync {sync.id}: {http_clients.stats()}")
+            stats = embedding_cache.stats
+            logger.info(
+                f"Embedding cache after sync {sync.id}: {stats.hits} hits, {stats.misses} "
+                f"misses, hit rate {stats.hit_rate:.1%}"
+            )
+            if openai_embedding_clients.stats():
+                logger.info(
+                    f"OpenAI embedding usage after sync {sync.id}: "
+                    f"{openai_embedding_clients.stats()}"
                 )
-            return await sync_orchestrator.run(sync_context)
+            if dry_run:
+                logger.info(f"Dry run of sync {sync.id}: {dry_run.report().model_dump()}")
+            return result
         except Exception as e:
             logger.error(f"Error during sync: {e}")
             # Update status using sync_job_service
@@ -1,16 +1,30 @@
 """CRUD operations for entities."""
 
 from datetime import datetime
-from typing import Optional
+from typing import AsyncGenerator, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.crud._base_organization import CRUDBaseOrganization
+from airweave.db.unit_of_work import UnitOfWork
 from airweave.models.entity import Entity
 from airweave.schemas.entity import EntityCreate, EntityUpdate
 
+# Columns written by the bulk upsert paths, in COPY order
+_UPSERT_COLUMNS = (
+    "id",
+    "organization_id",
+    "created_at",
+    "modified_at",
+    "sync_job_id",
+    "sync_id",
+    "entity_id",
+    "hash",
+)
+
 
 class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
     """CRUD operations for entities."""
@@ -26,6 +40,142 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         result = await db.execute(stmt)
         return result.unique().scalars().one_or_none()
 
+    async def iter_hashes_by_sync_id(
+        self,
+        db: AsyncSession,
+        sync_id: UUID,
+        page_size: int = 10000,
+    ) -> AsyncGenerator[list[tuple[UUID, str, str]], None]:
+        """Stream (id, entity_id, hash) rows for a sync in pages.
+
+        Uses keyset pagination on the primary key, so each page is a cheap index range scan
+        and only one page is held in memory at a time.
+        """
+        last_id: Optional[UUID] = None
+        while True:
+            stmt = (
+                select(Entity.id, Entity.entity_id, Entity.hash)
+                .where(Entity.sync_id == sync_id)
+                .order_by(Entity.id)
+                .limit(page_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(Entity.id > last_id)
+            rows = (await db.execute(stmt)).tuples().all()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
+
+    async def bulk_upsert(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: dict[UUID, EntityCreate],
+        organization_id: UUID,
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Insert or update a batch of entities with a single statement.
+
+        Rows are keyed by a client-assigned primary key. Rows that already exist for the same
+        (sync_id, entity_id) keep their primary key and get their hash and sync job updated.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            objs_in (dict[UUID, EntityCreate]): The entities to write, keyed by primary key.
+            organization_id (UUID): The UUID of the organization.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+        """
+        if not objs_in:
+            return
+
+        stmt = insert(Entity).values(self._to_rows(objs_in, organization_id))
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_sync_id_entity_id",
+            set_={
+                "hash": stmt.excluded.hash,
+                "sync_job_id": stmt.excluded.sync_job_id,
+                "modified_at": stmt.excluded.modified_at,
+            },
+        )
+        await db.execute(stmt)
+        if not uow:
+            await db.commit()
+
+    async def bulk_upsert_copy(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: dict[UUID, EntityCreate],
+        organization_id: UUID,
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Insert or update a large batch of entities through COPY into a staging table.
+
+        Same semantics as `bulk_upsert`, but rows are streamed with the binary COPY protocol,
+        which is much cheaper than a parameterized INSERT for tens of thousands of rows.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            objs_in (dict[UUID, EntityCreate]): The entities to write, keyed by primary key.
+            organization_id (UUID): The UUID of the organization.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+        """
+        if not objs_in:
+            return
+
+        columns = list(_UPSERT_COLUMNS)
+        rows = self._to_rows(objs_in, organization_id)
+
+        # The staging table lives for the connection and is emptied on every commit, and
+        # before every use, since a unit of work may upsert twice in one transaction
+        await db.execute(
+            text(
+                "CREATE TEMP TABLE IF NOT EXISTS entity_staging "
+                "(LIKE entity INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+            )
+        )
+        await db.execute(text("TRUNCATE entity_staging"))
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "entity_staging",
+            records=[tuple(row[column] for column in columns) for row in rows],
+            columns=columns,
+        )
+        column_list = ", ".join(columns)
+        await db.execute(
+            text(
+                f"INSERT INTO entity ({column_list}) "
+                f"SELECT {column_list} FROM entity_staging "
+                "ON CONFLICT ON CONSTRAINT uq_sync_id_entity_id DO UPDATE SET "
+                "hash = EXCLUDED.hash, "
+                "sync_job_id = EXCLUDED.sync_job_id, "
+                "modified_at = EXCLUDED.modified_at"
+            )
+        )
+        if not uow:
+            await db.commit()
+
+    @staticmethod
+    def _to_rows(objs_in: dict[UUID, EntityCreate], organization_id: UUID) -> list[dict]:
+        """Convert entities keyed by primary key to rows for a bulk insert."""
+        now = datetime.utcnow()
+        return [
+            {
+                "id": id,
+                "organization_id": organization_id,
+                "created_at": now,
+                "modified_at": now,
+                **obj_in.model_dump(),
+            }
+            for id, obj_in in objs_in.items()
+        ]
+
     async def update_job_id(
         self,
         db: AsyncSession,
@@ -41,6 +191,58 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
             db, db_obj=db_obj, obj_in=update_data.model_dump(exclude_unset=True)
         )
 
+    async def iter_outdated(
+        self,
+        db: AsyncSession,
+        sync_id: UUID,
+        sync_job_ids: list[UUID],
+        page_size: int = 1000,
+    ) -> AsyncGenerator[list[tuple[UUID, str]], None]:
+        """Stream (id, entity_id) rows of a sync that none of the given jobs saw, in pages.
+
+        Uses keyset pagination on the primary key, so rows of a page can be deleted before
+        the next page is fetched.
+        """
+        last_id: Optional[UUID] = None
+        while True:
+            stmt = (
+                select(Entity.id, Entity.entity_id)
+                .where(Entity.sync_id == sync_id, Entity.sync_job_id.not_in(sync_job_ids))
+                .order_by(Entity.id)
+                .limit(page_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(Entity.id > last_id)
+            rows = (await db.execute(stmt)).tuples().all()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
+
+    async def bulk_remove(
+        self,
+        db: AsyncSession,
+        *,
+        ids: list[UUID],
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Delete a batch of entities by primary key.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            ids (list[UUID]): The primary keys of the entities to delete.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+        """
+        if not ids:
+            return
+
+        await db.execute(delete(Entity).where(Entity.id.in_(ids)))
+        if not uow:
+            await db.commit()
+
     async def get_all_outdated(
         self,
         db: AsyncSession,
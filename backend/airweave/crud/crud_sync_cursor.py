@@ -0,0 +1,60 @@
+"""CRUD operations for sync cursors."""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave.crud._base_organization import CRUDBaseOrganization
+from airweave.db.unit_of_work import UnitOfWork
+from airweave.models.sync_cursor import SyncCursor
+from airweave.schemas.sync_cursor import SyncCursorCreate, SyncCursorUpdate
+
+
+class CRUDSyncCursor(CRUDBaseOrganization[SyncCursor, SyncCursorCreate, SyncCursorUpdate]):
+    """CRUD operations for sync cursors."""
+
+    async def get_by_sync_id(self, db: AsyncSession, sync_id: UUID) -> Optional[SyncCursor]:
+        """Get the cursor of a sync, if it has one."""
+        stmt = select(SyncCursor).where(SyncCursor.sync_id == sync_id)
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def upsert(
+        self,
+        db: AsyncSession,
+        *,
+        obj_in: SyncCursorCreate,
+        organization_id: UUID,
+        uow: Optional[UnitOfWork] = None,
+    ) -> None:
+        """Create the cursor of a sync, or replace it if the sync already has one.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            obj_in (SyncCursorCreate): The cursor to store.
+            organization_id (UUID): The UUID of the organization.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+        """
+        now = datetime.utcnow()
+        stmt = insert(SyncCursor).values(
+            id=uuid4(),
+            organization_id=organization_id,
+            created_at=now,
+            modified_at=now,
+            **obj_in.model_dump(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SyncCursor.sync_id],
+            set_={"cursor_data": stmt.excluded.cursor_data, "modified_at": now},
+        )
+        await db.execute(stmt)
+        if not uow:
+            await db.commit()
+
+
+sync_cursor = CRUDSyncCursor(SyncCursor)
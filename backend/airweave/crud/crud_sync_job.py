@@ -1,5 +1,6 @@
 """CRUD operations for sync jobs."""
 
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy import select
@@ -75,8 +76,9 @@ class CRUDSyncJob(CRUDBase[SyncJob, SyncJobCreate, SyncJobUpdate]):
         self,
         db: AsyncSession,
         sync_id: UUID,
+        exclude_id: Optional[UUID] = None,
     ) -> SyncJob | None:
-        """Get the most recent job for a specific sync."""
+        """Get the most recent job for a specific sync, optionally ignoring one job."""
         stmt = (
             select(SyncJob, Sync.name.label("sync_name"))
             .join(Sync, SyncJob.sync_id == Sync.id)
@@ -84,6 +86,8 @@ class CRUDSyncJob(CRUDBase[SyncJob, SyncJobCreate, SyncJobUpdate]):
             .order_by(SyncJob.created_at.desc())
             .limit(1)
         )
+        if exclude_id is not None:
+            stmt = stmt.where(SyncJob.id != exclude_id)
         result = await db.execute(stmt)
         row = result.first()
         if not row:
@@ -24,7 +24,10 @@ from airweave.core.logging import logger
 from airweave.db.init_db import init_db
 from airweave.db.session import AsyncSessionLocal
 from airweave.platform.db_sync import sync_platform_components
+from airweave.platform.embedding_models.onnx_text2vec import onnx_engines
 from airweave.platform.entities._base import ensure_file_entity_models
+from airweave.platform.file_handling.conversion.process_pool import conversion_pool
+from airweave.platform.http_clients import http_clients
 from airweave.platform.scheduler import platform_scheduler
 
 
@@ -50,6 +53,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     # Stop the sync scheduler
     await platform_scheduler.stop()
+    # Close the pooled HTTP clients of sources and downloads
+    await http_clients.aclose()
+    # Stop the document conversion workers
+    conversion_pool.close()
+    # Stop the threads of the in-process embedding models
+    onnx_engines.close()
 
 
 app = FastAPI(title=settings.PROJECT_NAME, openapi_url="/openapi.json", lifespan=lifespan)
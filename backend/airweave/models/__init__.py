@@ -14,6 +14,7 @@ from .organization import Organization
 from .source import Source
 from .sync import Sync
 from .sync_connection import SyncConnection
+from .sync_cursor import SyncCursor
 from .sync_job import SyncJob
 from .transformer import Transformer
 from .user import User
@@ -36,6 +37,7 @@ __all__ = [
     "Source",
     "Sync",
     "SyncConnection",
+    "SyncCursor",
     "SyncDag",
     "SyncJob",
     "Transformer",
@@ -0,0 +1,34 @@
+"""Sync cursor model."""
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import JSON, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from airweave.models._base import OrganizationBase
+
+if TYPE_CHECKING:
+    from airweave.models.sync import Sync
+
+
+class SyncCursor(OrganizationBase):
+    """Sync cursor model.
+
+    Holds the position in the change feed of a sync's source, so the next run only reads
+    what changed since.
+    """
+
+    __tablename__ = "sync_cursor"
+
+    sync_id: Mapped[UUID] = mapped_column(
+        ForeignKey("sync.id", ondelete="CASCADE", name="fk_sync_cursor_sync_id"),
+        nullable=False,
+        unique=True,
+    )
+    cursor_data: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    sync: Mapped["Sync"] = relationship(
+        "Sync",
+        lazy="noload",
+    )
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String
 from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -35,6 +35,8 @@ class SyncJob(OrganizationBase, UserMixin):
     entities_deleted: Mapped[int] = mapped_column(Integer, default=0)
     entities_skipped: Mapped[int] = mapped_column(Integer, default=0)
     error: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    # Last durable source position and progress, to resume the sync from if this job fails
+    checkpoint: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
     sync: Mapped["Sync"] = relationship(
         "Sync",
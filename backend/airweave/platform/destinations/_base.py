@@ -50,6 +50,11 @@ class BaseDestination(ABC):
         """Bulk delete entities from the destination by parent ID and entity ID."""
         pass
 
+    @abstractmethod
+    async def bulk_delete_by_parent_ids(self, parent_ids: list[str], sync_id: UUID) -> None:
+        """Bulk delete entities from the destination for a batch of parent IDs."""
+        pass
+
     @abstractmethod
     async def search(self, query_vector: list[float]) -> None:
         """Search for a sync_id in the destination."""
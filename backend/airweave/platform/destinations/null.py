@@ -0,0 +1,69 @@
+"""Null destination, used by dry runs."""
+
+import json
+from uuid import UUID
+
+from airweave import schemas
+from airweave.platform.destinations._base import VectorDBDestination
+from airweave.platform.entities._base import ChunkEntity
+
+
+class NullDestination(VectorDBDestination):
+    """Destination that discards everything written to it.
+
+    Counts what it receives, so a dry run can report how much data a real destination
+    would have been sent. Not registered as an integration: it is only wired in by dry runs.
+    """
+
+    def __init__(self):
+        """Initialize the destination."""
+        self.sync_id: UUID | None = None
+        self.entities_written = 0
+        self.bytes_written = 0
+        self.parents_deleted = 0
+
+    @classmethod
+    async def create(cls, sync_id: UUID) -> "NullDestination":
+        """Create a new null destination."""
+        instance = cls()
+        instance.sync_id = sync_id
+        return instance
+
+    async def setup_collection(self, sync_id: UUID) -> None:
+        """There is no collection to set up."""
+        pass
+
+    async def insert(self, entity: ChunkEntity) -> None:
+        """Count a single entity."""
+        await self.bulk_insert([entity])
+
+    async def bulk_insert(self, entities: list[ChunkEntity]) -> None:
+        """Count the entities and the size of the payloads a vector store would receive."""
+        for entity in entities:
+            self.entities_written += 1
+            self.bytes_written += len(json.dumps(entity.to_storage_dict(), default=str))
+
+    async def delete(self, db_entity_id: UUID) -> None:
+        """There is nothing to delete."""
+        pass
+
+    async def bulk_delete(self, entity_ids: list[str]) -> None:
+        """There is nothing to delete."""
+        pass
+
+    async def bulk_delete_by_parent_id(self, parent_id: str, sync_id: UUID) -> None:
+        """Count a deleted parent."""
+        self.parents_deleted += 1
+
+    async def bulk_delete_by_parent_ids(self, parent_ids: list[str], sync_id: UUID) -> None:
+        """Count the deleted parents."""
+        self.parents_deleted += len(parent_ids)
+
+    async def search(self, query_vector: list[float]) -> list[dict]:
+        """Nothing is stored, so nothing is found."""
+        return []
+
+    @classmethod
+    async def get_credentials(cls, user: schemas.User = None) -> None:
+        """The destination needs no credentials."""
+        return None
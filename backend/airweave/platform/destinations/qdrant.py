@@ -325,6 +325,34 @@ class QdrantDestination(VectorDBDestination):
             # Fallback to a different approach if needed
             raise
 
+    async def bulk_delete_by_parent_ids(self, parent_ids: list[str], sync_id: UUID) -> None:
+        """Bulk delete entities from Qdrant for a batch of parent IDs in a single request.
+
+        Args:
+            parent_ids (list[str]): The parent IDs to delete children for.
+            sync_id (UUID): The sync ID.
+        """
+        if not parent_ids:
+            return
+
+        await self.ensure_client_readiness()
+
+        qdrant_filter = rest.Filter(
+            must=[
+                rest.FieldCondition(
+                    key="parent_entity_id",
+                    match=rest.MatchAny(any=[str(parent_id) for parent_id in parent_ids]),
+                ),
+                rest.FieldCondition(key="sync_id", match=rest.MatchValue(value=str(sync_id))),
+            ]
+        )
+
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=rest.FilterSelector(filter=qdrant_filter),
+            wait=True,  # Wait for operation to complete
+        )
+
     async def search(self, query_vector: list[float]) -> list[dict]:
         """Search for a sync_id in the destination.
 
@@ -1,7 +1,7 @@
 """Base class for embedding models."""
 
 from abc import abstractmethod
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from pydantic import BaseModel
 
@@ -13,6 +13,12 @@ class BaseEmbeddingModel(BaseModel):
     that can be used with different vector stores.
     """
 
+    # Limits of a single embed_many request, used to batch the texts of concurrent callers
+    MAX_BATCH_ITEMS: ClassVar[int] = 256
+    MAX_BATCH_TOKENS: ClassVar[int] = 100_000
+    # Whether vectors of the model are worth caching
+    CACHEABLE: ClassVar[bool] = True
+
     model_name: str
     vector_dimensions: int
     enabled: bool = True
@@ -22,6 +28,10 @@ class BaseEmbeddingModel(BaseModel):
         """Create an instance of the embedding model."""
         return cls(**kwargs)
 
+    def cache_namespace(self) -> str:
+        """Identify the vectors of the model, so cached vectors are only reused by it."""
+        return f"{self.model_name}:{self.vector_dimensions}"
+
     @abstractmethod
     async def embed(
         self,
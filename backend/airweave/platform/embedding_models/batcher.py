@@ -0,0 +1,188 @@
+"""Coalescing of concurrent embedding requests into provider-sized batches."""
+
+import asyncio
+import weakref
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from airweave.core.logging import logger
+
+from ._base import BaseEmbeddingModel
+
+# How long a text waits for others to share its request with
+DEFAULT_LINGER = 0.02  # seconds
+# Number of batches embedded at the same time, per model
+DEFAULT_MAX_CONCURRENCY = 4
+
+# A pending text: (text, estimated tokens, id of the embed_many call, future of its vector)
+_PendingText = Tuple[str, int, int, asyncio.Future]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens of a text, on the high side.
+
+    A token is about four characters of English, and at least one byte of UTF-8, so a third
+    of the bytes overestimates English and stays safe for other scripts.
+    """
+    return len(text.encode()) // 3 + 1
+
+
+class EmbeddingBatcher:
+    """Embeds the texts of concurrent callers of a model in shared batches.
+
+    Texts are held for a short linger window, so the texts of concurrent callers end up in
+    one request. A batch is sent once the window ends, or as soon as it reaches the model's
+    item or token limit. Each caller gets its vectors in the order of its texts.
+
+    If a batch with the texts of several callers fails, every caller's texts are embedded
+    again on their own, so an error only reaches the caller that caused it.
+
+    Usage:
+    -----
+    ```python
+    vectors = await embedding_batchers.get(embedding_model).embed_many(texts)
+    ```
+    """
+
+    def __init__(
+        self,
+        model: BaseEmbeddingModel,
+        linger: float = DEFAULT_LINGER,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            model: The model to embed with, its class sets the batch limits
+            linger: Time a text waits for other texts to share its batch, in seconds
+            max_concurrency: Maximum number of batches embedded at the same time
+        """
+        self.model = model
+        self.linger = linger
+        self.max_items = model.MAX_BATCH_ITEMS
+        self.max_tokens = model.MAX_BATCH_TOKENS
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._pending: Deque[_PendingText] = deque()
+        self._pending_tokens = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._calls = 0
+        self._batches: set[asyncio.Task] = set()
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, sharing requests with concurrent callers.
+
+        Args:
+            texts: The texts to embed
+
+        Returns:
+            The vectors of the texts, in order
+        """
+        if not texts:
+            return []
+        self._calls += 1
+        futures = [self._submit(text, self._calls) for text in texts]
+        return list(await asyncio.gather(*futures))
+
+    def _submit(self, text: str, call_id: int) -> asyncio.Future:
+        """Queue a text, and send the pending texts if they fill a batch."""
+        future = asyncio.get_running_loop().create_future()
+        tokens = estimate_tokens(text)
+        self._pending.append((text, tokens, call_id, future))
+        self._pending_tokens += tokens
+
+        if len(self._pending) >= self.max_items or self._pending_tokens >= self.max_tokens:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.linger, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Send all pending texts, split into batches within the limits."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._pending:
+            batch: List[_PendingText] = []
+            batch_tokens = 0
+            while self._pending and len(batch) < self.max_items:
+                tokens = self._pending[0][1]
+                # A single text over the limit still goes out, alone
+                if batch and batch_tokens + tokens > self.max_tokens:
+                    break
+                batch.append(self._pending.popleft())
+                batch_tokens += tokens
+            self._pending_tokens -= batch_tokens
+
+            task = asyncio.create_task(self._embed_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _embed_batch(self, batch: List[_PendingText]) -> None:
+        """Embed a batch and resolve the futures of its texts."""
+        try:
+            await self._embed(batch)
+        finally:
+            # Never leave a caller waiting, e.g. when the batch was cancelled
+            for *_, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _embed(self, batch: List[_PendingText]) -> None:
+        """Embed a batch, splitting it by caller if it fails."""
+        try:
+            async with self._slots:
+                vectors = await self.model.embed_many([text for text, *_ in batch])
+            if len(vectors) != len(batch):
+                raise ValueError(f"Got {len(vectors)} vectors for {len(batch)} texts")
+        except Exception as e:
+            call_ids = {call_id for _, _, call_id, _ in batch}
+            if len(call_ids) == 1:
+                self._fail(batch, e)
+                return
+            logger.warning(f"Embedding batch of {len(call_ids)} calls failed ({e}), splitting")
+            await asyncio.gather(
+                *(
+                    self._embed([item for item in batch if item[2] == call_id])
+                    for call_id in call_ids
+                )
+            )
+            return
+
+        for (*_, future), vector in zip(batch, vectors, strict=True):
+            if not future.done():
+                future.set_result(vector)
+
+    @staticmethod
+    def _fail(batch: List[_PendingText], error: Exception) -> None:
+        """Fail the futures of a batch."""
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+
+class EmbeddingBatcherRegistry:
+    """Shares one batcher between all syncs using the same embedding model configuration.
+
+    Models with different configurations, e.g. different API keys, never share batches.
+    Batchers are bound to the event loop that created them, so every loop gets its own.
+    """
+
+    def __init__(self):
+        """Initialize the registry."""
+        self._batchers: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[Tuple[type, str], EmbeddingBatcher]
+        ] = weakref.WeakKeyDictionary()
+
+    def get(self, model: BaseEmbeddingModel) -> EmbeddingBatcher:
+        """Get the batcher of a model's configuration, creating it on first use."""
+        batchers = self._batchers.setdefault(asyncio.get_running_loop(), {})
+        key = (type(model), model.model_dump_json())
+        batcher = batchers.get(key)
+        if batcher is None:
+            batcher = batchers[key] = EmbeddingBatcher(model)
+        return batcher
+
+
+# Global instance
+embedding_batchers = EmbeddingBatcherRegistry()
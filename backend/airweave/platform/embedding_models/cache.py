@@ -0,0 +1,220 @@
+"""Persistent cache of embeddings, keyed by model and text."""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+
+from ._base import BaseEmbeddingModel
+
+# Once over its size, the cache is evicted down to this fraction of it, so eviction does not
+# run on every write
+_EVICTION_TARGET = 0.9
+# Overhead of a row besides its vector, in bytes
+_ROW_OVERHEAD = 64
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Lookups of the embedding cache since the process started."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that were answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class EmbeddingCache:
+    """Caches embedding vectors in a local SQLite database, by model and text.
+
+    Unchanged chunks of an updated file, and boilerplate that recurs across entities and
+    syncs, are embedded once per model. Texts are keyed by a hash of their normalized form
+    and the model's cache namespace, which names the model and its dimensions.
+
+    Vectors are stored as float32, the precision vector stores keep them in. Zero vectors,
+    which models return for empty texts, are never cached. When the database outgrows its
+    size, the least recently used vectors are evicted. The database can be shared by
+    processes.
+
+    Usage:
+    -----
+    ```python
+    vectors = await embedding_cache.embed_many(model, texts, model.embed_many)
+    ```
+    """
+
+    def __init__(self, path: str, max_size: int):
+        """Initialize the cache. The database is opened on first use.
+
+        Args:
+            path: Path of the SQLite database
+            max_size: Maximum total size of the cached vectors in bytes, 0 to disable the
+                cache
+        """
+        self.path = path
+        self.max_size = max_size
+        self.stats = EmbeddingCacheStats()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._size = 0
+        # The connection is used from worker threads, one at a time
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether embeddings are cached."""
+        return self.max_size > 0
+
+    async def embed_many(
+        self,
+        model: BaseEmbeddingModel,
+        texts: List[str],
+        embed: Callable[[List[str]], Awaitable[List[List[float]]]],
+    ) -> List[List[float]]:
+        """Embed texts, computing only those that are not cached.
+
+        Args:
+            model: The model the texts are embedded with
+            texts: The texts to embed
+            embed: Function embedding texts with the model, for the texts not cached
+
+        Returns:
+            The vectors of the texts, in order
+        """
+        if not self.enabled or not model.CACHEABLE or not texts:
+            return await embed(texts)
+
+        namespace = model.cache_namespace()
+        keys = [self._key(namespace, text) for text in texts]
+        try:
+            cached = await asyncio.to_thread(self._get_many, keys)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache lookup failed, embedding all texts: {e}")
+            return await embed(texts)
+
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        self.stats.hits += len(texts) - len(missing)
+        self.stats.misses += len(missing)
+
+        vectors: Dict[bytes, List[float]] = dict(cached)
+        if missing:
+            computed = await embed([texts[i] for i in missing])
+            new = {keys[i]: vector for i, vector in zip(missing, computed, strict=True)}
+            vectors.update(new)
+            try:
+                await asyncio.to_thread(self._put_many, new)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not cache embeddings: {e}")
+
+        return [vectors[key] for key in keys]
+
+    @staticmethod
+    def _key(namespace: str, text: str) -> bytes:
+        """Key of the vector of a text."""
+        normalized = unicodedata.normalize("NFC", text).strip()
+        return hashlib.sha256(f"{namespace}\0{normalized}".encode()).digest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating it if needed."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            # Readers in other processes do not block writers, and the other way around
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key BLOB PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+            )
+            (size,) = conn.execute(
+                f"SELECT COALESCE(SUM(LENGTH(vector) + {_ROW_OVERHEAD}), 0) FROM embeddings"
+            ).fetchone()
+            self._conn, self._size = conn, size
+        return self._conn
+
+    def _get_many(self, keys: List[bytes]) -> Dict[bytes, List[float]]:
+        """Look up vectors, marking those found as recently used. Runs in a thread."""
+        unique_keys = list(set(keys))
+        found: Dict[bytes, List[float]] = {}
+        with self._lock:
+            conn = self._connect()
+            # SQLite limits the number of parameters of a statement
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                )
+                for key, vector in rows:
+                    found[key] = array("f", vector).tolist()
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                conn.commit()
+        return found
+
+    def _put_many(self, vectors: Dict[bytes, List[float]]) -> None:
+        """Store vectors, evicting the least recently used if over size. Runs in a thread."""
+        now = time.time()
+        rows = [
+            (key, array("f", vector).tobytes(), now)
+            for key, vector in vectors.items()
+            if any(vector)
+        ]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._size += sum(len(vector) + _ROW_OVERHEAD for _, vector, _ in rows)
+            if self._size > self.max_size:
+                self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete the least recently used vectors until the cache is well under its size."""
+        # Other processes sharing the database change its size too
+        (self._size,) = conn.execute(
+            f"SELECT COALESCE(SUM(LENGTH(vector) + {_ROW_OVERHEAD}), 0) FROM embeddings"
+        ).fetchone()
+        target = int(self.max_size * _EVICTION_TARGET)
+        evicted = 0
+        rows = conn.execute(
+            f"SELECT key, LENGTH(vector) + {_ROW_OVERHEAD} FROM embeddings ORDER BY last_used"
+        )
+        keys = []
+        for key, size in rows:
+            if self._size - evicted <= target:
+                break
+            keys.append((key,))
+            evicted += size
+        conn.executemany("DELETE FROM embeddings WHERE key = ?", keys)
+        self._size -= evicted
+        logger.info(f"Evicted {len(keys)} embeddings from the cache")
+
+
+# Global instance
+embedding_cache = EmbeddingCache(
+    path=settings.EMBEDDING_CACHE_PATH, max_size=settings.EMBEDDING_CACHE_SIZE
+)
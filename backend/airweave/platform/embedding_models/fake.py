@@ -0,0 +1,67 @@
+"""Fake embedding model, used by dry runs."""
+
+import hashlib
+import math
+import random
+from typing import ClassVar, List, Optional
+
+from ._base import BaseEmbeddingModel
+
+
+class FakeEmbeddingModel(BaseEmbeddingModel):
+    """Embedding model that derives vectors from a hash of the text.
+
+    Vectors are deterministic and unit length, with the dimensions of the model they stand in
+    for, so a dry run sends realistically sized vectors downstream without calling an
+    embedding service. Not registered as an integration: it is only wired in by dry runs.
+    """
+
+    # Faking a vector is cheaper than looking it up
+    CACHEABLE: ClassVar[bool] = False
+
+    model_name: str = "fake"
+    vector_dimensions: int = 384
+
+    async def embed(
+        self,
+        text: str,
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        dimensions: Optional[int] = None,
+    ) -> List[float]:
+        """Derive the vector of a single text.
+
+        Args:
+            text: The text to embed
+            model: Ignored
+            encoding_format: Ignored
+            dimensions: Vector dimensions (defaults to self.vector_dimensions)
+
+        Returns:
+            The vector of the text
+        """
+        seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+        rng = random.Random(seed)
+        vector = [rng.gauss(0.0, 1.0) for _ in range(dimensions or self.vector_dimensions)]
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    async def embed_many(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        dimensions: Optional[int] = None,
+    ) -> List[List[float]]:
+        """Derive the vectors of multiple texts.
+
+        Args:
+            texts: List of texts to embed
+            model: Ignored
+            encoding_format: Ignored
+            dimensions: Vector dimensions (defaults to self.vector_dimensions)
+
+        Returns:
+            The vectors of the texts, in order
+        """
+        return [await self.embed(text, dimensions=dimensions) for text in texts]
@@ -1,16 +1,30 @@
 """Local text2vec model for embedding."""
 
-from typing import List, Optional
+import asyncio
+from typing import Any, List, Optional
 
 import httpx
 from pydantic import Field
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from airweave.core.config import settings
+from airweave.core.exceptions import EmbeddingError
 from airweave.core.logging import logger
 from airweave.platform.decorators import embedding_model
+from airweave.platform.http_clients import http_clients
 
 from ._base import BaseEmbeddingModel
 
+# Responses of the inference service worth retrying
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Whether a failed request to the inference service is worth sending again."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
 
 @embedding_model(
     "Local Text2Vec",
@@ -24,16 +38,24 @@ class LocalText2Vec(BaseEmbeddingModel):
 
     model_name: str = "local-text2vec-transformers"
     inference_url: str = Field(default="", description="URL of the inference API")
+    batch_size: int = Field(
+        default=0, description="Texts per request to the batch endpoint, 0 to send texts one by one"
+    )
+    max_concurrency: int = Field(
+        default=8, description="Maximum number of concurrent requests per embed_many call"
+    )
     vector_dimensions: int = 384  # MiniLM-L6-v2 dimensions
     enabled: bool = True
 
     def model_post_init(self, __context) -> None:
-        """Post initialization hook to set the inference URL from settings.
+        """Post initialization hook to set the inference URL and request limits from settings.
 
         This runs after Pydantic validation but before the model is used.
         """
         super().model_post_init(__context)
         self.inference_url = settings.TEXT2VEC_INFERENCE_URL
+        self.batch_size = settings.TEXT2VEC_BATCH_SIZE
+        self.max_concurrency = settings.TEXT2VEC_MAX_CONCURRENCY
         logger.info(f"Text2Vec model using inference URL: {self.inference_url}")
 
     async def embed(
@@ -64,10 +86,8 @@ class LocalText2Vec(BaseEmbeddingModel):
             # Return zero vector for empty text
             return [0.0] * self.vector_dimensions
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f"{self.inference_url}/vectors", json={"text": text})
-            response.raise_for_status()
-            return response.json()["vector"]
+        (vector,) = await self.embed_many([text])
+        return vector
 
     async def embed_many(
         self,
@@ -96,25 +116,58 @@ class LocalText2Vec(BaseEmbeddingModel):
         if dimensions:
             raise ValueError("Dimensions override not supported for local text2vec")
 
-        # Create result list with same order as input
-        result = []
-
-        # Process each text individually since batch endpoint isn't available
-        async with httpx.AsyncClient() as client:
-            for text in texts:
-                if text.strip():
-                    try:
-                        response = await client.post(
-                            f"{self.inference_url}/vectors/", json={"text": text}
-                        )
-                        response.raise_for_status()
-                        result.append(response.json()["vector"])
-                    except Exception as e:
-                        logger.error(f"Error embedding text: {e}")
-                        # Return zero vector for failed embedding
-                        result.append([0.0] * self.vector_dimensions)
-                else:
-                    # Return zero vector for empty text
-                    result.append([0.0] * self.vector_dimensions)
-
+        # Empty texts get a zero vector, the others are sent in groups of one or a batch
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+        size = max(self.batch_size, 1)
+        groups = [indices[start : start + size] for start in range(0, len(indices), size)]
+        client = http_clients.get(self.inference_url)
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed_group(group: List[int]) -> List[List[float]]:
+            async with slots:
+                return await self._embed_group(client, [texts[i] for i in group])
+
+        outcomes = await asyncio.gather(
+            *(embed_group(group) for group in groups), return_exceptions=True
+        )
+
+        result = [[0.0] * self.vector_dimensions for _ in texts]
+        failures = {}
+        for group, outcome in zip(groups, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                failures.update({i: outcome for i in group})
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                for i, vector in zip(group, outcome, strict=True):
+                    result[i] = vector
+
+        if failures:
+            # Zero vectors would be indexed as if they were real, so fail instead
+            error = EmbeddingError(failures, len(texts))
+            logger.error(f"Text2Vec embedding failed: {error}")
+            raise error
         return result
+
+    async def _embed_group(self, client: httpx.AsyncClient, texts: List[str]) -> List[List[float]]:
+        """Embed a group of texts in one request: the batch endpoint, or a single text."""
+        if self.batch_size <= 0:
+            (text,) = texts
+            return [(await self._post(client, "/vectors/", {"text": text}))["vector"]]
+
+        vectors = await self._post(client, "/embed", {"inputs": texts})
+        if len(vectors) != len(texts):
+            raise ValueError(f"Got {len(vectors)} vectors for {len(texts)} texts")
+        return vectors
+
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        reraise=True,
+    )
+    async def _post(self, client: httpx.AsyncClient, path: str, payload: dict) -> Any:
+        """Send a request to the inference service, retrying transient failures."""
+        response = await client.post(f"{self.inference_url}{path}", json=payload)
+        response.raise_for_status()
+        return response.json()
@@ -0,0 +1,283 @@
+"""In-process text2vec model, run with ONNX Runtime on CPU."""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import Field
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.decorators import embedding_model
+
+from ._base import BaseEmbeddingModel
+
+try:
+    import numpy as np
+except ImportError:  # Optional, only needed for the ONNX embedding model
+    np = None
+
+try:
+    import onnxruntime as ort
+    from tokenizers import Tokenizer
+except ImportError:  # Optional, only needed for the ONNX embedding model
+    ort = None
+    Tokenizer = None
+
+# MiniLM models are trained on sequences of up to 256 tokens, longer texts are truncated
+MAX_SEQUENCE_LENGTH = 256
+
+
+class OnnxEmbeddingEngine:
+    """Runs a sentence embedding model with ONNX Runtime, on a dedicated thread pool.
+
+    ONNX Runtime releases the GIL during inference, so batches run in parallel on the pool's
+    threads while the event loop stays responsive. Texts are sorted by length before they
+    are split into batches, so every batch is padded to the length of similar texts only.
+    Token embeddings are mean pooled over the attention mask and normalized, like
+    sentence-transformers does.
+    """
+
+    def __init__(self, session: Any, tokenizer: Any, workers: int = 1, batch_size: int = 32):
+        """Initialize the engine.
+
+        Args:
+            session: ONNX Runtime inference session of the model
+            tokenizer: Tokenizer of the model, padding batches to their longest text
+            workers: Number of batches run at the same time
+            batch_size: Maximum number of texts per inference batch
+        """
+        self.session = session
+        self.tokenizer = tokenizer
+        self.batch_size = batch_size
+        self._input_names = {model_input.name for model_input in session.get_inputs()}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="onnx-embed")
+
+    @classmethod
+    def load(
+        cls, model_dir: str, quantized: bool, workers: int, threads: int, batch_size: int
+    ) -> "OnnxEmbeddingEngine":
+        """Load a model exported to ONNX, with its tokenizer.
+
+        Args:
+            model_dir: Directory with model.onnx, model_quantized.onnx and tokenizer.json
+            quantized: Whether to load the int8 quantized weights
+            workers: Number of batches run at the same time
+            threads: Threads per batch, 0 to share the CPU cores between the workers
+            batch_size: Maximum number of texts per inference batch
+
+        Returns:
+            The engine
+        """
+        if np is None or ort is None or Tokenizer is None:
+            raise ImportError(
+                "The ONNX embedding model requires the onnxruntime, tokenizers and numpy "
+                "packages, installed with the onnx extra"
+            )
+
+        # Oversubscribing the cores makes every batch slower
+        threads = threads or max(1, (os.cpu_count() or 1) // workers)
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        model_path = os.path.join(model_dir, "model_quantized.onnx" if quantized else "model.onnx")
+        session = ort.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+
+        tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        tokenizer.enable_truncation(max_length=MAX_SEQUENCE_LENGTH)
+        tokenizer.enable_padding(pad_id=tokenizer.token_to_id("[PAD]") or 0, pad_token="[PAD]")
+
+        logger.info(
+            f"Loaded ONNX embedding model {model_path} with {workers} workers of {threads} threads"
+        )
+        return cls(session, tokenizer, workers=workers, batch_size=batch_size)
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in batches on the engine's threads.
+
+        Args:
+            texts: The texts to embed
+
+        Returns:
+            The vectors of the texts, in order
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        batches = [
+            order[start : start + self.batch_size]
+            for start in range(0, len(order), self.batch_size)
+        ]
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, self._run, [texts[i] for i in batch])
+                for batch in batches
+            )
+        )
+
+        vectors: List[List[float]] = [[] for _ in texts]
+        for batch, batch_vectors in zip(batches, results, strict=True):
+            for i, vector in zip(batch, batch_vectors, strict=True):
+                vectors[i] = vector
+        return vectors
+
+    def close(self) -> None:
+        """Stop the engine's threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts. Runs in a thread of the engine."""
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([encoding.ids for encoding in encodings], dtype=np.int64)
+        attention_mask = np.array(
+            [encoding.attention_mask for encoding in encodings], dtype=np.int64
+        )
+        inputs = {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+            "token_type_ids": np.zeros_like(input_ids),
+        }
+        # Exports differ in whether they take token type ids
+        inputs = {name: value for name, value in inputs.items() if name in self._input_names}
+        token_embeddings = self.session.run(None, inputs)[0]
+
+        mask = attention_mask[..., None].astype(token_embeddings.dtype)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.clip(norms, 1e-12, None)).tolist()
+
+
+class OnnxEmbeddingEngineRegistry:
+    """Loads every ONNX model once per process, and shares it between all its users."""
+
+    def __init__(self):
+        """Initialize the registry."""
+        self._engines: Dict[Tuple[str, bool], OnnxEmbeddingEngine] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, model_dir: str, quantized: bool) -> OnnxEmbeddingEngine:
+        """Get the engine of a model, loading it on first use."""
+        engine = self._engines.get((model_dir, quantized))
+        if engine is None:
+            engine = await asyncio.to_thread(self._load, model_dir, quantized)
+        return engine
+
+    def close(self) -> None:
+        """Stop the threads of all engines."""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.close()
+            self._engines.clear()
+
+    def _load(self, model_dir: str, quantized: bool) -> OnnxEmbeddingEngine:
+        """Load the engine of a model, unless another thread just did. Runs in a thread."""
+        with self._lock:
+            key = (model_dir, quantized)
+            if key not in self._engines:
+                self._engines[key] = OnnxEmbeddingEngine.load(
+                    model_dir,
+                    quantized,
+                    workers=settings.ONNX_EMBEDDING_WORKERS,
+                    threads=settings.ONNX_EMBEDDING_THREADS,
+                    batch_size=settings.ONNX_EMBEDDING_BATCH_SIZE,
+                )
+            return self._engines[key]
+
+
+# Global instance
+onnx_engines = OnnxEmbeddingEngineRegistry()
+
+
+@embedding_model(
+    "ONNX Text2Vec",
+    "onnx_text2vec",
+    "local",
+    model_name="onnx-minilm-l6-v2",
+    model_version="1.0",
+)
+class OnnxText2Vec(BaseEmbeddingModel):
+    """In-process MiniLM embedding model, run with ONNX Runtime on CPU."""
+
+    model_name: str = "onnx-minilm-l6-v2"
+    model_dir: str = Field(default="", description="Directory of the ONNX model and tokenizer")
+    quantized: bool = Field(default=False, description="Whether to use int8 quantized weights")
+    vector_dimensions: int = 384  # MiniLM-L6-v2 dimensions
+    enabled: bool = True
+
+    def model_post_init(self, __context) -> None:
+        """Post initialization hook to set the model directory and weights from settings.
+
+        This runs after Pydantic validation but before the model is used.
+        """
+        super().model_post_init(__context)
+        self.model_dir = self.model_dir or settings.ONNX_EMBEDDING_MODEL_DIR or ""
+        self.quantized = self.quantized or settings.ONNX_EMBEDDING_QUANTIZED
+
+    def cache_namespace(self) -> str:
+        """Identify the vectors of the model, quantized weights give slightly different ones."""
+        weights = "int8" if self.quantized else "fp32"
+        return f"{super().cache_namespace()}:{weights}"
+
+    async def embed(
+        self,
+        text: str,
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        dimensions: Optional[int] = None,
+    ) -> List[float]:
+        """Embed a single text string using the ONNX model.
+
+        Args:
+            text: The text to embed
+            model: Optional model override (defaults to self.model_name)
+            encoding_format: Format of the embedding (default: float)
+            dimensions: Vector dimensions (defaults to self.vector_dimensions)
+
+        Returns:
+            List of embedding values
+        """
+        (vector,) = await self.embed_many([text], model, encoding_format, dimensions)
+        return vector
+
+    async def embed_many(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        dimensions: Optional[int] = None,
+    ) -> List[List[float]]:
+        """Embed multiple text strings using the ONNX model.
+
+        Args:
+            texts: List of texts to embed
+            model: Optional model override (defaults to self.model_name)
+            encoding_format: Format of the embedding (default: float)
+            dimensions: Vector dimensions (defaults to self.vector_dimensions)
+
+        Returns:
+            List of embedding vectors
+        """
+        if model:
+            raise ValueError("Model override not supported for ONNX text2vec")
+
+        if dimensions:
+            raise ValueError("Dimensions override not supported for ONNX text2vec")
+
+        result = [[0.0] * self.vector_dimensions for _ in texts]
+        # Empty texts get a zero vector
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+        if not indices:
+            return result
+
+        if not self.model_dir:
+            raise ValueError("ONNX text2vec needs ONNX_EMBEDDING_MODEL_DIR to be set")
+        engine = await onnx_engines.get(self.model_dir, self.quantized)
+        vectors = await engine.embed([texts[i] for i in indices])
+        for i, vector in zip(indices, vectors, strict=True):
+            result[i] = vector
+        return result
@@ -0,0 +1,391 @@
+"""Client of the OpenAI embeddings API, within its request and rate limits."""
+
+import asyncio
+import hashlib
+import math
+import random
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.http_clients import http_clients
+
+from .batcher import estimate_tokens
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:  # Tokens are estimated instead
+    TIKTOKEN_AVAILABLE = False
+
+OPENAI_EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+
+# Limits of the embeddings endpoint
+MAX_INPUT_TOKENS = 8191
+MAX_REQUEST_TOKENS = 300_000
+MAX_REQUEST_INPUTS = 2048
+
+DEFAULT_MAX_RETRIES = 6
+DEFAULT_BACKOFF_BASE = 1.0  # seconds
+DEFAULT_BACKOFF_MAX = 60.0  # seconds
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str) -> Optional["tiktoken.Encoding"]:
+    """The tokenizer of an OpenAI model, or None if it cannot be loaded."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # tiktoken downloads its vocabularies on first use
+        logger.warning(f"Could not load the tokenizer of {model}, estimating tokens: {e}")
+        return None
+
+
+def split_by_tokens(text: str, model: str, max_tokens: int) -> List[Tuple[str, int]]:
+    """Split a text into pieces of at most a number of tokens.
+
+    Args:
+        text: The text to split
+        model: The OpenAI model whose tokenizer counts the tokens
+        max_tokens: Maximum number of tokens of a piece
+
+    Returns:
+        The pieces of the text with their number of tokens, a single piece if it fits
+    """
+    encoding = _encoding(model)
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        chunks = [tokens[start : start + max_tokens] for start in range(0, len(tokens), max_tokens)]
+        return [(encoding.decode(chunk), len(chunk)) for chunk in chunks]
+
+    # Without the tokenizer, split by bytes so the estimate of every piece fits
+    data = text.encode()
+    piece_size = 3 * (max_tokens - 1)
+    pieces = [
+        data[start : start + piece_size].decode(errors="ignore")
+        for start in range(0, len(data), piece_size)
+    ]
+    return [(piece, estimate_tokens(piece)) for piece in pieces]
+
+
+class RateGovernor:
+    """Keeps the requests of an account under its requests and tokens per minute.
+
+    Each limit is a token bucket holding a minute of its rate. A request reserves its share
+    of both buckets up front and waits until they are paid back, so requests go out in the
+    order they arrived and none of them is starved by smaller ones. A rate limit response
+    pauses every request until its Retry-After has passed.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """Initialize the governor with full buckets.
+
+        Args:
+            requests_per_minute: Maximum number of requests per minute
+            tokens_per_minute: Maximum number of tokens per minute
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request with a number of tokens is within the limits."""
+        await asyncio.sleep(self._reserve(tokens))
+        while (pause := self._paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(pause)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for a number of seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _reserve(self, tokens: int) -> float:
+        """Take a request and its tokens from the buckets, returning the time to wait."""
+        now = time.monotonic()
+        elapsed, self._updated = now - self._updated, now
+        self._requests = min(
+            self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60
+        )
+        self._tokens = min(
+            self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60
+        )
+
+        # Buckets go into debt, which later requests wait for too
+        self._requests -= 1
+        self._tokens -= tokens
+        return max(
+            0.0,
+            self._paused_until - now,
+            -self._requests * 60 / self.requests_per_minute,
+            -self._tokens * 60 / self.tokens_per_minute,
+        )
+
+
+@dataclass
+class EmbeddingClientStats:
+    """Requests of an embedding client since the process started."""
+
+    requests: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    inputs: int = 0
+    tokens: int = 0
+    latency: float = 0.0  # Total duration of the successful requests, in seconds
+
+    def summary(self) -> Dict[str, Any]:
+        """The stats, with the mean latency and throughput of the requests."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "inputs": self.inputs,
+            "tokens": self.tokens,
+            "mean_latency_ms": round(1000 * self.latency / self.requests) if self.requests else 0,
+            "tokens_per_second": round(self.tokens / self.latency) if self.latency else 0,
+        }
+
+
+class OpenAIEmbeddingClient:
+    """Embeds texts with the OpenAI embeddings API of an account.
+
+    Texts are split into requests within the endpoint's input and token limits, counted
+    with the model's tokenizer. A text over the input limit is split into pieces, and its
+    vector is the token-weighted mean of theirs, normalized like OpenAI's vectors are.
+
+    Requests go through the account's rate governor and are retried with jittered
+    exponential backoff on rate limits, server errors and connection errors, honoring
+    Retry-After. They are sent over the shared keep-alive client of the API host.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        governor: RateGovernor,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_input_tokens: int = MAX_INPUT_TOKENS,
+        max_request_tokens: int = MAX_REQUEST_TOKENS,
+        max_request_inputs: int = MAX_REQUEST_INPUTS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ):
+        """Initialize the client.
+
+        Args:
+            api_key: OpenAI API key of the account
+            governor: Rate governor of the account
+            http_client: Client to send requests with, defaults to the shared one of the host
+            max_input_tokens: Maximum number of tokens of an input
+            max_request_tokens: Maximum number of tokens of a request
+            max_request_inputs: Maximum number of inputs of a request
+            max_retries: Maximum number of retries of a request
+            backoff_base: Delay before the first retry, doubling with every retry, in seconds
+            backoff_max: Maximum delay before a retry, in seconds
+        """
+        self.api_key = api_key
+        self.governor = governor
+        self.http_client = http_client
+        self.max_input_tokens = max_input_tokens
+        self.max_request_tokens = max_request_tokens
+        self.max_request_inputs = max_request_inputs
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stats = EmbeddingClientStats()
+
+    async def embed(
+        self, texts: List[str], model: str, encoding_format: str = "float"
+    ) -> List[List[float]]:
+        """Embed non-empty texts.
+
+        Args:
+            texts: The texts to embed
+            model: The OpenAI embedding model
+            encoding_format: Format of the embeddings
+
+        Returns:
+            The vectors of the texts, in order
+        """
+        # Tokenizing is CPU-bound
+        pieces = await asyncio.to_thread(self._split, texts, model)
+        vectors = [None] * len(pieces)
+        await asyncio.gather(
+            *(
+                self._embed_request(pieces, request, model, encoding_format, vectors)
+                for request in self._requests(pieces)
+            )
+        )
+
+        by_text: List[List[Tuple[List[float], int]]] = [[] for _ in texts]
+        for (_, tokens, owner), vector in zip(pieces, vectors, strict=True):
+            by_text[owner].append((vector, tokens))
+        return [self._combine(parts) for parts in by_text]
+
+    def _split(self, texts: List[str], model: str) -> List[Tuple[str, int, int]]:
+        """Split texts into inputs within the input limit: (input, tokens, index of text)."""
+        return [
+            (piece, tokens, owner)
+            for owner, text in enumerate(texts)
+            for piece, tokens in split_by_tokens(text, model, self.max_input_tokens)
+        ]
+
+    def _requests(self, pieces: List[Tuple[str, int, int]]) -> List[List[int]]:
+        """Group inputs into requests within the request limits, as indices of the inputs."""
+        requests: List[List[int]] = []
+        request: List[int] = []
+        request_tokens = 0
+        for i, (_, tokens, _) in enumerate(pieces):
+            full = len(request) >= self.max_request_inputs
+            if request and (full or request_tokens + tokens > self.max_request_tokens):
+                requests.append(request)
+                request, request_tokens = [], 0
+            request.append(i)
+            request_tokens += tokens
+        if request:
+            requests.append(request)
+        return requests
+
+    async def _embed_request(
+        self,
+        pieces: List[Tuple[str, int, int]],
+        request: List[int],
+        model: str,
+        encoding_format: str,
+        vectors: List[Optional[List[float]]],
+    ) -> None:
+        """Embed the inputs of a request, storing their vectors by index."""
+        data = await self._post(
+            {
+                "input": [pieces[i][0] for i in request],
+                "model": model,
+                "encoding_format": encoding_format,
+            },
+            tokens=sum(pieces[i][1] for i in request),
+        )
+        if len(data) != len(request):
+            raise ValueError(f"Got {len(data)} embeddings for {len(request)} inputs")
+        for item in data:
+            vectors[request[item["index"]]] = item["embedding"]
+
+    async def _post(self, payload: Dict[str, Any], tokens: int) -> List[Dict[str, Any]]:
+        """Send a request to the embeddings endpoint, retrying transient failures."""
+        client = self.http_client or http_clients.get(OPENAI_EMBEDDINGS_URL)
+        failures = 0
+        while True:
+            await self.governor.acquire(tokens)
+            started = time.monotonic()
+            try:
+                response = await client.post(
+                    OPENAI_EMBEDDINGS_URL,
+                    headers={
+                        "Authorization": f"Bearer {self.api_key}",
+                        "Content-Type": "application/json",
+                    },
+                    json=payload,
+                    timeout=DEFAULT_TIMEOUT,
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                failures += 1
+                if failures > self.max_retries or not self._is_retryable(e):
+                    raise
+                delay = self._backoff(failures, e)
+                logger.warning(f"OpenAI embedding request failed ({e}), retrying in {delay:.1f}s")
+                self.stats.retries += 1
+                await asyncio.sleep(delay)
+                continue
+
+            self.stats.requests += 1
+            self.stats.inputs += len(payload["input"])
+            self.stats.tokens += tokens
+            self.stats.latency += time.monotonic() - started
+            return response.json()["data"]
+
+    @staticmethod
+    def _is_retryable(error: httpx.HTTPError) -> bool:
+        """Whether a failed request is worth sending again."""
+        if not isinstance(error, httpx.HTTPStatusError):
+            return isinstance(error, httpx.TransportError)
+        response = error.response
+        if response.status_code == 429 and "insufficient_quota" in response.text:
+            # Out of credits, retrying does not help
+            return False
+        return response.status_code in RETRYABLE_STATUS_CODES
+
+    def _backoff(self, failures: int, error: httpx.HTTPError) -> float:
+        """Delay before the next attempt, honoring Retry-After and pausing on rate limits."""
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (failures - 1))
+        # Jitter, so concurrent requests do not retry in lockstep
+        delay *= random.uniform(1.0, 1.25)
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = self._retry_after(error.response)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self.backoff_max))
+            if error.response.status_code == 429:
+                self.stats.rate_limited += 1
+                self.governor.pause(delay)
+        return delay
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """The delay the server asks for before retrying, in seconds."""
+        for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+            try:
+                return float(response.headers[header]) * scale
+            except (KeyError, ValueError):
+                continue
+        return None
+
+    @staticmethod
+    def _combine(parts: List[Tuple[List[float], int]]) -> List[float]:
+        """Combine the vectors of the pieces of a text into the vector of the text."""
+        if len(parts) == 1:
+            return parts[0][0]
+        total = sum(tokens for _, tokens in parts)
+        mean = [
+            sum(vector[i] * tokens for vector, tokens in parts) / total
+            for i in range(len(parts[0][0]))
+        ]
+        norm = math.sqrt(sum(value * value for value in mean)) or 1.0
+        return [value / norm for value in mean]
+
+
+class OpenAIEmbeddingClientRegistry:
+    """Shares one client, and so one rate governor, between all users of an API key."""
+
+    def __init__(self):
+        """Initialize the registry."""
+        self._clients: Dict[str, OpenAIEmbeddingClient] = {}
+
+    def get(self, api_key: str) -> OpenAIEmbeddingClient:
+        """Get the client of an API key, creating it on first use."""
+        key = hashlib.sha256(api_key.encode()).hexdigest()
+        client = self._clients.get(key)
+        if client is None:
+            governor = RateGovernor(settings.OPENAI_EMBEDDING_RPM, settings.OPENAI_EMBEDDING_TPM)
+            client = self._clients[key] = OpenAIEmbeddingClient(api_key, governor)
+        return client
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Requests, retries, tokens, latency and throughput per client, by key hash."""
+        return {key[:8]: client.stats.summary() for key, client in self._clients.items()}
+
+
+# Global instance
+openai_embedding_clients = OpenAIEmbeddingClientRegistry()
@@ -1,14 +1,14 @@
 """OpenAI text2vec model for embedding."""
 
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
-import httpx
 from pydantic import Field
 
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import embedding_model
 
 from ._base import BaseEmbeddingModel
+from .openai_client import openai_embedding_clients
 
 
 @embedding_model(
@@ -21,6 +21,11 @@ from ._base import BaseEmbeddingModel
 class OpenAIText2Vec(BaseEmbeddingModel):
     """OpenAI text2vec model configuration for embedding."""
 
+    # OpenAI accepts up to 2048 inputs and 300k tokens per request, the client splits
+    # batches over the limits by their exact token counts
+    MAX_BATCH_ITEMS: ClassVar[int] = 2048
+    MAX_BATCH_TOKENS: ClassVar[int] = 250_000
+
     model_name: str = "openai-text2vec"
     api_key: str = Field(..., description="OpenAI API key")
     vector_dimensions: int = 1536
@@ -29,6 +34,10 @@ class OpenAIText2Vec(BaseEmbeddingModel):
         default="text-embedding-3-small", description="OpenAI embedding model name"
     )
 
+    def cache_namespace(self) -> str:
+        """Identify the vectors of the model, including the OpenAI model producing them."""
+        return f"{super().cache_namespace()}:{self.embedding_model}"
+
     async def embed(
         self,
         text: str,
@@ -55,19 +64,8 @@ class OpenAIText2Vec(BaseEmbeddingModel):
             # Return zero vector for empty text
             return [0.0] * self.vector_dimensions
 
-        used_model = model or self.embedding_model
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.openai.com/v1/embeddings",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={"input": text, "model": used_model, "encoding_format": encoding_format},
-            )
-            response.raise_for_status()
-            return response.json()["data"][0]["embedding"]
+        (vector,) = await self.embed_many([text], model, encoding_format)
+        return vector
 
     async def embed_many(
         self,
@@ -96,46 +94,30 @@ class OpenAIText2Vec(BaseEmbeddingModel):
 
         # Filter out empty texts and track their positions
         filtered_texts = []
-        empty_indices = []
+        empty_indices = set()
 
         for i, text in enumerate(texts):
             if text.strip():
                 filtered_texts.append(text)
             else:
-                empty_indices.append(i)
+                empty_indices.add(i)
 
         if not filtered_texts:
             return [[0.0] * self.vector_dimensions] * len(texts)
 
-        used_model = model or self.embedding_model
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.openai.com/v1/embeddings",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "input": filtered_texts,
-                    "model": used_model,
-                    "encoding_format": encoding_format,
-                },
-            )
-            response.raise_for_status()
-
-            # Get the embeddings in the same order as input
-            embeddings = [e["embedding"] for e in response.json()["data"]]
-
-            # Reinsert empty vectors at the correct positions
-            result = []
-            embedding_idx = 0
-
-            for i in range(len(texts)):
-                if i in empty_indices:
-                    result.append([0.0] * self.vector_dimensions)
-                else:
-                    result.append(embeddings[embedding_idx])
-                    embedding_idx += 1
-
-            return result
+        embeddings = await openai_embedding_clients.get(self.api_key).embed(
+            filtered_texts, model or self.embedding_model, encoding_format
+        )
+
+        # Reinsert empty vectors at the correct positions
+        result = []
+        embedding_idx = 0
+
+        for i in range(len(texts)):
+            if i in empty_indices:
+                result.append([0.0] * self.vector_dimensions)
+            else:
+                result.append(embeddings[embedding_idx])
+                embedding_idx += 1
+
+        return result
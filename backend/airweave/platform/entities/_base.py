@@ -1,15 +1,19 @@
 """Entity schemas."""
 
-import hashlib
 import importlib
 import json
 import os
 import sys
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, Field, PrivateAttr, create_model
+
+from airweave.platform.entities._hashing import field_plan, hash_fields, new_hasher
+
+# Files are hashed in chunks of this size, so large files are never read into memory at once
+FILE_HASH_CHUNK_SIZE = 1024 * 1024
 
 
 class DestinationAction(str, Enum):
@@ -18,6 +22,7 @@ class DestinationAction(str, Enum):
     INSERT = "insert"
     UPDATE = "update"
     KEEP = "keep"
+    DELETE = "delete"
 
 
 class Breadcrumb(BaseModel):
@@ -66,30 +71,40 @@ class BaseEntity(BaseModel):
 
     vector: Optional[List[float]] = Field(None, description="Vector representation of the entity.")
 
+    # Fields that change between syncs of an unchanged entity, left out of its hash
+    hash_exclude_fields: ClassVar[frozenset[str]] = frozenset(
+        {"db_entity_id", "sync_job_id", "vector"}
+    )
+
+    _hash: Optional[str] = PrivateAttr(default=None)
+    # Position in the source's output, set while the entity is tracked for checkpointing
+    _checkpoint_seq: Optional[int] = PrivateAttr(default=None)
+
     class Config:
         """Pydantic config."""
 
         from_attributes = True
 
-    def hash(self) -> str:
-        """Hash the entity."""
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field, dropping the memoized hash if the field is part of it."""
+        if not name.startswith("_") and name not in self.hash_exclude_fields:
+            self._hash = None
+        super().__setattr__(name, value)
 
-        # Convert model to dict first, then sanitize any non-serializable values to strings
-        def sanitize_value(v: Any) -> Any:
-            if isinstance(v, (str, int, float, bool, type(None))):
-                return v
-            if isinstance(v, dict):
-                return sanitize_dict(v)
-            if isinstance(v, (list, tuple, set)):
-                return [sanitize_value(x) for x in v]
-            return str(v)
+    def hash(self) -> str:
+        """Hash the entity, computing the hash once.
 
-        def sanitize_dict(d: dict) -> dict:
-            return {k: sanitize_value(v) for k, v in d.items()}
+        The hash covers every field except `hash_exclude_fields`, encoded as canonical JSON
+        in field name order. It is memoized until a hashed field is assigned.
+        """
+        if self._hash is None:
+            self._hash = self._compute_hash()
+        return self._hash
 
-        data = self.model_dump(exclude={"sync_job_id"})
-        sanitized_data = sanitize_dict(data)
-        return hashlib.sha256(str(sanitized_data).encode()).hexdigest()
+    def _compute_hash(self) -> str:
+        """Compute the hash of the entity's fields."""
+        cls = type(self)
+        return hash_fields(self, field_plan(cls, cls.hash_exclude_fields))
 
     def to_storage_dict(self, exclude_fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Convert entity to a dictionary suitable for storage in vector databases.
@@ -165,6 +180,15 @@ class ParentEntity(BaseEntity):
     pass
 
 
+class DeletedEntity(BaseEntity):
+    """Marks an entity as deleted in the source.
+
+    Yielded by `BaseSource.generate_changes`, only the entity id is used.
+    """
+
+    pass
+
+
 class PolymorphicEntity(ChunkEntity):
     """Base class for dynamically generated entities.
 
@@ -240,27 +264,39 @@ class FileEntity(BaseEntity):
         None, description="Temporary local path if file is downloaded"
     )
     checksum: Optional[str] = Field(None, description="File checksum/hash if available")
+    fingerprint: Optional[str] = Field(
+        None,
+        description=(
+            "Content fingerprint from the source listing, e.g. an MD5 or content hash. "
+            "Files with an unchanged fingerprint are not downloaded again."
+        ),
+    )
     total_size: Optional[int] = Field(None, description="Total size of the file in bytes")
 
-    def hash(self) -> str:
-        """Hash the file entity.
+    def _compute_hash(self) -> str:
+        """Hash the file's source fingerprint, or else the contents of the downloaded file.
+
+        A fingerprint lets the hash be compared before downloading. The file manager
+        computes the checksum while downloading, so the file is only read here if it was
+        downloaded some other way.
 
-        For files, we try the following strategies in order:
-        1. If local_path is available, compute hash from actual file contents
-        2. If checksum is available, use it as part of metadata hash
-        3. Fall back to parent hash method using all metadata
+        Raises:
+            ValueError: If the file has neither a fingerprint nor a local path
         """
-        if self.local_path:
-            # If we have the actual file, compute hash from its contents
-            try:
-                with open(self.local_path, "rb") as f:
-                    content = f.read()
-                    return hashlib.sha256(content).hexdigest()
-            except Exception:
-                # If file read fails, fall through to next method
-                pass
-        else:
+        if self.fingerprint:
+            hasher = new_hasher()
+            hasher.update(self.fingerprint.encode())
+            return hasher.hexdigest()
+        if not self.local_path:
             raise ValueError("File has no local path")
+        if self.checksum:
+            return self.checksum
+
+        hasher = new_hasher()
+        with open(self.local_path, "rb") as f:
+            for chunk in iter(lambda: f.read(FILE_HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
 
     @classmethod
     def create_parent_chunk_models(cls) -> Tuple[Type["ParentEntity"], Type["ChunkEntity"]]:
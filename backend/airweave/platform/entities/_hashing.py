@@ -0,0 +1,117 @@
+"""Canonical hashing of entities, used to detect which entities changed between syncs.
+
+Stored hashes are only comparable to hashes of the same encoding and digest. Hashes used
+to be the sha256 of the str() of the entity's sanitized dict, including fields that are
+now excluded; every stored hash of that form differs from its canonical hash. The first
+sync of each source connection after upgrading therefore sees every entity as updated,
+and re-chunks, re-embeds and rewrites all of them once. Changing
+`ENTITY_HASH_ALGORITHM` has the same one-time cost.
+"""
+
+import hashlib
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional
+
+from pydantic import BaseModel
+
+from airweave.core.config import ENTITY_HASH_ALGORITHMS as HASH_ALGORITHMS
+from airweave.core.config import settings
+
+try:
+    import xxhash
+except ImportError:  # Optional, only needed for the xxh3_128 algorithm
+    xxhash = None
+
+# A field plan lists the hashed fields of an entity class as (name, encoded key prefix)
+FieldPlan = tuple[tuple[str, bytes], ...]
+
+
+def _json_default(value: Any) -> Any:
+    """Convert a value json cannot encode into one it can, deterministically."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, bytes):
+        return value.hex()
+    # UUIDs, decimals and anything else are hashed by their string form
+    return str(value)
+
+
+_encoder = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_json_default
+)
+
+
+def canonical_bytes(value: Any) -> bytes:
+    """Encode a value as canonical JSON: sorted keys, no whitespace, stable conversions."""
+    return _encoder.encode(value).encode()
+
+
+@lru_cache(maxsize=None)
+def _hasher_factory(algorithm: str) -> Callable[[], Any]:
+    """Get the constructor of the hash objects of a digest algorithm."""
+    if algorithm == "sha256":
+        return hashlib.sha256
+    if algorithm == "blake2b":
+        return lambda: hashlib.blake2b(digest_size=16)
+    if algorithm == "xxh3_128":
+        if xxhash is None:
+            raise ValueError("Entity hash algorithm xxh3_128 requires the xxhash package")
+        return xxhash.xxh3_128
+    raise ValueError(
+        f"Unknown entity hash algorithm {algorithm!r}, expected one of {HASH_ALGORITHMS}"
+    )
+
+
+def new_hasher(algorithm: Optional[str] = None) -> Any:
+    """Create a hash object of the configured entity hash algorithm.
+
+    Args:
+        algorithm: Algorithm to use instead of `settings.ENTITY_HASH_ALGORITHM`
+
+    Returns:
+        An object with the `update` and `hexdigest` methods of hashlib's hash objects
+    """
+    return _hasher_factory(algorithm or settings.ENTITY_HASH_ALGORITHM)()
+
+
+_field_plans: dict[tuple[type, frozenset[str]], FieldPlan] = {}
+
+
+def field_plan(entity_class: type[BaseModel], exclude: Iterable[str]) -> FieldPlan:
+    """Get the hashed fields of an entity class, computed once per class and exclusions.
+
+    Fields are sorted by name, so the hash does not depend on declaration order.
+    """
+    excluded = frozenset(exclude)
+    plan = _field_plans.get((entity_class, excluded))
+    if plan is None:
+        plan = tuple(
+            (name, canonical_bytes(name) + b":")
+            for name in sorted(entity_class.model_fields)
+            if name not in excluded
+        )
+        _field_plans[(entity_class, excluded)] = plan
+    return plan
+
+
+def hash_fields(entity: BaseModel, plan: FieldPlan, algorithm: Optional[str] = None) -> str:
+    """Hash the fields of an entity in the order of a field plan.
+
+    Every field is encoded and fed to the digest on its own, so no intermediate dict or
+    string of the whole entity is built.
+    """
+    hasher = new_hasher(algorithm)
+    for name, prefix in plan:
+        hasher.update(prefix)
+        hasher.update(canonical_bytes(getattr(entity, name)))
+        hasher.update(b",")
+    return hasher.hexdigest()
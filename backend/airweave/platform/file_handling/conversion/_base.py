@@ -13,6 +13,7 @@ class DocumentConverterResult:
         text_content: str = "",
         file_path: str = "",
         metadata: Optional[Dict[str, Any]] = None,
+        cacheable: bool = True,
     ):
         """Initialize the AsyncDocumentConverterResult.
 
@@ -21,16 +22,26 @@ class DocumentConverterResult:
             text_content: The extracted text content in markdown format
             file_path: The path to the original file
             metadata: Additional metadata extracted from the document
+            cacheable: Whether the result may be reused for files with the same contents.
+                False for degraded results, e.g. of a fallback after an OCR error.
         """
         self.title: Optional[str] = title
         self.text_content: str = text_content
         self.file_path: str = file_path
         self.metadata: Dict[str, Any] = metadata or {}
+        self.cacheable: bool = cacheable
 
 
 class DocumentConverter(ABC):
     """Abstract base class for all document converters."""
 
+    # Bump when a change to the converter changes its output, so cached conversions are redone
+    VERSION = "1"
+
+    def cache_key(self) -> str:
+        """Identify the converter and everything else its output depends on, for caching."""
+        return f"{type(self).__name__}:{self.VERSION}"
+
     @abstractmethod
     async def convert(self, local_path: str, **kwargs: Any) -> Union[None, DocumentConverterResult]:
         """Convert a document to markdown text.
@@ -0,0 +1,174 @@
+"""Persistent cache of document conversions, keyed by file contents."""
+
+import hashlib
+import json
+import os
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import aiofiles
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.entities._hashing import canonical_bytes, new_hasher
+from airweave.platform.file_handling.conversion._base import (
+    DocumentConverter,
+    DocumentConverterResult,
+)
+
+_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+def file_checksum(path: str) -> str:
+    """Hash the contents of a file like the file manager does while downloading."""
+    hasher = new_hasher()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class ConversionCache:
+    """Caches the markdown of converted files on disk, by file checksum and converter.
+
+    A file with the same contents is converted once, however often it is synced and
+    through however many sources: re-syncs, renames and the same attachment in several
+    mailboxes reuse the first conversion, including its OCR.
+
+    Entries are compressed files in the cache directory, evicted least recently used first
+    when the cache outgrows its size. The directory can be shared by processes: each keeps
+    its own index of the entries, loaded from the directory on first use, and tolerates
+    entries that another process evicted.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to keep the cached conversions in
+            max_size: Maximum total size of the cached conversions in bytes, 0 to disable
+                the cache
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        # Path and size of every entry, least recently used first
+        self._entries: Optional[OrderedDict[str, int]] = None
+        self._size = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether conversions are cached."""
+        return self.max_size > 0
+
+    @staticmethod
+    def key(
+        checksum: str, converter: DocumentConverter, extension: str, options: Dict[str, Any]
+    ) -> str:
+        """Key of the conversion of a file.
+
+        Args:
+            checksum: Checksum of the file's contents
+            converter: The converter converting the file
+            extension: Extension of the file, which selects how some converters parse it
+            options: Arguments of the conversion that change its output
+        """
+        parts = [settings.ENTITY_HASH_ALGORITHM, checksum, extension, converter.cache_key()]
+        return hashlib.sha256(canonical_bytes([*parts, options])).hexdigest()
+
+    async def get(self, key: str) -> Optional[DocumentConverterResult]:
+        """Get a cached conversion, None if there is none."""
+        path = self._path(key)
+        try:
+            async with aiofiles.open(path, "rb") as f:
+                data = await f.read()
+            entry = json.loads(zlib.decompress(data))
+        except FileNotFoundError:
+            return None
+        except (OSError, zlib.error, ValueError) as e:
+            logger.warning(f"Dropping unreadable cached conversion {path}: {e}")
+            self._remove(path)
+            return None
+
+        self._use(path, len(data))
+        return DocumentConverterResult(
+            title=entry["title"], text_content=entry["text_content"], metadata=entry["metadata"]
+        )
+
+    async def put(self, key: str, result: DocumentConverterResult) -> None:
+        """Cache a conversion, evicting the least recently used ones if needed."""
+        entry = {
+            "title": result.title,
+            "text_content": result.text_content,
+            "metadata": result.metadata,
+        }
+        data = zlib.compress(json.dumps(entry, default=str).encode())
+        if len(data) > self.max_size:
+            return
+
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            async with aiofiles.open(temp_path, "wb") as f:
+                await f.write(data)
+            # Readers in other processes never see a partly written entry
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache conversion {path}: {e}")
+            return
+
+        self._use(path, len(data))
+        self._evict()
+
+    def _path(self, key: str) -> str:
+        """Path of an entry, spread over subdirectories to keep directories small."""
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def _index(self) -> OrderedDict[str, int]:
+        """The entries, loaded from the cache directory on first use."""
+        if self._entries is None:
+            found = []
+            if os.path.isdir(self.cache_dir):
+                for subdir in os.scandir(self.cache_dir):
+                    if subdir.is_dir():
+                        for entry in os.scandir(subdir.path):
+                            if not entry.name.endswith(".tmp"):
+                                stat = entry.stat()
+                                found.append((stat.st_mtime, entry.path, stat.st_size))
+            found.sort()
+            self._entries = OrderedDict((path, size) for _, path, size in found)
+            self._size = sum(self._entries.values())
+        return self._entries
+
+    def _use(self, path: str, size: int) -> None:
+        """Record an entry as most recently used."""
+        entries = self._index()
+        self._size += size - entries.pop(path, 0)
+        entries[path] = size
+        try:
+            # Other processes load the order of use from the modification times
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries while the cache is over its size."""
+        entries = self._index()
+        while self._size > self.max_size and entries:
+            path = next(iter(entries))
+            self._remove(path)
+
+    def _remove(self, path: str) -> None:
+        """Delete an entry."""
+        self._size -= self._index().pop(path, 0)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+# Global instance
+conversion_cache = ConversionCache(
+    cache_dir=settings.CONVERSION_CACHE_DIR, max_size=settings.CONVERSION_CACHE_SIZE
+)
@@ -4,12 +4,12 @@ This module provides functionality to convert images to markdown text
 using Mistral OCR, metadata extraction, and optional LLM-based image description.
 """
 
+import asyncio
 import base64
 import json
 import mimetypes
 import os
 import shutil
-import subprocess
 from typing import Any, Dict, Optional, Union
 
 from airweave.core.config import settings
@@ -55,6 +55,19 @@ class AsyncImageConverter(DocumentConverter):
         # Log available capabilities
         self._log_available_capabilities()
 
+    def cache_key(self) -> str:
+        """Identify the converter, and which capabilities it uses."""
+        capabilities = [
+            name
+            for name, available in [
+                ("mistral", self.mistral_client),
+                ("exiftool", self.exiftool_available),
+                ("openai", self.openai_client),
+            ]
+            if available
+        ]
+        return f"{super().cache_key()}:{'+'.join(capabilities)}"
+
     def _log_available_capabilities(self):
         """Log which conversion capabilities are available."""
         capabilities = []
@@ -231,21 +244,22 @@ class AsyncImageConverter(DocumentConverter):
         """
         logger.info(f"Using Mistral OCR to process image: {image_path}")
 
-        # Upload file to Mistral
+        # Upload file to Mistral, with the async client so the event loop is not blocked
         with open(image_path, "rb") as file:
-            uploaded_image = self.mistral_client.files.upload(
-                file={
-                    "file_name": os.path.basename(image_path),
-                    "content": file,
-                },
-                purpose="ocr",
-            )
+            content = file.read()
+        uploaded_image = await self.mistral_client.files.upload_async(
+            file={
+                "file_name": os.path.basename(image_path),
+                "content": content,
+            },
+            purpose="ocr",
+        )
 
         # Get signed URL for accessing the file
-        signed_url = self.mistral_client.files.get_signed_url(file_id=uploaded_image.id)
+        signed_url = await self.mistral_client.files.get_signed_url_async(file_id=uploaded_image.id)
 
         # Process file with OCR
-        ocr_response = self.mistral_client.ocr.process(
+        ocr_response = await self.mistral_client.ocr.process_async(
             model="mistral-ocr-latest",
             document={
                 "type": "image_url",
@@ -269,10 +283,16 @@ class AsyncImageConverter(DocumentConverter):
     async def _get_metadata(self, local_path: str) -> Optional[Dict[str, Any]]:
         """Get image metadata using exiftool if available."""
         try:
-            result = subprocess.run(
-                [self.exiftool_path, "-json", local_path], capture_output=True, text=True
-            ).stdout
-            return json.loads(result)[0]
+            # Run without blocking the event loop
+            process = await asyncio.create_subprocess_exec(
+                self.exiftool_path,
+                "-json",
+                local_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await process.communicate()
+            return json.loads(stdout)[0]
         except Exception as e:
             logger.error(f"Error extracting metadata with exiftool: {str(e)}")
             return None
@@ -1,8 +1,11 @@
 """PDF to Markdown converter with Mistral OCR support."""
 
+import asyncio
 import os
 import tempfile
-from typing import Any, Optional, Tuple, Union
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from tenacity import retry, stop_after_attempt, wait_exponential
 
 from airweave.core.config import settings
 from airweave.core.logging import logger
@@ -10,6 +13,7 @@ from airweave.platform.file_handling.conversion._base import (
     DocumentConverter,
     DocumentConverterResult,
 )
+from airweave.platform.file_handling.conversion.process_pool import conversion_pool
 
 # Initialize Mistral client if API key is available
 mistral_client = None
@@ -28,6 +32,11 @@ class PdfConverter(DocumentConverter):
     def __init__(self):
         """Initialize the PDF converter with Mistral client if API key is available."""
         self.mistral_client = mistral_client
+        self._ocr_slots = asyncio.Semaphore(settings.MISTRAL_OCR_MAX_CONCURRENCY)
+
+    def cache_key(self) -> str:
+        """Identify the converter, and whether it uses OCR."""
+        return f"{super().cache_key()}:{'mistral' if self.mistral_client else 'pypdf'}"
 
     async def convert(self, local_path: str, **kwargs: Any) -> Union[None, DocumentConverterResult]:
         """Convert a PDF file to markdown using Mistral OCR when available.
@@ -46,8 +55,7 @@ class PdfConverter(DocumentConverter):
         # Try Mistral OCR first if available
         if self.mistral_client:
             try:
-                md_content, title = await self._convert_with_mistral(local_path)
-                return DocumentConverterResult(title=title, text_content=md_content)
+                return await self._convert_with_mistral(local_path)
             except Exception as e:
                 logger.error(f"Error converting PDF with Mistral OCR: {str(e)}")
                 logger.info("Falling back to PyPDF2")
@@ -55,7 +63,10 @@ class PdfConverter(DocumentConverter):
         # Fall back to PyPDF2
         try:
             md_content, title = await self._convert_with_pypdf(local_path)
-            return DocumentConverterResult(title=title, text_content=md_content)
+            # Not cached when OCR failed, so the file gets OCR again on its next sync
+            return DocumentConverterResult(
+                title=title, text_content=md_content, cacheable=not self.mistral_client
+            )
         except ImportError:
             return DocumentConverterResult(
                 title=None, text_content="PDF conversion requires Mistral API key or PyPDF2."
@@ -64,14 +75,14 @@ class PdfConverter(DocumentConverter):
             logger.error(f"Error converting PDF with PyPDF2: {str(e)}")
             return None
 
-    async def _convert_with_mistral(self, local_path: str) -> Tuple[str, Optional[str]]:
+    async def _convert_with_mistral(self, local_path: str) -> DocumentConverterResult:
         """Convert PDF using Mistral OCR.
 
         Args:
             local_path: Path to the PDF file
 
         Returns:
-            Tuple of (markdown_content, title)
+            DocumentConverterResult containing the markdown text
 
         Raises:
             Exception: If Mistral OCR conversion fails
@@ -87,10 +98,13 @@ class PdfConverter(DocumentConverter):
             return await self._process_large_pdf(local_path)
 
         # Process normally for files under 50MB
-        return await self._process_single_pdf(local_path)
+        md_content, title = await self._process_single_pdf(local_path)
+        return DocumentConverterResult(title=title, text_content=md_content)
 
     async def _process_single_pdf(self, pdf_path: str) -> Tuple[str, Optional[str]]:
-        """Process a single PDF file with Mistral OCR.
+        """Process a single PDF file with Mistral OCR, retrying failed attempts.
+
+        At most MISTRAL_OCR_MAX_CONCURRENCY files are processed at the same time.
 
         Args:
             pdf_path: Path to the PDF file
@@ -98,21 +112,37 @@ class PdfConverter(DocumentConverter):
         Returns:
             Tuple of (markdown_content, title)
         """
-        # Upload file to Mistral
+        async with self._ocr_slots:
+            ocr_response = await self._ocr_pdf(pdf_path)
+
+        # Extract markdown content from each page
+        md_content = "".join(page.markdown for page in ocr_response.pages)
+
+        # Try to extract title from metadata if available
+        title = None
+        if hasattr(ocr_response, "metadata") and ocr_response.metadata:
+            if hasattr(ocr_response.metadata, "title"):
+                title = ocr_response.metadata.title
+
+        return md_content.strip(), title
+
+    @retry(
+        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True
+    )
+    async def _ocr_pdf(self, pdf_path: str) -> Any:
+        """Upload a PDF to Mistral and run OCR on it."""
         with open(pdf_path, "rb") as file:
-            uploaded_pdf = self.mistral_client.files.upload(
-                file={
-                    "file_name": os.path.basename(pdf_path),
-                    "content": file,
-                },
-                purpose="ocr",
-            )
+            content = file.read()
+        uploaded_pdf = await self.mistral_client.files.upload_async(
+            file={"file_name": os.path.basename(pdf_path), "content": content},
+            purpose="ocr",
+        )
 
         # Get signed URL for accessing the file
-        signed_url = self.mistral_client.files.get_signed_url(file_id=uploaded_pdf.id)
+        signed_url = await self.mistral_client.files.get_signed_url_async(file_id=uploaded_pdf.id)
 
         # Process file with OCR
-        ocr_response = self.mistral_client.ocr.process(
+        return await self.mistral_client.ocr.process_async(
             model="mistral-ocr-latest",
             document={
                 "type": "document_url",
@@ -120,151 +150,67 @@ class PdfConverter(DocumentConverter):
             },
         )
 
-        # Extract markdown content from each page
-        md_content = ""
-        for page in ocr_response.pages:
-            md_content += f"{page.markdown}"
+    async def _process_large_pdf(self, pdf_path: str) -> DocumentConverterResult:
+        """Process a large PDF by splitting it into batches under 50MB.
 
-        # Try to extract title from metadata if available
-        title = None
-        if hasattr(ocr_response, "metadata") and ocr_response.metadata:
-            if hasattr(ocr_response.metadata, "title"):
-                title = ocr_response.metadata.title
-
-        return md_content.strip(), title
-
-    async def _process_large_pdf(self, pdf_path: str) -> Tuple[str, Optional[str]]:
-        """Process a large PDF by splitting it into batches under 50MB and processing each batch.
+        The batches are processed concurrently, and their markdown joined in page order.
 
         Args:
             pdf_path: Path to the PDF file
 
         Returns:
-            Tuple of (markdown_content, title)
+            DocumentConverterResult containing the markdown text, not cacheable if pages
+            failed
         """
-        import PyPDF2
-
-        title = None
-        combined_md = ""
-        temp_dir = tempfile.mkdtemp()
-
-        try:
-            # Open the PDF and get page count
-            with open(pdf_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
-                title = self._extract_pdf_title(reader)
-
-                # Calculate batch size
-                num_pages, pages_per_batch = self._calculate_batch_size(pdf_path, reader)
-
-                # Process in batches
-                batch_num = 1
-                for start_idx in range(0, num_pages, pages_per_batch):
-                    end_idx = min(start_idx + pages_per_batch, num_pages)
-                    batch_md = await self._process_page_batch(
-                        reader, start_idx, end_idx, temp_dir, batch_num
-                    )
-                    combined_md += batch_md
-                    batch_num += 1
-
-            return combined_md.strip(), title
-
-        finally:
-            self._cleanup_temp_files(temp_dir)
-
-    def _extract_pdf_title(self, reader) -> Optional[str]:
-        """Extract title from PDF metadata if available."""
-        if reader.metadata and hasattr(reader.metadata, "title"):
-            return reader.metadata.title
-        return None
-
-    def _calculate_batch_size(self, pdf_path: str, reader) -> Tuple[int, int]:
-        """Calculate number of pages and pages per batch."""
-        num_pages = len(reader.pages)
-        file_size = os.path.getsize(pdf_path)
-        avg_page_size = file_size / num_pages if num_pages > 0 else 0
-
-        # Calculate pages per batch to stay under 50MB limit (with 10% buffer)
-        pages_per_batch = max(1, int((MAX_MISTRAL_FILE_SIZE * 0.9) / avg_page_size))
-
-        logger.info(f"PDF has {num_pages} pages, avg {avg_page_size / 1024 / 1024:.2f}MB per page")
-        logger.info(f"Processing in batches of {pages_per_batch} pages")
-
-        return num_pages, pages_per_batch
-
-    async def _process_page_batch(
-        self, reader, start_idx: int, end_idx: int, temp_dir: str, batch_num: int
-    ) -> str:
-        """Process a batch of PDF pages."""
-        from PyPDF2 import PdfWriter
-
-        # Create batch PDF with multiple pages
-        writer = PdfWriter()
-        for i in range(start_idx, end_idx):
-            writer.add_page(reader.pages[i])
-
-        # Save the batch to a temporary file
-        temp_batch_path = os.path.join(temp_dir, f"batch_{batch_num}.pdf")
-        with open(temp_batch_path, "wb") as batch_file:
-            writer.write(batch_file)
-
-        # Check if the batch file is still under the limit
-        batch_size = os.path.getsize(temp_batch_path)
-        if batch_size > MAX_MISTRAL_FILE_SIZE:
-            logger.warning(
-                f"Batch {batch_num} size ({batch_size / 1024 / 1024:.2f}MB) exceeds limit"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            title, batch_paths = await conversion_pool.run(
+                split_pdf, pdf_path, temp_dir, MAX_MISTRAL_FILE_SIZE
+            )
+            logger.info(f"Processing PDF in {len(batch_paths)} batches")
+            batches = await asyncio.gather(
+                *(self._process_batch(batch_path, temp_dir) for batch_path in batch_paths)
             )
-            # Process individual pages in this batch
-            return await self._process_individual_pages(reader, start_idx, end_idx, temp_dir)
-        else:
-            # Process the batch
-            try:
-                batch_md, _ = await self._process_single_pdf(temp_batch_path)
-                logger.info(f"Processed batch {batch_num} (pages {start_idx + 1}-{end_idx})")
-                return batch_md + "\n\n"
-            except Exception as e:
-                logger.error(f"Error processing batch {batch_num}: {str(e)}")
-                # Fall back to processing pages individually
-                logger.info(
-                    f"Falling back to processing pages {start_idx + 1}-{end_idx} individually"
-                )
-                return await self._process_individual_pages(reader, start_idx, end_idx, temp_dir)
-
-    async def _process_individual_pages(
-        self, reader, start_idx: int, end_idx: int, temp_dir: str
-    ) -> str:
-        """Process individual pages when batch processing fails."""
-        from PyPDF2 import PdfWriter
-
-        pages_md = ""
-        num_pages = len(reader.pages)
 
-        for i in range(start_idx, end_idx):
-            single_writer = PdfWriter()
-            single_writer.add_page(reader.pages[i])
-            temp_page_path = os.path.join(temp_dir, f"page_{i + 1}.pdf")
-            with open(temp_page_path, "wb") as page_file:
-                single_writer.write(page_file)
-            try:
-                page_md, _ = await self._process_single_pdf(temp_page_path)
-                pages_md += page_md + "\n\n"
-                logger.info(f"Processed page {i + 1}/{num_pages}")
-            except Exception as e:
-                logger.error(f"Error processing page {i + 1}: {str(e)}")
+        complete = all(batch_complete for _, batch_complete in batches)
+        md_content = "\n\n".join(batch_md for batch_md, _ in batches if batch_md)
+        return DocumentConverterResult(
+            title=title, text_content=md_content.strip(), cacheable=complete
+        )
 
-        return pages_md
+    async def _process_batch(self, batch_path: str, temp_dir: str) -> Tuple[str, bool]:
+        """Process a batch of pages, one page at a time if the batch fails.
 
-    def _cleanup_temp_files(self, temp_dir: str) -> None:
-        """Clean up temporary files."""
+        Returns:
+            Tuple of (markdown_content, whether all pages were processed)
+        """
         try:
-            for file in os.listdir(temp_dir):
-                os.remove(os.path.join(temp_dir, file))
-            os.rmdir(temp_dir)
+            batch_md, _ = await self._process_single_pdf(batch_path)
+            logger.info(f"Processed batch {os.path.basename(batch_path)}")
+            return batch_md, True
         except Exception as e:
-            logger.error(f"Error cleaning up temporary files: {str(e)}")
+            logger.error(f"Error processing batch {os.path.basename(batch_path)}: {str(e)}")
+
+        # Fall back to processing pages individually
+        batch_dir = tempfile.mkdtemp(dir=temp_dir)
+        _, page_paths = await conversion_pool.run(split_pdf, batch_path, batch_dir, 0)
+        if len(page_paths) == 1:
+            # The batch is a single page that already failed
+            return "", False
+        pages = await asyncio.gather(
+            *(self._process_single_pdf(page_path) for page_path in page_paths),
+            return_exceptions=True,
+        )
+
+        pages_md = []
+        for page_path, page in zip(page_paths, pages, strict=True):
+            if isinstance(page, Exception):
+                logger.error(f"Error processing page {os.path.basename(page_path)}: {page}")
+            else:
+                pages_md.append(page[0])
+        return "\n\n".join(pages_md), len(pages_md) == len(page_paths)
 
     async def _convert_with_pypdf(self, local_path: str) -> Tuple[str, Optional[str]]:
-        """Convert PDF using PyPDF2 as fallback.
+        """Convert PDF using PyPDF2 as fallback, in the conversion pool.
 
         Args:
             local_path: Path to the PDF file
@@ -275,22 +221,91 @@ class PdfConverter(DocumentConverter):
         Raises:
             ImportError: If PyPDF2 is not installed
         """
-        import PyPDF2
+        return await conversion_pool.run(extract_pdf_text, local_path)
 
-        md_content = ""
-        title = None
 
-        with open(local_path, "rb") as file:
-            reader = PyPDF2.PdfReader(file)
+def extract_pdf_text(local_path: str) -> Tuple[str, Optional[str]]:
+    """Extract the text of a PDF with PyPDF2. CPU-bound, runs in a conversion worker.
 
-            # Try to extract title from metadata
-            if reader.metadata and hasattr(reader.metadata, "title"):
-                title = reader.metadata.title
+    Args:
+        local_path: Path to the PDF file
 
-            # Extract text from each page
-            for _i, page in enumerate(reader.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    md_content += f"{page_text}"
+    Returns:
+        Tuple of (markdown_content, title)
+    """
+    import PyPDF2
 
-        return md_content.strip(), title
+    md_content = ""
+    title = None
+
+    with open(local_path, "rb") as file:
+        reader = PyPDF2.PdfReader(file)
+
+        # Try to extract title from metadata
+        if reader.metadata and hasattr(reader.metadata, "title") and reader.metadata.title:
+            title = str(reader.metadata.title)
+
+        # Extract text from each page
+        for page in reader.pages:
+            page_text = page.extract_text()
+            if page_text:
+                md_content += f"{page_text}"
+
+    return md_content.strip(), title
+
+
+def split_pdf(
+    pdf_path: str, output_dir: str, max_batch_size: int
+) -> Tuple[Optional[str], List[str]]:
+    """Split a PDF into batches of pages under a size limit. Runs in a conversion worker.
+
+    Batches that still exceed the limit are split into single pages.
+
+    Args:
+        pdf_path: Path to the PDF file
+        output_dir: Directory to write the batches to
+        max_batch_size: Maximum size of a batch in bytes, 0 to split into single pages
+
+    Returns:
+        Tuple of (title, paths of the batches in page order)
+    """
+    import PyPDF2
+
+    batch_paths = []
+    with open(pdf_path, "rb") as file:
+        reader = PyPDF2.PdfReader(file)
+        title = None
+        if reader.metadata and hasattr(reader.metadata, "title") and reader.metadata.title:
+            title = str(reader.metadata.title)
+
+        # Calculate pages per batch to stay under the limit (with 10% buffer)
+        num_pages = len(reader.pages)
+        avg_page_size = os.path.getsize(pdf_path) / num_pages if num_pages > 0 else 0
+        pages_per_batch = 1
+        if max_batch_size and avg_page_size:
+            pages_per_batch = max(1, int((max_batch_size * 0.9) / avg_page_size))
+
+        for start_idx in range(0, num_pages, pages_per_batch):
+            pages = range(start_idx, min(start_idx + pages_per_batch, num_pages))
+            batch_path = _write_pages(reader, pages, output_dir)
+            if len(pages) > 1 and os.path.getsize(batch_path) > max_batch_size:
+                os.remove(batch_path)
+                batch_paths.extend(_write_pages(reader, [i], output_dir) for i in pages)
+            else:
+                batch_paths.append(batch_path)
+
+    return title, batch_paths
+
+
+def _write_pages(reader: Any, pages: Sequence[int], output_dir: str) -> str:
+    """Write pages of a PDF to a new PDF, named after the page numbers."""
+    from PyPDF2 import PdfWriter
+
+    writer = PdfWriter()
+    for i in pages:
+        writer.add_page(reader.pages[i])
+
+    path = os.path.join(output_dir, f"pages_{pages[0] + 1}-{pages[-1] + 1}.pdf")
+    with open(path, "wb") as batch_file:
+        writer.write(batch_file)
+    return path
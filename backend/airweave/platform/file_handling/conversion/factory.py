@@ -3,6 +3,7 @@
 Handles selecting the appropriate converter for different file types.
 """
 
+import asyncio
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
@@ -12,6 +13,7 @@ from airweave.platform.file_handling.conversion._base import (
     DocumentConverter,
     DocumentConverterResult,
 )
+from airweave.platform.file_handling.conversion.cache import conversion_cache, file_checksum
 from airweave.platform.file_handling.conversion.converters.docx_converter import DocxConverter
 from airweave.platform.file_handling.conversion.converters.html_converter import HtmlConverter
 from airweave.platform.file_handling.conversion.converters.img_converter import AsyncImageConverter
@@ -19,6 +21,7 @@ from airweave.platform.file_handling.conversion.converters.pdf_converter import
 from airweave.platform.file_handling.conversion.converters.pptx_converter import PptxConverter
 from airweave.platform.file_handling.conversion.converters.txt_converter import TextConverter
 from airweave.platform.file_handling.conversion.converters.xlsx_converter import XlsxConverter
+from airweave.platform.file_handling.conversion.process_pool import conversion_pool
 
 
 class DocumentConverterFactory:
@@ -45,6 +48,10 @@ class DocumentConverterFactory:
         ".xml": "text",
     }
 
+    # Converters parsing files locally, which run in the conversion pool. The others mostly
+    # wait for OCR and LLM APIs, and run on the event loop.
+    POOLED_CONVERTER_TYPES = frozenset({"docx", "pptx", "xlsx", "html", "text"})
+
     def __init__(self, llm_client: Optional[Any] = None, llm_model: Optional[str] = None):
         """Initialize the factory with optional LLM client and model.
 
@@ -103,11 +110,17 @@ class DocumentConverterFactory:
 
         return self._converters.get(converter_type)
 
-    async def convert(self, file_path: str, **kwargs: Any) -> Union[None, DocumentConverterResult]:
+    async def convert(
+        self, file_path: str, checksum: Optional[str] = None, **kwargs: Any
+    ) -> Union[None, DocumentConverterResult]:
         """Convert a file to markdown using the appropriate converter.
 
+        Conversions are cached by the file's checksum, so a file with the same contents is
+        converted only once.
+
         Args:
             file_path: Path to the file to convert
+            checksum: Checksum of the file's contents, computed from the file if None
             **kwargs: Additional arguments to pass to the converter
 
         Returns:
@@ -142,12 +155,57 @@ class DocumentConverterFactory:
             kwargs["llm_model"] = self._llm_model
 
         try:
-            result = await converter.convert(file_path, **kwargs)
-            return result
+            return await self._convert_cached(converter, file_path, checksum, kwargs)
         except Exception as e:
             logger.error(f"Error converting file {file_path}: {str(e)}")
             return None
 
+    async def _convert_cached(
+        self,
+        converter: DocumentConverter,
+        file_path: str,
+        checksum: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Optional[DocumentConverterResult]:
+        """Convert a file, reusing the cached conversion of a file with the same contents."""
+        if not conversion_cache.enabled:
+            return await self._convert(converter, file_path, kwargs)
+
+        cache_key = await self._cache_key(converter, file_path, checksum, kwargs)
+        cached = await conversion_cache.get(cache_key)
+        if cached:
+            logger.info(f"Reusing cached conversion of {file_path}")
+            return cached
+
+        result = await self._convert(converter, file_path, kwargs)
+        if result and result.text_content and result.cacheable:
+            await conversion_cache.put(cache_key, result)
+        return result
+
+    async def _convert(
+        self, converter: DocumentConverter, file_path: str, kwargs: Dict[str, Any]
+    ) -> Optional[DocumentConverterResult]:
+        """Run a converter, in the conversion pool if it parses the file locally."""
+        converter_type = self.SUPPORTED_EXTENSIONS[kwargs["file_extension"]]
+        if converter_type in self.POOLED_CONVERTER_TYPES:
+            # Clients cannot be sent to a worker, and are not used by these converters
+            kwargs = {k: v for k, v in kwargs.items() if k != "llm_client"}
+            return await conversion_pool.run(_convert_in_worker, converter_type, file_path, kwargs)
+        return await converter.convert(file_path, **kwargs)
+
+    @staticmethod
+    async def _cache_key(
+        converter: DocumentConverter,
+        file_path: str,
+        checksum: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> str:
+        """Cache key of a conversion, hashing the file if its checksum is not known."""
+        if not checksum:
+            checksum = await asyncio.to_thread(file_checksum, file_path)
+        options = {k: v for k, v in kwargs.items() if k not in ("file_extension", "llm_client")}
+        return conversion_cache.key(checksum, converter, kwargs["file_extension"], options)
+
     def is_supported(self, file_path: str) -> bool:
         """Check if the file extension is supported.
 
@@ -163,3 +221,11 @@ class DocumentConverterFactory:
 
 # Create singleton instance - without hard-coded clients
 document_converter = DocumentConverterFactory()
+
+
+def _convert_in_worker(
+    converter_type: str, file_path: str, kwargs: Dict[str, Any]
+) -> Optional[DocumentConverterResult]:
+    """Convert a file in a conversion pool worker, with the worker's own converter."""
+    converter = document_converter._converters[converter_type]
+    return asyncio.run(converter.convert(file_path, **kwargs))
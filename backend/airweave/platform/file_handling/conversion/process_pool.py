@@ -0,0 +1,186 @@
+"""Process pool running CPU-bound document conversions off the event loop."""
+
+import asyncio
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Any, Callable, List, Optional, Tuple
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+
+try:
+    import resource
+except ImportError:  # Not available on Windows, workers run without a memory limit
+    resource = None
+
+# Workers are replaced after this many jobs, to return memory that parsers leak or fragment
+DEFAULT_MAX_JOBS_PER_WORKER = 100
+
+
+class ConversionTimeoutError(TimeoutError):
+    """A conversion did not finish in time, and its worker was killed."""
+
+
+class ConversionWorkerError(RuntimeError):
+    """A conversion worker died while running a job, e.g. when the OS killed it."""
+
+
+def _worker_main(conn: Connection, memory_limit: int) -> None:
+    """Run jobs received over a pipe until it is closed."""
+    if memory_limit and resource:
+        # Jobs over the limit fail with a MemoryError instead of exhausting the host
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    while True:
+        try:
+            func, args = conn.recv()
+        except EOFError:
+            return
+        try:
+            result = (True, func(*args))
+        except BaseException as e:
+            result = (False, e)
+        try:
+            conn.send(result)
+        except Exception as e:
+            # The result or exception could not be pickled
+            conn.send((False, RuntimeError(f"Unsendable conversion result: {e!r}")))
+
+
+class _Worker:
+    """A worker process, running one job at a time."""
+
+    def __init__(self, context: Any, memory_limit: int):
+        """Start the worker process."""
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, memory_limit), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+
+    def call(self, func: Callable, args: Tuple, timeout: float) -> Tuple[bool, Any]:
+        """Run a job, blocking until it is done. Runs in a thread.
+
+        Returns:
+            Whether the job succeeded, and its result or exception
+        """
+        self.jobs += 1
+        self.conn.send((func, args))
+        if not self.conn.poll(timeout):
+            raise ConversionTimeoutError(f"Conversion did not finish within {timeout}s")
+        try:
+            return self.conn.recv()
+        except EOFError:
+            self.process.join(1.0)
+            raise ConversionWorkerError(
+                f"Conversion worker died with exit code {self.process.exitcode}"
+            ) from None
+
+    def kill(self) -> None:
+        """Stop the worker, abandoning the job it runs."""
+        self.process.kill()
+        self.process.join(1.0)
+        self.conn.close()
+
+
+class ConversionPool:
+    """Runs conversion jobs in a bounded pool of worker processes.
+
+    Parsing documents holds the GIL for seconds, which would stall every sync and API
+    request of the process if done on the event loop. Jobs are run in worker processes
+    instead, one at a time per worker, and awaited without blocking.
+
+    Every job runs under a timeout, and every worker under a memory limit. A worker whose
+    job times out, is cancelled, or crashes is killed and replaced, so a bad file only
+    fails its own conversion.
+
+    Jobs are module-level functions, pickled by reference, with picklable arguments and
+    results.
+
+    Usage:
+    -----
+    ```python
+    text = await conversion_pool.run(extract_pdf_text, local_path)
+    ```
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        timeout: float,
+        memory_limit: int,
+        max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+    ):
+        """Initialize the pool. Workers are started on first use.
+
+        Args:
+            max_workers: Maximum number of worker processes, 0 to run jobs in a thread of this
+                process instead
+            timeout: Default maximum duration of a job, in seconds
+            memory_limit: Maximum address space of a worker in bytes, 0 for no limit
+            max_jobs_per_worker: Number of jobs after which a worker is replaced
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.max_jobs_per_worker = max_jobs_per_worker
+        # Spawned rather than forked: forking a process running an event loop and threads
+        # can copy locks in a held state
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: List[_Worker] = []
+        self._slots = asyncio.Semaphore(max(max_workers, 1))
+
+    async def run(self, func: Callable, *args: Any, timeout: Optional[float] = None) -> Any:
+        """Run a job in a worker process.
+
+        Args:
+            func: Module-level function to run
+            *args: Arguments of the function
+            timeout: Maximum duration of the job in seconds, the pool's default if None
+
+        Returns:
+            The return value of the function
+
+        Raises:
+            ConversionTimeoutError: If the job did not finish in time
+            ConversionWorkerError: If the worker died while running the job
+            Exception: Whatever the function raised
+        """
+        if not self.max_workers:
+            return await asyncio.wait_for(asyncio.to_thread(func, *args), timeout or self.timeout)
+
+        async with self._slots:
+            worker = self._idle.pop() if self._idle else _Worker(self._context, self.memory_limit)
+            try:
+                succeeded, result = await asyncio.to_thread(
+                    worker.call, func, args, timeout or self.timeout
+                )
+            except BaseException as e:
+                # The worker may still be running the job, it cannot take another one
+                logger.warning(f"Killing conversion worker {worker.process.pid}: {e!r}")
+                worker.kill()
+                raise
+
+            if worker.jobs >= self.max_jobs_per_worker:
+                worker.kill()
+            else:
+                self._idle.append(worker)
+
+        if not succeeded:
+            raise result
+        return result
+
+    def close(self) -> None:
+        """Stop the idle workers."""
+        while self._idle:
+            self._idle.pop().kill()
+
+
+# Global instance
+conversion_pool = ConversionPool(
+    max_workers=settings.CONVERSION_WORKERS,
+    timeout=settings.CONVERSION_TIMEOUT,
+    memory_limit=settings.CONVERSION_MEMORY_LIMIT,
+)
@@ -0,0 +1,134 @@
+"""Concurrent prefetching of file downloads."""
+
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from airweave.core.logging import logger
+
+# Number of files downloaded at the same time
+DEFAULT_MAX_CONCURRENCY = 8
+# Total size of the files being downloaded at the same time. A single file larger than this
+# is still downloaded, on its own.
+DEFAULT_MAX_BYTES_IN_FLIGHT = 256 * 1024 * 1024  # 256MB
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class DownloadManager:
+    """Runs downloads concurrently, yielding their results as they complete.
+
+    Items are read from the input as long as there is room for their download: fewer than
+    `max_concurrency` downloads are running and the item's size fits in the bytes-in-flight
+    budget. Results are yielded in completion order, so a slow large file does not hold
+    back the small files behind it.
+
+    Usage:
+    -----
+    ```python
+    manager = DownloadManager(max_concurrency=8)
+    async for entity in manager.prefetch(file_entities, download, size=lambda e: e.size or 0):
+        yield entity
+    ```
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_bytes_in_flight: int = DEFAULT_MAX_BYTES_IN_FLIGHT,
+    ):
+        """Initialize the download manager.
+
+        Args:
+            max_concurrency: Maximum number of downloads running at the same time
+            max_bytes_in_flight: Maximum total size of the running downloads, in bytes
+        """
+        self.max_concurrency = max_concurrency
+        self.max_bytes_in_flight = max_bytes_in_flight
+        self.bytes_in_flight = 0
+        self._downloads: dict[asyncio.Task, int] = {}
+
+    def _has_room(self, size: int) -> bool:
+        """Whether a download of the given size can start now."""
+        if not self._downloads:
+            return True
+        return (
+            len(self._downloads) < self.max_concurrency
+            and self.bytes_in_flight + size <= self.max_bytes_in_flight
+        )
+
+    async def prefetch(
+        self,
+        items: AsyncIterator[T],
+        download: Callable[[T], Awaitable[R]],
+        size: Callable[[T], int] = lambda item: 0,
+    ) -> AsyncGenerator[R, None]:
+        """Download the items of an async iterator concurrently.
+
+        Args:
+            items: The items to download
+            download: Coroutine function downloading an item and returning its result
+            size: Expected download size of an item in bytes, 0 if unknown
+
+        Yields:
+            The result of every download, in completion order
+
+        Raises:
+            Exception: The first error raised by the input or a download, after the other
+                downloads have been cancelled
+        """
+        pull_task: Optional[asyncio.Task] = None
+        waiting: Optional[tuple[T, int]] = None
+        exhausted = False
+
+        try:
+            while True:
+                if waiting is not None and self._has_room(waiting[1]):
+                    item, item_size = waiting
+                    task = asyncio.create_task(download(item))
+                    self._downloads[task] = item_size
+                    self.bytes_in_flight += item_size
+                    waiting = None
+                if waiting is None and not exhausted and pull_task is None:
+                    pull_task = asyncio.create_task(self._pull(items))
+
+                pending = set(self._downloads)
+                if pull_task:
+                    pending.add(pull_task)
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                if pull_task in done:
+                    try:
+                        item = pull_task.result()
+                        waiting = (item, size(item))
+                    except StopAsyncIteration:
+                        exhausted = True
+                    pull_task = None
+
+                for task in done:
+                    if task not in self._downloads:
+                        continue
+                    self.bytes_in_flight -= self._downloads.pop(task)
+                    yield task.result()
+        finally:
+            await self._cancel(pull_task)
+
+    @staticmethod
+    async def _pull(items: AsyncIterator[T]) -> T:
+        """Read the next item of the input."""
+        return await anext(items)
+
+    async def _cancel(self, pull_task: Optional[asyncio.Task]) -> None:
+        """Cancel the reading of the input and the running downloads."""
+        tasks = list(self._downloads) + ([pull_task] if pull_task else [])
+        if not tasks:
+            return
+        logger.info(f"Cancelling {len(self._downloads)} running downloads")
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._downloads.clear()
+        self.bytes_in_flight = 0
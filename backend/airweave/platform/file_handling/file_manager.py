@@ -1,29 +1,21 @@
 """Service for managing temporary files."""
 
-import hashlib
-import os
 from typing import AsyncGenerator, AsyncIterator, Dict, Optional
 from uuid import uuid4
 
-import aiofiles
 import httpx
 
 from airweave.core.logging import logger
 from airweave.platform.entities._base import FileEntity
+from airweave.platform.entities._hashing import new_hasher
+from airweave.platform.file_handling.file_store import file_store
+from airweave.platform.file_handling.ranged_download import ranged_downloader
+from airweave.platform.http_clients import http_clients
 
 
 class FileManager:
     """Manages temporary file operations."""
 
-    def __init__(self):
-        """Initialize the file manager."""
-        self.base_temp_dir = "/tmp/airweave"
-        self._ensure_base_dir()
-
-    def _ensure_base_dir(self):
-        """Ensure the base temporary directory exists."""
-        os.makedirs(self.base_temp_dir, exist_ok=True)
-
     async def handle_file_entity(
         self,
         stream: AsyncIterator[bytes],
@@ -32,6 +24,9 @@ class FileManager:
     ) -> FileEntity:
         """Process a file entity by saving its stream and enriching the entity.
 
+        The file is saved in the file store, holding one reference for the entity that is
+        released once the entity has been chunked.
+
         Args:
             stream: An async iterator yielding file chunks
             entity: The file entity to process
@@ -48,63 +43,62 @@ class FileManager:
 
         file_uuid = uuid4()
         safe_filename = self._safe_filename(entity.name)
-        temp_path = os.path.join(self.base_temp_dir, f"{file_uuid}-{safe_filename}")
+        # Waits for disk space when the store is full
+        writer = await file_store.open(
+            f"{file_uuid}-{safe_filename}", expected_size=entity.total_size or entity.size
+        )
 
         try:
             downloaded_size = 0
-            async with aiofiles.open(temp_path, "wb") as f:
-                async for chunk in stream:
-                    downloaded_size += len(chunk)
-
-                    # Safety check to skip files exceeding max size
-                    if downloaded_size > max_size:
-                        logger.warning(
-                            f"File {entity.name} exceeded maximum size"
-                            f"limit of {max_size / (1024 * 1024 * 1024):.1f}GB. "
-                            f"Download aborted at {downloaded_size / (1024 * 1024):.1f}MB."
-                        )
-                        # Clean up the partial file
-                        await f.close()
-                        if os.path.exists(temp_path):
-                            os.remove(temp_path)
-
-                        # Add warning to entity metadata
-                        if not entity.metadata:
-                            entity.metadata = {}
-                        entity.metadata["error"] = (
-                            f"File too large (exceeded "
-                            f"{max_size / (1024 * 1024 * 1024):.1f}GB limit)"
-                        )
-                        entity.metadata["size_exceeded"] = downloaded_size
-
-                        # Set the skip flag
-                        entity.should_skip = True
-                        return entity
-
-                    await f.write(chunk)
-
-                    # Log progress for large files
-                    if entity.total_size and entity.total_size > 10 * 1024 * 1024:  # 10MB
-                        progress = (downloaded_size / entity.total_size) * 100
-                        logger.info(
-                            f"Saving {entity.name}: {progress:.1f}% "
-                            f"({downloaded_size}/{entity.total_size} bytes)"
-                        )
-
-            # Calculate checksum and update entity
-            with open(temp_path, "rb") as f:
-                content = f.read()
-                entity.checksum = hashlib.sha256(content).hexdigest()
-                entity.local_path = temp_path
-                logger.info(f"\nlocal_path: {entity.local_path}\n")
-                entity.file_uuid = file_uuid
-                entity.total_size = downloaded_size  # Update with actual size
+            # The checksum is computed while writing, so the file is never read back
+            hasher = new_hasher()
+            async for chunk in stream:
+                downloaded_size += len(chunk)
+
+                # Safety check to skip files exceeding max size
+                if downloaded_size > max_size:
+                    logger.warning(
+                        f"File {entity.name} exceeded maximum size"
+                        f"limit of {max_size / (1024 * 1024 * 1024):.1f}GB. "
+                        f"Download aborted at {downloaded_size / (1024 * 1024):.1f}MB."
+                    )
+                    # Clean up the partial file
+                    await writer.discard()
+
+                    # Add warning to entity metadata
+                    if not entity.metadata:
+                        entity.metadata = {}
+                    entity.metadata["error"] = (
+                        f"File too large (exceeded {max_size / (1024 * 1024 * 1024):.1f}GB limit)"
+                    )
+                    entity.metadata["size_exceeded"] = downloaded_size
+
+                    # Set the skip flag
+                    entity.should_skip = True
+                    return entity
+
+                await writer.write(chunk)
+                hasher.update(chunk)
+
+                # Log progress for large files
+                if entity.total_size and entity.total_size > 10 * 1024 * 1024:  # 10MB
+                    progress = (downloaded_size / entity.total_size) * 100
+                    logger.info(
+                        f"Saving {entity.name}: {progress:.1f}% "
+                        f"({downloaded_size}/{entity.total_size} bytes)"
+                    )
+
+            # Update the entity, FileEntity.hash() reuses the checksum
+            entity.checksum = hasher.hexdigest()
+            entity.local_path = await writer.commit()
+            logger.info(f"\nlocal_path: {entity.local_path}\n")
+            entity.file_uuid = file_uuid
+            entity.total_size = downloaded_size  # Update with actual size
 
         except Exception as e:
             logger.error(f"Error saving file {entity.name}: {str(e)}")
             # Clean up partial file if it exists
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            await writer.discard()
             raise e
 
         return entity
@@ -122,26 +116,29 @@ class FileManager:
         access_token: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> AsyncGenerator[bytes, None]:
-        """Stream file content from a URL with optional authentication."""
-        request_headers = headers or {}
+        """Stream file content from a URL with optional authentication.
+
+        The file is downloaded in ranges, so a failed request resumes from the last
+        received byte instead of starting over, and large files are downloaded in parallel
+        parts when the server supports it.
+        """
+        request_headers = dict(headers or {})
 
         # Only add Authorization header if URL doesn't already have S3 auth
         if access_token and "X-Amz-Algorithm" not in url:
             request_headers["Authorization"] = f"Bearer {access_token}"
 
-        # The file is downloaded in chunks
-        timeout = httpx.Timeout(180.0, read=540.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            try:
-                async with client.stream(
-                    "GET", url, headers=request_headers, follow_redirects=True
-                ) as response:
-                    response.raise_for_status()
-                    async for chunk in response.aiter_bytes():
-                        yield chunk
-            except Exception as e:
-                logger.error(f"Error streaming file: {str(e)}")
-                raise
+        # Stalled requests are retried, so they need not be waited out for long
+        timeout = httpx.Timeout(60.0, connect=10.0)
+        client = http_clients.get(url)
+        try:
+            async for chunk in ranged_downloader.stream(
+                client, url, headers=request_headers, timeout=timeout
+            ):
+                yield chunk
+        except Exception as e:
+            logger.error(f"Error streaming file: {str(e)}")
+            raise
 
 
 # Global instance
@@ -0,0 +1,359 @@
+"""Store for downloaded files, with reference counting and a disk budget."""
+
+import asyncio
+import io
+import os
+import shutil
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import aiofiles
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+
+# RAM-backed directory for small files, so they never touch the disk
+DEFAULT_MEMORY_DIR = "/dev/shm/airweave"
+# Total size of the small files kept in memory
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024  # 256MB
+# How long a download waits for disk space before it goes over budget anyway, so a leaked
+# reference cannot stall a sync forever
+DEFAULT_BACKPRESSURE_TIMEOUT = 300.0  # seconds
+_BACKPRESSURE_POLL_INTERVAL = 0.1  # seconds
+
+
+@dataclass
+class _StoredFile:
+    """Bookkeeping of a stored file."""
+
+    size: int
+    in_memory: bool
+    refs: int = 1
+
+
+class FileStore:
+    """Stores downloaded files and deletes them when no longer needed.
+
+    Every stored file starts with one reference, held by the entity it was downloaded for,
+    and is released once the entity has been chunked. Released files stay until their
+    space is needed: when a download would exceed the disk budget, released files are
+    evicted least recently used first. If that is not enough, the download waits until
+    files are released, which holds back the source until the pipeline catches up.
+
+    Files up to `memory_threshold` bytes are buffered in memory while downloading and
+    stored in a RAM-backed directory, if the host has one.
+
+    Every process stores its files in its own directory, created when the first file is
+    stored. Directories left behind by processes that are gone are removed at that point.
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        disk_budget: int,
+        memory_threshold: int,
+        memory_dir: Optional[str] = DEFAULT_MEMORY_DIR,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        backpressure_timeout: float = DEFAULT_BACKPRESSURE_TIMEOUT,
+    ):
+        """Initialize the store.
+
+        Args:
+            root_dir: Directory to store files on disk in
+            disk_budget: Maximum total size of the files on disk, in bytes
+            memory_threshold: Files up to this size are kept in memory, in bytes
+            memory_dir: RAM-backed directory for small files, None to keep them on disk
+            memory_budget: Maximum total size of the files in memory, in bytes
+            backpressure_timeout: Maximum time a download waits for disk space, in seconds
+        """
+        self.disk_budget = disk_budget
+        self.memory_threshold = memory_threshold
+        self.memory_budget = memory_budget
+        self.backpressure_timeout = backpressure_timeout
+
+        self._root_dir = root_dir
+        self._memory_root_dir = None
+        if memory_dir and os.path.isdir(os.path.dirname(memory_dir)):
+            self._memory_root_dir = memory_dir
+        # The directories of this process are created on first use, so creating the store
+        # does not touch the file system
+        self._disk_dir: Optional[str] = None
+        self._memory_dir: Optional[str] = None
+
+        self._files: OrderedDict[str, _StoredFile] = OrderedDict()
+        self._disk_bytes = 0
+        self._memory_bytes = 0
+        # Disk space promised to downloads in progress
+        self._reserved_bytes = 0
+
+    @property
+    def disk_dir(self) -> str:
+        """Directory of this process for files on disk."""
+        if self._disk_dir is None:
+            self._disk_dir = self._create_process_dir(self._root_dir)
+        return self._disk_dir
+
+    @property
+    def memory_dir(self) -> Optional[str]:
+        """Directory of this process for files in memory, None if memory is not available."""
+        if self._memory_dir is None and self._memory_root_dir:
+            self._memory_dir = self._create_process_dir(self._memory_root_dir)
+            # Containers often get a small RAM-backed directory, e.g. 64MB by default in Docker
+            stat = os.statvfs(self._memory_dir)
+            self.memory_budget = min(self.memory_budget, stat.f_bavail * stat.f_frsize)
+        return self._memory_dir
+
+    @property
+    def disk_bytes(self) -> int:
+        """Total size of the files on disk, including downloads in progress."""
+        return self._disk_bytes + self._reserved_bytes
+
+    @property
+    def memory_bytes(self) -> int:
+        """Total size of the files in memory."""
+        return self._memory_bytes
+
+    async def open(self, name: str, expected_size: Optional[int] = None) -> "FileWriter":
+        """Start writing a new file, waiting for disk space if the file will not fit.
+
+        Args:
+            name: Unique name of the file
+            expected_size: Expected size of the file in bytes, if known
+
+        Returns:
+            A writer to write the file's contents with
+        """
+        if expected_size is not None and expected_size <= self.memory_threshold:
+            return FileWriter(self, name, reserved=0)
+
+        reserved = expected_size or 0
+        await self._wait_for_disk_space(reserved)
+        self.reserve(reserved)
+        return FileWriter(self, name, reserved=reserved)
+
+    def reserve(self, size: int) -> None:
+        """Reserve disk space for a download in progress, without waiting for it."""
+        self._reserved_bytes += size
+
+    def unreserve(self, size: int) -> None:
+        """Give back disk space reserved for a download."""
+        self._reserved_bytes -= size
+
+    def memory_path(self, path_name: str, size: int) -> Optional[str]:
+        """Path to keep a small file in memory at, None if memory is not available."""
+        if not self.memory_dir:
+            return None
+        if self._memory_bytes + size > self.memory_budget:
+            self.evict(self._memory_bytes + size - self.memory_budget, in_memory=True)
+        if self._memory_bytes + size > self.memory_budget:
+            return None
+        return os.path.join(self.memory_dir, path_name)
+
+    def register(self, path: str, size: int, in_memory: bool) -> None:
+        """Register a newly written file, with one reference."""
+        self._files[path] = _StoredFile(size=size, in_memory=in_memory)
+        if in_memory:
+            self._memory_bytes += size
+        else:
+            self._disk_bytes += size
+
+    def release(self, path: Optional[str]) -> None:
+        """Release a reference to a stored file, making it evictable once unreferenced."""
+        stored = self._files.get(path) if path else None
+        if stored is None or stored.refs == 0:
+            return
+        stored.refs -= 1
+        if stored.refs == 0:
+            self._files.move_to_end(path)
+
+    def evict(self, needed_bytes: int = 0, in_memory: bool = False) -> int:
+        """Delete unreferenced files, least recently released first.
+
+        Args:
+            needed_bytes: Stop once this many bytes are freed, 0 to evict all of them
+            in_memory: Whether to evict files in memory instead of on disk
+
+        Returns:
+            The number of bytes freed
+        """
+        freed = 0
+        for path, stored in list(self._files.items()):
+            if needed_bytes and freed >= needed_bytes:
+                break
+            if stored.refs or stored.in_memory != in_memory:
+                continue
+            self._delete(path)
+            freed += stored.size
+        return freed
+
+    async def _wait_for_disk_space(self, size: int) -> None:
+        """Make room for a file on disk, waiting for releases if eviction is not enough."""
+        deadline = time.monotonic() + self.backpressure_timeout
+        while self.disk_bytes + size > self.disk_budget and self.disk_bytes > 0:
+            self.evict(self.disk_bytes + size - self.disk_budget)
+            if self.disk_bytes + size <= self.disk_budget:
+                return
+            if time.monotonic() > deadline:
+                logger.warning(
+                    f"File store is over its disk budget of {self.disk_budget} bytes for "
+                    f"{self.backpressure_timeout}s, storing a file of {size} bytes anyway"
+                )
+                return
+            await asyncio.sleep(_BACKPRESSURE_POLL_INTERVAL)
+
+    def _delete(self, path: str) -> None:
+        """Delete a stored file and forget it."""
+        stored = self._files.pop(path)
+        if stored.in_memory:
+            self._memory_bytes -= stored.size
+        else:
+            self._disk_bytes -= stored.size
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _create_process_dir(root_dir: str) -> str:
+        """Create the directory of this process, removing those of processes that are gone."""
+        os.makedirs(root_dir, exist_ok=True)
+        for entry in os.listdir(root_dir):
+            if entry.isdigit() and int(entry) != os.getpid() and not _process_exists(int(entry)):
+                shutil.rmtree(os.path.join(root_dir, entry), ignore_errors=True)
+
+        process_dir = os.path.join(root_dir, str(os.getpid()))
+        os.makedirs(process_dir, exist_ok=True)
+        return process_dir
+
+
+class FileWriter:
+    """Writes a file into the store, in memory until it outgrows the memory threshold.
+
+    Usage:
+    -----
+    ```python
+    writer = await file_store.open(name, expected_size=size)
+    try:
+        async for chunk in stream:
+            await writer.write(chunk)
+        path = await writer.commit()
+    except Exception:
+        await writer.discard()
+        raise
+    ```
+    """
+
+    def __init__(self, store: FileStore, path_name: str, reserved: int):
+        """Initialize the writer.
+
+        Args:
+            store: The store the file is written to
+            path_name: Name of the file in the store's directories
+            reserved: Disk space reserved for the file, in bytes
+        """
+        self.store = store
+        self.path_name = path_name
+        self.size = 0
+        self._reserved = reserved
+        self._buffer: Optional[io.BytesIO] = io.BytesIO()
+        self._file = None
+        self._disk_path = os.path.join(store.disk_dir, path_name)
+
+    async def write(self, chunk: bytes) -> None:
+        """Write a chunk, moving the file to disk once it outgrows the memory threshold."""
+        self.size += len(chunk)
+        if self.size > self._reserved and self._reserved:
+            # Larger than expected: grow the reservation, without waiting halfway through
+            self._grow_reservation()
+
+        if self._buffer is not None:
+            if self.size <= self.store.memory_threshold:
+                self._buffer.write(chunk)
+                return
+            await self._spill()
+        await self._file.write(chunk)
+
+    async def commit(self) -> str:
+        """Finish writing and register the file in the store, with one reference.
+
+        Returns:
+            The path of the stored file
+        """
+        if self._buffer is not None:
+            path = self.store.memory_path(self.path_name, self.size)
+            if path and self._write_to_memory(path):
+                self._buffer = None
+                self._release_reservation()
+                self.store.register(path, self.size, in_memory=True)
+                return path
+            await self._spill()
+
+        await self._file.close()
+        self._file = None
+        self._release_reservation()
+        self.store.register(self._disk_path, self.size, in_memory=False)
+        return self._disk_path
+
+    async def discard(self) -> None:
+        """Abort writing and delete what was written."""
+        self._buffer = None
+        if self._file:
+            await self._file.close()
+            self._file = None
+        if os.path.exists(self._disk_path):
+            os.remove(self._disk_path)
+        self._release_reservation()
+
+    def _write_to_memory(self, path: str) -> bool:
+        """Write the buffered contents to the memory directory, False if it is full."""
+        try:
+            with open(path, "wb") as f:
+                f.write(self._buffer.getvalue())
+            return True
+        except OSError as e:
+            # Other processes share the directory, its free space can run out before the budget
+            logger.warning(f"Could not keep {self.path_name} in memory, spilling to disk: {e}")
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return False
+
+    async def _spill(self) -> None:
+        """Move the buffered contents to a file on disk."""
+        if self.size > self._reserved:
+            self._grow_reservation()
+        self._file = await aiofiles.open(self._disk_path, "wb")
+        await self._file.write(self._buffer.getvalue())
+        self._buffer = None
+
+    def _grow_reservation(self) -> None:
+        """Grow the disk space reserved for the file to its current size."""
+        self.store.reserve(self.size - self._reserved)
+        self._reserved = self.size
+
+    def _release_reservation(self) -> None:
+        """Give back the disk space reserved for the file."""
+        self.store.unreserve(self._reserved)
+        self._reserved = 0
+
+
+def _process_exists(pid: int) -> bool:
+    """Whether a process with the given id is running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# Global instance
+file_store = FileStore(
+    root_dir=settings.FILE_STORE_DIR,
+    disk_budget=settings.FILE_STORE_DISK_BUDGET,
+    memory_threshold=settings.FILE_STORE_MEMORY_THRESHOLD,
+)
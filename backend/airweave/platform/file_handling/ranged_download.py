@@ -0,0 +1,343 @@
+"""Resumable file downloads over HTTP range requests."""
+
+import asyncio
+import random
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncGenerator, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from airweave.core.logging import logger
+
+# Size of the first request, and of every part of a parallel download
+DEFAULT_PART_SIZE = 8 * 1024 * 1024  # 8MB
+# Files with more than this many bytes left after the first part are downloaded in parallel
+DEFAULT_PARALLEL_THRESHOLD = 64 * 1024 * 1024  # 64MB
+# Parts of a file downloaded at the same time. Parts are buffered in memory until it is their
+# turn, so this bounds the memory of a download to this many parts.
+DEFAULT_MAX_PARALLEL_PARTS = 4
+# Consecutive failures of a range before the download is given up. Every received byte
+# resets the count, so a long download over a flaky connection still completes.
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_BASE = 1.0  # seconds
+DEFAULT_BACKOFF_MAX = 30.0  # seconds
+
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+
+class IncompleteDownloadError(Exception):
+    """The server ended a range before all of its bytes were sent."""
+
+
+@dataclass
+class _RemoteFile:
+    """What the first response revealed about the file being downloaded."""
+
+    # Whether the server answers range requests, None until the first response
+    ranged: Optional[bool] = None
+    total: Optional[int] = None
+    # Sent as If-Range, so a file that changes halfway is not stitched from two versions
+    validator: Optional[str] = None
+
+
+class RangedDownloader:
+    """Downloads files in ranges, resuming from the last received byte after a failure.
+
+    The first request asks for the first part of the file. If the server answers with
+    206 Partial Content, the rest is requested from where it ended: in one more range, or
+    in parallel parts when much is left. Servers that ignore range requests send the whole
+    file in the first response. Either way, the bytes are yielded in order.
+
+    A range that fails on a network error or a retryable status is requested again from
+    its last received byte, after an exponential backoff. When the server does not support
+    ranges, the file is requested again from the start and the bytes already yielded are
+    skipped.
+
+    Usage:
+    -----
+    ```python
+    async for chunk in ranged_downloader.stream(client, url, headers=headers):
+        await writer.write(chunk)
+    ```
+    """
+
+    def __init__(
+        self,
+        part_size: int = DEFAULT_PART_SIZE,
+        parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+        max_parallel_parts: int = DEFAULT_MAX_PARALLEL_PARTS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ):
+        """Initialize the downloader.
+
+        Args:
+            part_size: Size of the first request and of parallel parts, in bytes
+            parallel_threshold: Minimum size left after the first part to download the rest
+                in parallel parts, in bytes
+            max_parallel_parts: Maximum number of parts of a file downloaded at the same time,
+                1 to never download in parallel
+            max_retries: Maximum number of consecutive failures of a range
+            backoff_base: Delay before the first retry, doubled on every further retry, in
+                seconds
+            backoff_max: Maximum delay before a retry, in seconds
+        """
+        self.part_size = part_size
+        self.parallel_threshold = parallel_threshold
+        self.max_parallel_parts = max_parallel_parts
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    async def stream(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[httpx.Timeout] = None,
+    ) -> AsyncGenerator[bytes, None]:
+        """Download a file, yielding its contents in order.
+
+        Args:
+            client: The client to send the requests with
+            url: URL of the file
+            headers: Headers to send with every request
+            timeout: Timeout of every request, the client's default if None
+
+        Yields:
+            Chunks of the file's contents
+
+        Raises:
+            httpx.HTTPError: When a range still fails after all retries, or fails on a
+                status that is not worth retrying
+        """
+        remote = _RemoteFile()
+        received = 0
+        async for chunk in self._stream_range(
+            client, url, headers, 0, self.part_size - 1, timeout, remote
+        ):
+            received += len(chunk)
+            yield chunk
+
+        # Done if the server sent the whole file, or the file fit in the first part
+        if not remote.ranged or received < self.part_size or remote.total == received:
+            return
+
+        if (
+            remote.total is not None
+            and self.max_parallel_parts > 1
+            and remote.total - received >= self.parallel_threshold
+        ):
+            rest = self._stream_parts(client, url, headers, received, remote.total, timeout, remote)
+        else:
+            rest = self._stream_range(client, url, headers, received, None, timeout, remote)
+        async for chunk in rest:
+            yield chunk
+
+    async def _stream_parts(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        start: int,
+        total: int,
+        timeout: Optional[httpx.Timeout],
+        remote: _RemoteFile,
+    ) -> AsyncGenerator[bytes, None]:
+        """Download the rest of a file in parallel parts, yielding them in order."""
+        ranges = deque(
+            (part_start, min(part_start + self.part_size, total) - 1)
+            for part_start in range(start, total, self.part_size)
+        )
+        parts: deque[asyncio.Task] = deque()
+        try:
+            while ranges or parts:
+                while ranges and len(parts) < self.max_parallel_parts:
+                    part_start, part_end = ranges.popleft()
+                    parts.append(
+                        asyncio.create_task(
+                            self._fetch_part(
+                                client, url, headers, part_start, part_end, timeout, remote
+                            )
+                        )
+                    )
+                yield await parts.popleft()
+        finally:
+            for part in parts:
+                part.cancel()
+            await asyncio.gather(*parts, return_exceptions=True)
+
+    async def _fetch_part(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        start: int,
+        end: int,
+        timeout: Optional[httpx.Timeout],
+        remote: _RemoteFile,
+    ) -> bytes:
+        """Download a part of a file into memory."""
+        return b"".join(
+            [
+                chunk
+                async for chunk in self._stream_range(
+                    client, url, headers, start, end, timeout, remote
+                )
+            ]
+        )
+
+    async def _stream_range(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        start: int,
+        end: Optional[int],
+        timeout: Optional[httpx.Timeout],
+        remote: _RemoteFile,
+    ) -> AsyncGenerator[bytes, None]:
+        """Download the bytes from `start` to `end`, or to the end of the file if None.
+
+        Failed attempts are retried from the last received byte.
+        """
+        position = start
+        failures = 0
+        while True:
+            try:
+                async with client.stream(
+                    "GET",
+                    url,
+                    headers=self._range_headers(headers, position, end, remote),
+                    follow_redirects=True,
+                    timeout=timeout,
+                ) as response:
+                    if self._past_end_of_file(response, position, remote):
+                        return
+                    skip = self._check_response(response, position, remote)
+                    if remote.ranged is False:
+                        # The server ignores ranges, read the whole file instead
+                        end = None
+                    async for chunk in response.aiter_bytes():
+                        chunk, skip = self._trim(chunk, skip, position, end)
+                        if chunk:
+                            position += len(chunk)
+                            failures = 0
+                            yield chunk
+                    if response.status_code == 206:
+                        self._check_complete(position, end, remote)
+                return
+            except Exception as e:
+                failures += 1
+                if failures > self.max_retries or not self._is_retryable(e):
+                    raise
+                delay = self._backoff(failures, e)
+                logger.warning(
+                    f"Download from {urlsplit(url).netloc} failed at byte {position} "
+                    f"({type(e).__name__}: {e}), retry {failures}/{self.max_retries} "
+                    f"in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _range_headers(
+        headers: Optional[Dict[str, str]], start: int, end: Optional[int], remote: _RemoteFile
+    ) -> Dict[str, str]:
+        """Headers of a request for a range of a file."""
+        range_headers = {
+            **(headers or {}),
+            "Range": f"bytes={start}-{'' if end is None else end}",
+            # Ranges of a compressed response cannot be decompressed on their own
+            "Accept-Encoding": "identity",
+        }
+        if remote.validator:
+            range_headers["If-Range"] = remote.validator
+        return range_headers
+
+    @staticmethod
+    def _past_end_of_file(response: httpx.Response, position: int, remote: _RemoteFile) -> bool:
+        """Whether the server rejected the range for starting past the end of the file.
+
+        Happens for empty files, and for files that are exactly the size of the first part
+        when the server did not send their total size.
+        """
+        if response.status_code != 416:
+            return False
+        return remote.total is None or position >= remote.total
+
+    @staticmethod
+    def _check_response(response: httpx.Response, position: int, remote: _RemoteFile) -> int:
+        """Check a response, returning the number of bytes to skip at its start."""
+        response.raise_for_status()
+
+        if response.status_code != 206:
+            if remote.ranged:
+                # With If-Range, a full response means the file changed since the first part
+                raise ValueError("File changed on the server while it was being downloaded")
+            # The server ignores ranges and sends the whole file, including what was received
+            remote.ranged = False
+            return position
+
+        match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+        if not match or int(match.group(1)) != position:
+            raise ValueError(
+                f"Server sent range {response.headers.get('Content-Range')!r}, "
+                f"expected one starting at byte {position}"
+            )
+        if remote.ranged is None:
+            remote.ranged = True
+            remote.total = int(match.group(2)) if match.group(2) != "*" else None
+            etag = response.headers.get("ETag")
+            # Weak ETags are not allowed in If-Range
+            if etag and not etag.startswith("W/"):
+                remote.validator = etag
+            else:
+                remote.validator = response.headers.get("Last-Modified")
+        return 0
+
+    @staticmethod
+    def _trim(chunk: bytes, skip: int, position: int, end: Optional[int]) -> tuple[bytes, int]:
+        """Cut the bytes to skip and those past the end of the range from a chunk."""
+        if skip:
+            skipped = min(skip, len(chunk))
+            chunk = chunk[skipped:]
+            skip -= skipped
+        if end is not None:
+            chunk = chunk[: max(0, end + 1 - position)]
+        return chunk, skip
+
+    @staticmethod
+    def _check_complete(position: int, end: Optional[int], remote: _RemoteFile) -> None:
+        """Raise if a partial response ended before the end of its range."""
+        expected = end + 1 if end is not None else remote.total
+        if remote.total is not None and expected is not None:
+            expected = min(expected, remote.total)
+        if expected is not None and position < expected:
+            raise IncompleteDownloadError(f"Range ended at byte {position} of {expected}")
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Whether a failed range is worth requesting again."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRYABLE_STATUS_CODES
+        return isinstance(error, (httpx.TransportError, IncompleteDownloadError))
+
+    def _backoff(self, failures: int, error: Exception) -> float:
+        """Delay before the next attempt, honoring the server's Retry-After."""
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (failures - 1))
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = error.response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), self.backoff_max))
+        # Jitter, so the parts of a file do not retry in lockstep
+        return delay * random.uniform(1.0, 1.25)
+
+
+# Global instance
+ranged_downloader = RangedDownloader()
@@ -0,0 +1,174 @@
+"""Process-wide registry of pooled HTTP clients."""
+
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, AsyncGenerator, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from airweave.core.logging import logger
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # HTTP/2 needs the h2 package, clients fall back to HTTP/1.1
+    HTTP2_AVAILABLE = False
+
+# Pool limits of every client, tuned for many concurrent downloads and API calls per host
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0
+)
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+
+@dataclass
+class ClientStats:
+    """Connection usage of a pooled client."""
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of requests that were sent over an already open connection."""
+        if not self.requests:
+            return 0.0
+        return max(0.0, 1 - self.connections_opened / self.requests)
+
+
+class HttpClientRegistry:
+    """Shares keep-alive HTTP clients between all syncs of the process.
+
+    There is one client per host and auth scope, so requests to the same host reuse open
+    connections (and with HTTP/2, multiplex over them) instead of paying a TLS handshake
+    each. Clients never store cookies, since they are shared between organizations:
+    authentication must be passed with every request. Clients are bound to the event loop
+    that created them, so every loop gets its own.
+
+    Usage:
+    -----
+    ```python
+    async with http_clients.borrow("https://www.googleapis.com") as client:
+        response = await client.get(url, headers={"Authorization": f"Bearer {token}"})
+    ```
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        http2: bool = HTTP2_AVAILABLE,
+    ):
+        """Initialize the registry.
+
+        Args:
+            limits: Connection pool limits of every client
+            timeout: Default timeouts of every client, requests can override them
+            http2: Whether to negotiate HTTP/2 with hosts that support it
+        """
+        self.limits = limits
+        self.timeout = timeout
+        self.http2 = http2
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple[str, Optional[str]], httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+        self._stats: dict[tuple[str, Optional[str]], ClientStats] = {}
+
+    def get(self, url: str, scope: Optional[str] = None) -> httpx.AsyncClient:
+        """Get the shared client for the host of a URL, creating it on first use.
+
+        The client must not be closed by the caller.
+
+        Args:
+            url: A URL on the host, or the host itself
+            scope: Auth scope to keep apart from other clients of the host, e.g. when
+                requests carry credentials in the client configuration
+
+        Returns:
+            The shared client
+        """
+        key = (self._host(url), scope)
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = self._create_client(key)
+            clients[key] = client
+        return client
+
+    @asynccontextmanager
+    async def borrow(
+        self, url: str, scope: Optional[str] = None
+    ) -> AsyncGenerator[httpx.AsyncClient, None]:
+        """Use the shared client for a host within a block, leaving it open afterwards.
+
+        A drop-in replacement for `async with httpx.AsyncClient() as client`.
+        """
+        yield self.get(url, scope)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Connection usage per client: open connections, requests and reuse ratio."""
+        open_connections: dict[tuple[str, Optional[str]], int] = {}
+        for clients in list(self._clients.values()):
+            for key, client in clients.items():
+                open_connections[key] = open_connections.get(key, 0) + self._open_connections(
+                    client
+                )
+
+        return {
+            f"{host}[{scope}]" if scope else host: {
+                "connections_open": open_connections.get((host, scope), 0),
+                "connections_opened": stats.connections_opened,
+                "requests": stats.requests,
+                "reuse_ratio": round(stats.reuse_ratio, 3),
+            }
+            for (host, scope), stats in self._stats.items()
+        }
+
+    async def aclose(self) -> None:
+        """Close the clients of the running event loop."""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        logger.info(f"Closing {len(clients)} HTTP clients, usage: {self.stats()}")
+        for client in clients.values():
+            await client.aclose()
+
+    def _create_client(self, key: tuple[str, Optional[str]]) -> httpx.AsyncClient:
+        """Create the client for a host and scope, instrumented to count connections."""
+        stats = self._stats.setdefault(key, ClientStats())
+
+        async def trace(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                stats.connections_opened += 1
+
+        async def on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            request.extensions["trace"] = trace
+
+        return httpx.AsyncClient(
+            http2=self.http2,
+            limits=self.limits,
+            timeout=self.timeout,
+            # Drop all cookies, a client is shared by every sync talking to the host
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            event_hooks={"request": [on_request]},
+        )
+
+    @staticmethod
+    def _host(url: str) -> str:
+        """The host of a URL, or the value itself if it is no URL."""
+        return urlsplit(url).netloc or url
+
+    @staticmethod
+    def _open_connections(client: httpx.AsyncClient) -> int:
+        """Number of connections in a client's pool."""
+        # httpx has no public API for the pool, this reads it from the default transport
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        return len(getattr(pool, "connections", []))
+
+
+# Global instance
+http_clients = HttpClientRegistry()
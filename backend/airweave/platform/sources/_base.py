@@ -1,12 +1,22 @@
 """Base source class."""
 
 from abc import abstractmethod
-from typing import Any, AsyncGenerator, ClassVar, List, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    List,
+    Optional,
+)
 
 from pydantic import BaseModel
 
 from airweave.core.logging import logger
-from airweave.platform.entities._base import ChunkEntity
+from airweave.platform.entities._base import BaseEntity, ChunkEntity, FileEntity
+from airweave.platform.file_handling.download_manager import DownloadManager
 from airweave.platform.file_handling.file_manager import file_manager
 
 
@@ -15,6 +25,10 @@ class BaseSource:
 
     # Class variables for integration metadata
     _labels: ClassVar[List[str]] = []
+    # Sources that keep their resume cursor current set this to True
+    _supports_resume: ClassVar[bool] = False
+    # Sources that implement `get_change_cursor` and `generate_changes` set this to True
+    _supports_incremental: ClassVar[bool] = False
 
     @classmethod
     @abstractmethod
@@ -32,6 +46,157 @@ class BaseSource:
         """Generate entities for the source."""
         pass
 
+    @property
+    def supports_resume(self) -> bool:
+        """Whether the source keeps a resume cursor, see `set_resume_cursor`."""
+        return self._supports_resume
+
+    @property
+    def resume_cursor(self) -> Optional[dict]:
+        """The position to resume `generate_entities` from, None to start at the beginning.
+
+        While `process_file_entities` prefetches, this is the cursor that only covers the
+        entities it has yielded, not the one the source set last.
+        """
+        held_cursor = getattr(self, "_held_resume_cursor", None)
+        if held_cursor is not None:
+            return held_cursor[0]
+        return getattr(self, "_resume_cursor", None)
+
+    def set_resume_cursor(self, cursor: Optional[dict]) -> None:
+        """Set the position to resume `generate_entities` from.
+
+        Before a run, the orchestrator sets the cursor of the last durable checkpoint of a
+        failed job. During a run, a source that supports resuming keeps the cursor current:
+        it sets a new cursor right before yielding the first entity that resuming from that
+        cursor would yield again (e.g. before the entities of a new page). The cursor is
+        opaque to the orchestrator, but must be JSON serializable.
+
+        Args:
+            cursor: The resume position, e.g. a page token or a table and key
+        """
+        self._resume_cursor = cursor
+
+    @property
+    def supports_incremental(self) -> bool:
+        """Whether the source can generate only the changes since a change cursor."""
+        return self._supports_incremental
+
+    @property
+    def change_cursor(self) -> Optional[dict]:
+        """The change cursor a completed `generate_changes` moved to."""
+        return getattr(self, "_change_cursor", None)
+
+    def set_change_cursor(self, cursor: dict) -> None:
+        """Set the change cursor to read the next changes from.
+
+        Called by `generate_changes` once it has yielded all changes.
+
+        Args:
+            cursor: The new position in the change feed, must be JSON serializable
+        """
+        self._change_cursor = cursor
+
+    async def get_change_cursor(self) -> dict:
+        """Get the current position in the change feed of the source.
+
+        Called right before a full sync, so changes made while the full sync runs are
+        read by the next incremental run.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support incremental sync")
+
+    async def generate_changes(self, cursor: dict) -> AsyncGenerator[BaseEntity, None]:
+        """Generate the entities that changed since a change cursor.
+
+        Yields new and updated entities as `generate_entities` would, and a
+        `DeletedEntity` for every entity that was removed. Once all changes are yielded,
+        the new cursor is set with `set_change_cursor`.
+
+        Args:
+            cursor: The change cursor stored by the previous run
+
+        Raises:
+            CursorExpiredError: If the source can no longer read changes from the cursor,
+                the orchestrator then falls back to a full sync
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support incremental sync")
+
+    async def process_file_entities(
+        self,
+        entities: AsyncIterator[BaseEntity],
+        download: Optional[Callable[[FileEntity], Awaitable[Optional[BaseEntity]]]] = None,
+    ) -> AsyncGenerator[BaseEntity, None]:
+        """Download the files among a stream of entities concurrently.
+
+        Entities are yielded as their downloads complete, other entities pass through.
+        Since entities can overtake each other, the resume cursor is held back to the one
+        set before the oldest entity not yet yielded, so resuming never skips an entity
+        that was still downloading.
+
+        Args:
+            entities: The entities to process, file entities not yet downloaded
+            download: Coroutine function downloading a file entity, `process_file_entity`
+                by default
+
+        Yields:
+            The entities, leaving out files that could not be downloaded
+        """
+        download = download or self.process_file_entity
+        # Cursor set before each entity, for the entities not yet yielded, in source order
+        cursors: dict[int, Optional[dict]] = {}
+
+        async def numbered() -> AsyncGenerator[tuple[int, BaseEntity], None]:
+            seq = 0
+            async for entity in entities:
+                cursors[seq] = getattr(self, "_resume_cursor", None)
+                yield seq, entity
+                seq += 1
+
+        async def fetch(item: tuple[int, BaseEntity]) -> tuple[int, Optional[BaseEntity]]:
+            seq, entity = item
+            if isinstance(entity, FileEntity):
+                return seq, await download(entity)
+            return seq, entity
+
+        def size(item: tuple[int, BaseEntity]) -> int:
+            return getattr(item[1], "size", None) or 0
+
+        try:
+            async for seq, entity in DownloadManager().prefetch(numbered(), fetch, size):
+                self._held_resume_cursor = (next(iter(cursors.values())),)
+                del cursors[seq]
+                if entity is not None:
+                    yield entity
+        finally:
+            self._held_resume_cursor = None
+
+    @property
+    def download_failures(self) -> int:
+        """Number of files `process_file_entity` failed to download during the run."""
+        return getattr(self, "_download_failures", 0)
+
+    def set_entity_index(self, entity_index: Any) -> None:
+        """Set the index of the entities the sync has stored.
+
+        Set by the sync context before a run, so `process_file_entity` can skip downloading
+        files whose fingerprint did not change.
+
+        Args:
+            entity_index: The `EntityHashIndex` of the sync
+        """
+        self._entity_index = entity_index
+
+    def is_file_unchanged(self, file_entity: FileEntity) -> bool:
+        """Whether a file is stored with the same source fingerprint as it has now.
+
+        The orchestrator makes the same comparison and keeps such files as they are, so
+        they do not need to be downloaded.
+        """
+        entity_index = getattr(self, "_entity_index", None)
+        if entity_index is None or not file_entity.fingerprint:
+            return False
+        return not entity_index.has_changed(file_entity.entity_id, file_entity.hash())
+
     async def process_file_entity(
         self, file_entity, download_url=None, access_token=None, headers=None
     ) -> Optional[ChunkEntity]:
@@ -60,6 +225,10 @@ class BaseSource:
             logger.error(f"No access token provided for file {file_entity.name}")
             raise ValueError(f"No access token available for processing file {file_entity.name}")
 
+        if self.is_file_unchanged(file_entity):
+            logger.info(f"Skipping download of unchanged file: {file_entity.name}")
+            return file_entity
+
         logger.info(f"Processing file entity: {file_entity.name}")
 
         try:
@@ -84,6 +253,8 @@ class BaseSource:
             return processed_entity
         except Exception as e:
             logger.error(f"Error processing file {file_entity.name}: {e}")
+            # The file still exists at the source, the sync must not delete it as an orphan
+            self._download_failures = self.download_failures + 1
             return None
 
 
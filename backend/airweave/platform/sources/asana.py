@@ -17,6 +17,7 @@ from airweave.platform.entities.asana import (
     AsanaTaskEntity,
     AsanaWorkspaceEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -276,7 +277,7 @@ class AsanaSource(BaseSource):
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate all entities from Asana."""
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://app.asana.com") as client:
             async for workspace_entity in self._generate_workspace_entities(client):
                 yield workspace_entity
 
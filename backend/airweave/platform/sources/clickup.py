@@ -29,6 +29,7 @@ from airweave.platform.entities.clickup import (
     ClickUpTaskEntity,
     ClickUpWorkspaceEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -137,7 +138,7 @@ class ClickUpSource(BaseSource):
     async def generate_entities(self) -> AsyncGenerator[Any, None]:
         """Generate all ClickUp entities (Workspaces, Spaces, Folders, Lists, Tasks, Comments)."""
         print("Generating ClickUp entities")
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.clickup.com") as client:
             # Generate Workspace entities
             async for workspace in self._fetch_workspaces(client):
                 print(f"Generating Workspace entity: {workspace}")
@@ -34,6 +34,7 @@ from airweave.platform.entities.confluence import (
     ConfluencePageEntity,
     ConfluenceSpaceEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -68,7 +69,7 @@ class ConfluenceSource(BaseSource):
         Returns:
             list[dict]: List of accessible resources, each containing 'id' and 'url' keys
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.atlassian.com") as client:
             headers = {"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
             try:
                 response = await client.get(
@@ -380,7 +381,7 @@ class ConfluenceSource(BaseSource):
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:  # noqa: C901
         """Generate all Confluence content."""
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.atlassian.com") as client:
             # 1) Yield all spaces (top-level)
             async for space_entity in self._generate_space_entities(client):
                 yield space_entity
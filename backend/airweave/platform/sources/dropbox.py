@@ -1,6 +1,6 @@
 """Dropbox source implementation."""
 
-from typing import AsyncGenerator, Dict, List, Tuple
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
 
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -14,6 +14,7 @@ from airweave.platform.entities.dropbox import (
     DropboxFileEntity,
     DropboxFolderEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -24,7 +25,13 @@ from airweave.platform.sources._base import BaseSource
     labels=["File Storage"],
 )
 class DropboxSource(BaseSource):
-    """Dropbox source implementation."""
+    """Dropbox source implementation.
+
+    Resumable: the resume cursor is the top-level folder being processed, as
+    {"account_id": ..., "folder": path}, where an empty path stands for the root files.
+    """
+
+    _supports_resume = True
 
     @classmethod
     async def create(cls, access_token: str) -> "DropboxSource":
@@ -328,6 +335,7 @@ class DropboxSource(BaseSource):
             server_modified=server_modified,
             is_downloadable=entry.get("is_downloadable", True),
             content_hash=entry.get("content_hash"),
+            fingerprint=entry.get("content_hash"),
             # Additional optional fields
             sharing_info=sharing_info,
             has_explicit_shared_members=entry.get("has_explicit_shared_members"),
@@ -336,7 +344,10 @@ class DropboxSource(BaseSource):
     async def _generate_file_entities(
         self, client: httpx.AsyncClient, folder_breadcrumbs: List[Breadcrumb], folder_path: str = ""
     ) -> AsyncGenerator[ChunkEntity, None]:
-        """Generate file entities within a given folder using the Dropbox API."""
+        """Generate file entities within a given folder using the Dropbox API.
+
+        The files are not downloaded yet.
+        """
         # Use list_folder API to get files in the folder
         url = "https://api.dropboxapi.com/2/files/list_folder"
         continue_url = "https://api.dropboxapi.com/2/files/list_folder/continue"
@@ -363,25 +374,9 @@ class DropboxSource(BaseSource):
                         )
                         continue
 
-                    # Create file entity with Dropbox-specific download metadata
-                    file_entity = self._create_file_entity(entry, folder_breadcrumbs)
-
-                    try:
-                        # Use the BaseSource helper method instead of direct file_manager calls
-                        processed_entity = await self.process_file_entity(
-                            file_entity=file_entity,
-                            access_token=self.access_token,
-                            headers=file_entity.sync_metadata.get("headers"),
-                        )
-
-                        # Only yield if the file wasn't skipped due to size limits
-                        if processed_entity:
-                            yield processed_entity
-
-                    except Exception as e:
-                        logger.error(f"Failed to process file {file_entity.name}: {str(e)}")
-                        # Continue with other files even if one fails
-                        continue
+                    # Create file entity with Dropbox-specific download metadata, it is
+                    # downloaded by `generate_entities`
+                    yield self._create_file_entity(entry, folder_breadcrumbs)
 
         except Exception as e:
             logger.error(f"Error listing files in Dropbox folder {folder_path}: {str(e)}")
@@ -452,6 +447,14 @@ class DropboxSource(BaseSource):
             logger.error(f"Error processing folder {folder_path}: {str(e)}")
             raise
 
+    async def _download_file(self, file_entity: DropboxFileEntity) -> Optional[ChunkEntity]:
+        """Download a file with the Dropbox-specific headers stored on its entity."""
+        return await self.process_file_entity(
+            file_entity=file_entity,
+            access_token=self.access_token,
+            headers=file_entity.sync_metadata.get("headers"),
+        )
+
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Recursively generate all entities from Dropbox.
 
@@ -459,42 +462,94 @@ class DropboxSource(BaseSource):
             A sequence of entities in the following order:
             1. Account-level entities
             2. For each folder (including root), folder entity and its contents recursively
+
+        Files are downloaded concurrently, so they can come out of this order.
+
+        When resuming, the account entity is yielded again, and processing continues at the
+        folder of the resume cursor.
         """
-        async with httpx.AsyncClient() as client:
-            # 1. Account(s)
-            async for account_entity in self._generate_account_entities(client):
-                yield account_entity
-
-                account_breadcrumb = Breadcrumb(
-                    entity_id=account_entity.account_id,
-                    name=account_entity.name,
-                    type="account",
-                )
+        resume_cursor = self.resume_cursor
+        async with http_clients.borrow("https://api.dropboxapi.com") as client:
+            async for entity in self.process_file_entities(
+                self._list_entities(client, resume_cursor), download=self._download_file
+            ):
+                yield entity
+
+    async def _list_entities(
+        self, client: httpx.AsyncClient, resume_cursor: Optional[Dict]
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Recursively list all entities from Dropbox, without downloading files."""
+        # 1. Account(s)
+        async for account_entity in self._generate_account_entities(client):
+            yield account_entity
+
+            resume_folder = None
+            if resume_cursor and resume_cursor["account_id"] == account_entity.account_id:
+                resume_folder = resume_cursor["folder"]
+
+            account_breadcrumb = Breadcrumb(
+                entity_id=account_entity.account_id,
+                name=account_entity.name,
+                type="account",
+            )
 
-                # Create breadcrumbs list with just the account
-                account_breadcrumbs = [account_breadcrumb]
+            # Create breadcrumbs list with just the account
+            account_breadcrumbs = [account_breadcrumb]
 
-                # 2. Process root directory first (for files in root)
+            # 2. Process root directory first (for files in root), unless a resumed run
+            #    got past them
+            if not resume_folder:
+                self.set_resume_cursor({"account_id": account_entity.account_id, "folder": ""})
                 async for file_entity in self._generate_file_entities(
                     client, account_breadcrumbs, ""
                 ):
                     yield file_entity
 
-                # 3. Process all folders recursively starting from root
-                async for folder_entity in self._generate_folder_entities(
-                    client, account_breadcrumb
+            # 3. Process all folders recursively starting from root
+            folder_entities = self._generate_folder_entities(client, account_breadcrumb)
+            if resume_folder:
+                folder_entities = self._skip_to_folder(folder_entities, resume_folder)
+            async for folder_entity in folder_entities:
+                # Resuming from here processes this folder again
+                self.set_resume_cursor(
+                    {
+                        "account_id": account_entity.account_id,
+                        "folder": folder_entity.path_lower,
+                    }
+                )
+                yield folder_entity
+
+                folder_breadcrumb = Breadcrumb(
+                    entity_id=folder_entity.folder_id,
+                    name=folder_entity.name,
+                    type="folder",
+                )
+                folder_breadcrumbs = [account_breadcrumb, folder_breadcrumb]
+
+                # Process all subfolders and their files recursively
+                async for entity in self._process_folder_and_contents(
+                    client, folder_entity.path_lower, folder_breadcrumbs
                 ):
-                    yield folder_entity
+                    yield entity
 
-                    folder_breadcrumb = Breadcrumb(
-                        entity_id=folder_entity.folder_id,
-                        name=folder_entity.name,
-                        type="folder",
-                    )
-                    folder_breadcrumbs = [account_breadcrumb, folder_breadcrumb]
+    async def _skip_to_folder(
+        self, folder_entities: AsyncGenerator[DropboxFolderEntity, None], folder_path: str
+    ) -> AsyncGenerator[DropboxFolderEntity, None]:
+        """Skip the folders a resumed run has already processed.
 
-                    # Process all subfolders and their files recursively
-                    async for entity in self._process_folder_and_contents(
-                        client, folder_entity.path_lower, folder_breadcrumbs
-                    ):
-                        yield entity
+        The folders are listed up front, so a folder that no longer exists can be detected
+        before anything is skipped.
+        """
+        folders = [folder_entity async for folder_entity in folder_entities]
+        start: Optional[int] = next(
+            (i for i, folder in enumerate(folders) if folder.path_lower == folder_path), None
+        )
+        if start is None:
+            # The folder is gone, process all folders rather than risk skipping files
+            logger.warning(f"Resume folder {folder_path} not found, processing all folders")
+            start = 0
+        else:
+            logger.info(f"Resuming Dropbox sync at folder {folder_path}")
+
+        for folder_entity in folders[start:]:
+            yield folder_entity
@@ -25,6 +25,7 @@ from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
 from airweave.platform.entities._base import Breadcrumb, ChunkEntity
 from airweave.platform.entities.github import GithubContentEntity, GithubRepoEntity
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -201,7 +202,7 @@ class GithubSource(BaseSource):
           - Repositories
             - Contents (files/directories) for each repository
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.github.com") as client:
             # 1) Yield repo entities
             async for repo_entity in self._generate_repo_entities(client):
                 yield repo_entity
@@ -25,6 +25,7 @@ from airweave.platform.entities.gmail import (
     GmailMessageEntity,
     GmailThreadEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -413,7 +414,7 @@ class GmailSource(BaseSource):
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate all Gmail entities: Labels, Threads (Messages), Drafts."""
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://gmail.googleapis.com") as client:
             # 1) Generate label entities
             async for label_entity in self._generate_label_entities(client):
                 yield label_entity
@@ -28,6 +28,7 @@ from airweave.platform.entities.google_calendar import (
     GoogleCalendarFreeBusyEntity,
     GoogleCalendarListEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -220,7 +221,7 @@ class GoogleCalendarSource(BaseSource):
           - Events for each calendar
           - FreeBusy data for each calendar (7-day window)
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://www.googleapis.com") as client:
             # 1) Get the user's calendarList
             #    For each item, yield a CalendarList entity and store in memory for subsequent calls
             calendar_list_entries: List[GoogleCalendarListEntity] = []
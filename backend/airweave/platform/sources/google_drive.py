@@ -12,19 +12,31 @@ entities/google_drive.py.
 References:
     https://developers.google.com/drive/api/v3/reference/drives (Shared drives)
     https://developers.google.com/drive/api/v3/reference/files  (Files)
+    https://developers.google.com/drive/api/v3/reference/changes  (Changes)
 """
 
 from typing import AsyncGenerator, Dict, Optional
 
 import httpx
 
+from airweave.core.exceptions import CursorExpiredError
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
-from airweave.platform.entities._base import ChunkEntity
+from airweave.platform.entities._base import BaseEntity, ChunkEntity, DeletedEntity
 from airweave.platform.entities.google_drive import GoogleDriveDriveEntity, GoogleDriveFileEntity
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
+# File fields requested from the files and changes endpoints
+FILE_FIELDS = (
+    "id, name, mimeType, description, starred, trashed, explicitlyTrashed, parents, shared, "
+    "webViewLink, iconLink, createdTime, modifiedTime, size, md5Checksum, webContentLink"
+)
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+# Status codes of the changes endpoint for a page token it no longer accepts
+EXPIRED_PAGE_TOKEN_STATUS_CODES = {400, 404, 410}
+
 
 @source(
     "Google Drive",
@@ -39,8 +51,18 @@ class GoogleDriveSource(BaseSource):
       - GoogleDriveDriveEntity objects, representing shared drives
       - GoogleDriveFileEntity objects, representing files in each shared drive
       - GoogleDriveFileEntity objects, representing files in the user's My Drive
+
+    Resumable: the resume cursor is the file listing page being processed, as
+    {"corpora": "drive" | "user", "drive_id": ..., "page_token": ...}.
+
+    Incremental: the change cursor is a page token of the changes feed, as
+    {"page_token": ...}. Only file changes are read, new shared drives are picked up by the
+    next full sync.
     """
 
+    _supports_resume = True
+    _supports_incremental = True
+
     @classmethod
     async def create(cls, access_token: str) -> "GoogleDriveSource":
         """Create a new Google Drive source instance with the provided OAuth access token."""
@@ -104,6 +126,7 @@ class GoogleDriveSource(BaseSource):
         include_all_drives: bool,
         drive_id: Optional[str] = None,
         context: str = "",
+        page_token: Optional[str] = None,
     ) -> AsyncGenerator[Dict, None]:
         """Generic method to list files with configurable parameters.
 
@@ -113,6 +136,7 @@ class GoogleDriveSource(BaseSource):
             include_all_drives: Whether to include items from all drives
             drive_id: ID of the shared drive to list files from (only for corpora="drive")
             context: Context string for logging
+            page_token: Page to start listing from, used to resume
         """
         url = "https://www.googleapis.com/drive/v3/files"
         params = {
@@ -120,17 +144,21 @@ class GoogleDriveSource(BaseSource):
             "corpora": corpora,
             "includeItemsFromAllDrives": str(include_all_drives).lower(),
             "supportsAllDrives": "true",
-            "q": "mimeType != 'application/vnd.google-apps.folder'",
-            "fields": "nextPageToken, files(id, name, mimeType, description, starred, trashed, "
-            "explicitlyTrashed, parents, shared, webViewLink, iconLink, createdTime, "
-            "modifiedTime, size, md5Checksum, webContentLink)",
+            "q": f"mimeType != '{FOLDER_MIME_TYPE}'",
+            "fields": f"nextPageToken, files({FILE_FIELDS})",
         }
 
         if drive_id:
             params["driveId"] = drive_id
+        if page_token:
+            params["pageToken"] = page_token
 
         while url:
             data = await self._get_with_auth(client, url, params=params)
+            # Resuming from here lists this page again
+            self.set_resume_cursor(
+                {"corpora": corpora, "drive_id": drive_id, "page_token": params.get("pageToken")}
+            )
             for file_obj in data.get("files", []):
                 log_context = f"drive_id {drive_id}" if drive_id else "MY DRIVE"
                 logger.info(f"\nfiles in {log_context}: {file_obj}\n")
@@ -190,6 +218,8 @@ class GoogleDriveSource(BaseSource):
             modified_time=file_obj.get("modifiedTime"),
             size=int(file_obj["size"]) if file_obj.get("size") else None,
             md5_checksum=file_obj.get("md5Checksum"),
+            # Google Workspace files have no MD5, their modified time changes on every edit
+            fingerprint=file_obj.get("md5Checksum") or file_obj.get("modifiedTime"),
         )
 
     async def _generate_file_entities(
@@ -199,31 +229,31 @@ class GoogleDriveSource(BaseSource):
         include_all_drives: bool,
         drive_id: Optional[str] = None,
         context: str = "",
+        page_token: Optional[str] = None,
     ) -> AsyncGenerator[ChunkEntity, None]:
-        """Generate file entities from a file listing."""
+        """Generate file entities from a file listing, downloading the files concurrently."""
+        file_entities = self._build_file_entities(
+            client, corpora, include_all_drives, drive_id, context, page_token
+        )
+        async for file_entity in self.process_file_entities(file_entities):
+            yield file_entity
+
+    async def _build_file_entities(
+        self,
+        client: httpx.AsyncClient,
+        corpora: str,
+        include_all_drives: bool,
+        drive_id: Optional[str] = None,
+        context: str = "",
+        page_token: Optional[str] = None,
+    ) -> AsyncGenerator[GoogleDriveFileEntity, None]:
+        """Build the file entities of a file listing, without downloading them."""
         async for file_obj in self._list_files(
-            client, corpora, include_all_drives, drive_id, context
+            client, corpora, include_all_drives, drive_id, context, page_token
         ):
             try:
                 # Get file entity (might be None for trashed files)
                 file_entity = self._build_file_entity(file_obj)
-
-                # Skip if the entity was None (likely a trashed file)
-                if not file_entity:
-                    continue
-
-                # Process the entity if it has a download URL
-                if file_entity.download_url:
-                    processed_entity = await self.process_file_entity(
-                        file_entity=file_entity, access_token=self.access_token
-                    )
-
-                    # Only yield if the file wasn't skipped due to size limits
-                    if processed_entity:
-                        yield processed_entity
-                else:
-                    # This should never happen now that we return None for files without URLs
-                    logger.warning(f"No download URL available for {file_entity.name}")
             except Exception as e:
                 error_context = f"in drive {drive_id}" if drive_id else "in MY DRIVE"
                 logger.error(
@@ -232,6 +262,17 @@ class GoogleDriveSource(BaseSource):
                 )
                 raise
 
+            # Skip if the entity was None (likely a trashed file)
+            if not file_entity:
+                continue
+
+            if not file_entity.download_url:
+                # This should never happen now that we return None for files without URLs
+                logger.warning(f"No download URL available for {file_entity.name}")
+                continue
+
+            yield file_entity
+
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate all Google Drive entities.
 
@@ -239,8 +280,12 @@ class GoogleDriveSource(BaseSource):
           - Shared drives (Drive objects)
           - Files in each shared drive
           - Files in My Drive (corpora=user)
+
+        When resuming, drive entities are yielded again, and file listings start at the
+        page of the resume cursor.
         """
-        async with httpx.AsyncClient() as client:
+        resume_cursor = self.resume_cursor
+        async with http_clients.borrow("https://www.googleapis.com") as client:
             # For testing: count file entities yielded
             file_entity_count = 0
             # Testing flag - set to True to stop after first file entity
@@ -256,6 +301,10 @@ class GoogleDriveSource(BaseSource):
             async for drive_obj in self._list_drives(client):
                 drive_ids.append(drive_obj["id"])
 
+            drive_ids, drive_page_token, my_drive_page_token = self._apply_resume_cursor(
+                drive_ids, resume_cursor
+            )
+
             for drive_id in drive_ids:
                 async for file_entity in self._generate_file_entities(
                     client,
@@ -263,6 +312,7 @@ class GoogleDriveSource(BaseSource):
                     include_all_drives=True,
                     drive_id=drive_id,
                     context=f"drive {drive_id}",
+                    page_token=drive_page_token if drive_id == drive_ids[0] else None,
                 ):
                     yield file_entity
                     file_entity_count += 1
@@ -274,10 +324,112 @@ class GoogleDriveSource(BaseSource):
             # Only reach here if we didn't find any files in shared drives
             if not (stop_after_first_file and file_entity_count >= 4):
                 async for mydrive_file_entity in self._generate_file_entities(
-                    client, corpora="user", include_all_drives=False, context="MY DRIVE"
+                    client,
+                    corpora="user",
+                    include_all_drives=False,
+                    context="MY DRIVE",
+                    page_token=my_drive_page_token,
                 ):
                     yield mydrive_file_entity
                     file_entity_count += 1
                     if stop_after_first_file and file_entity_count >= 4:
                         logger.info("Stopping after first file entity for testing purposes")
                         return
+
+    async def get_change_cursor(self) -> Dict:
+        """Get the page token of the changes feed as of now."""
+        async with http_clients.borrow("https://www.googleapis.com") as client:
+            data = await self._get_with_auth(
+                client,
+                "https://www.googleapis.com/drive/v3/changes/startPageToken",
+                params={"supportsAllDrives": "true"},
+            )
+        return {"page_token": data["startPageToken"]}
+
+    async def generate_changes(self, cursor: Dict) -> AsyncGenerator[BaseEntity, None]:
+        """Generate the files that changed since the page token of the cursor.
+
+        Removed and trashed files are yielded as deleted. Changed files are downloaded
+        concurrently.
+        """
+        async for entity in self.process_file_entities(self._list_changes(cursor)):
+            yield entity
+
+    async def _list_changes(self, cursor: Dict) -> AsyncGenerator[BaseEntity, None]:
+        """Build the entities of the changes since a cursor, without downloading files."""
+        url = "https://www.googleapis.com/drive/v3/changes"
+        params = {
+            "pageToken": cursor["page_token"],
+            "pageSize": 100,
+            "includeItemsFromAllDrives": "true",
+            "supportsAllDrives": "true",
+            "includeRemoved": "true",
+            "fields": "nextPageToken, newStartPageToken, "
+            f"changes(changeType, removed, fileId, file({FILE_FIELDS}))",
+        }
+        async with http_clients.borrow("https://www.googleapis.com") as client:
+            while True:
+                data = await self._get_changes_page(client, url, params, cursor)
+                for change in data.get("changes", []):
+                    entity = self._build_change_entity(change)
+                    if entity:
+                        yield entity
+
+                if "newStartPageToken" in data:
+                    self.set_change_cursor({"page_token": data["newStartPageToken"]})
+                    return
+                params["pageToken"] = data["nextPageToken"]
+
+    async def _get_changes_page(
+        self, client: httpx.AsyncClient, url: str, params: Dict, cursor: Dict
+    ) -> Dict:
+        """Get a page of the changes feed, reporting a stored page token that expired."""
+        try:
+            return await self._get_with_auth(client, url, params=params)
+        except httpx.HTTPStatusError as e:
+            if (
+                params["pageToken"] == cursor["page_token"]
+                and e.response.status_code in EXPIRED_PAGE_TOKEN_STATUS_CODES
+            ):
+                raise CursorExpiredError(
+                    f"Changes page token rejected with status {e.response.status_code}"
+                ) from e
+            raise
+
+    def _build_change_entity(self, change: Dict) -> Optional[BaseEntity]:
+        """Build the entity for a change of the changes feed, None if it is not a file."""
+        if change.get("changeType", "file") != "file":
+            return None
+
+        file_obj = change.get("file")
+        if change.get("removed") or not file_obj or file_obj.get("trashed", False):
+            return DeletedEntity(entity_id=change["fileId"])
+        if file_obj.get("mimeType") == FOLDER_MIME_TYPE:
+            return None
+
+        return self._build_file_entity(file_obj)
+
+    def _apply_resume_cursor(
+        self, drive_ids: list[str], resume_cursor: Optional[Dict]
+    ) -> tuple[list[str], Optional[str], Optional[str]]:
+        """Skip the file listings a resumed run has already processed.
+
+        Returns:
+            The shared drives left to list, the page token to start the first of them at,
+            and the page token to start My Drive at
+        """
+        if not resume_cursor:
+            return drive_ids, None, None
+
+        if resume_cursor["corpora"] == "user":
+            logger.info("Resuming Google Drive sync in My Drive")
+            return [], None, resume_cursor["page_token"]
+
+        if resume_cursor["drive_id"] in drive_ids:
+            logger.info(f"Resuming Google Drive sync in drive {resume_cursor['drive_id']}")
+            start = drive_ids.index(resume_cursor["drive_id"])
+            return drive_ids[start:], resume_cursor["page_token"], None
+
+        # The drive is gone, start over rather than risk skipping files
+        logger.warning("Resume cursor points to an unknown drive, listing all files")
+        return drive_ids, None, None
@@ -13,6 +13,7 @@ from airweave.platform.entities.hubspot import (
     HubspotDealEntity,
     HubspotTicketEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -169,7 +170,7 @@ class HubspotSource(BaseSource):
         Yields:
             HubSpot entities: Contacts, Companies, Deals, and Tickets.
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.hubapi.com") as client:
             # Yield contact entities
             async for contact_entity in self._generate_contact_entities(client):
                 yield contact_entity
@@ -13,6 +13,7 @@ from airweave.platform.entities.intercom import (
     IntercomConversationEntity,
     IntercomTicketEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -173,7 +174,7 @@ class IntercomSource(BaseSource):
         Yields:
             Intercom entities: Contacts, Companies, Conversations, and Tickets.
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.intercom.io") as client:
             # Yield contact entities
             async for contact_entity in self._generate_contact_entities(client):
                 yield contact_entity
@@ -21,6 +21,7 @@ from airweave.platform.entities.jira import (
     JiraIssueEntity,
     JiraProjectEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -39,7 +40,7 @@ class JiraSource(BaseSource):
     async def _get_accessible_resources(access_token: str) -> list[dict]:
         """Get the list of accessible Atlassian resources for this token."""
         logger.info("Retrieving accessible Atlassian resources")
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.atlassian.com") as client:
             headers = {"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
             try:
                 logger.debug(
@@ -307,7 +308,7 @@ class JiraSource(BaseSource):
     async def generate_entities(self) -> AsyncGenerator[BaseEntity, None]:
         """Generate all entities from Jira."""
         logger.info("Starting Jira entity generation process")
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.atlassian.com") as client:
             project_count = 0
             issue_count = 0
             # Track already processed entity IDs with their type to avoid duplicates
@@ -20,6 +20,7 @@ from airweave.platform.entities.monday import (
     MondaySubitemEntity,
     MondayUpdateEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -411,7 +412,7 @@ class MondaySource(BaseSource):
             - Subitems per item
             - Updates per item or board
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.monday.com") as client:
             # 1) Boards
             async for board_entity in self._generate_board_entities(client):
                 yield board_entity
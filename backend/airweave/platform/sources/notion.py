@@ -19,6 +19,7 @@ from airweave.platform.entities.notion import (
     NotionBlockEntity,
     NotionPageEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -156,7 +157,7 @@ class NotionSource(BaseSource):
         """
         logger.info("Fetching all pages from Notion")
 
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.notion.com") as client:
             url = "https://api.notion.com/v1/search"
             has_more = True
             start_cursor = None
@@ -504,7 +505,7 @@ class NotionSource(BaseSource):
             )
 
             # Now process each page to create entities with proper breadcrumbs
-            async with httpx.AsyncClient() as client:
+            async with http_clients.borrow("https://api.notion.com") as client:
                 for page in all_pages:
                     page_id = page["id"]
                     parent = page.get("parent", {})
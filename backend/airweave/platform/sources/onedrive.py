@@ -26,6 +26,7 @@ from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
 from airweave.platform.entities._base import Breadcrumb
 from airweave.platform.entities.onedrive import OneDriveDriveEntity, OneDriveDriveItemEntity
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -158,7 +159,7 @@ class OneDriveSource(BaseSource):
           - OneDriveDriveEntity for each drive
           - OneDriveDriveItemEntity for each item in each drive (folders/files).
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://graph.microsoft.com") as client:
             # 1) Yield drive entities
             #    Note: We'll also collect them in memory to enumerate items from each drive
             drives = []
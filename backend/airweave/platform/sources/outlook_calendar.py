@@ -23,6 +23,7 @@ from airweave.platform.entities.outlook_calendar import (
     OutlookCalendarCalendarEntity,
     OutlookCalendarEventEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -157,7 +158,7 @@ class OutlookCalendarSource(BaseSource):
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate all entities from Outlook Calendar: Calendars and Events."""
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://graph.microsoft.com") as client:
             # 1) Get the user's calendars
             async for calendar_entity in self._generate_calendar_entities(client):
                 yield calendar_entity
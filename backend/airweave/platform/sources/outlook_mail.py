@@ -19,6 +19,7 @@ from airweave.platform.auth.schemas import AuthType
 from airweave.platform.decorators import source
 from airweave.platform.entities._base import Breadcrumb, ChunkEntity
 from airweave.platform.entities.outlook_mail import OutlookMailFolderEntity, OutlookMessageEntity
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -167,7 +168,7 @@ class OutlookMailSource(BaseSource):
           - Mail folders (recursive)
           - Messages in each folder
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://graph.microsoft.com") as client:
             # 1) Generate all mail folders (including subfolders)
             #    and yield them as OutlookMailFolderEntity
             async for folder_entity in self._generate_folder_entities(client):
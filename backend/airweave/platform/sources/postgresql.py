@@ -37,6 +37,26 @@ PG_TYPE_MAP = {
     "jsonb": Dict[str, Any],
 }
 
+# Primary key types that cannot be compared through a cast from text, tables keyed by them
+# are paged with OFFSET instead
+KEYSET_UNSUPPORTED_TYPES = {"user-defined", "array"}
+
+# Number of rows fetched per query
+BATCH_SIZE = 50
+
+
+def _key_text(value: Any) -> str:
+    """Encode a primary key value as text that casts back to the same value in Postgres.
+
+    str() works for most types, but not for binary ones: bytea is written in its hex
+    format and bit strings as their bits.
+    """
+    if isinstance(value, bytes):
+        return "\\x" + value.hex()
+    if isinstance(value, asyncpg.BitString):
+        return value.as_string().replace(" ", "")
+    return str(value)
+
 
 @source(
     "PostgreSQL", "postgresql", AuthType.config_class, "PostgreSQLAuthConfig", labels=["Database"]
@@ -49,12 +69,18 @@ class PostgreSQLSource(BaseSource):
     1. Discover tables and their structures
     2. Create appropriate entity classes dynamically
     3. Generate entities for each table's data
+
+    Resumable: tables are read in primary key order, and the resume cursor is the table
+    and the last key read, as {"table": ..., "key": [...]}.
     """
 
+    _supports_resume = True
+
     def __init__(self):
         """Initialize the PostgreSQL source."""
         self.conn: Optional[asyncpg.Connection] = None
         self.entity_classes: Dict[str, Type[PolymorphicEntity]] = {}
+        self.primary_key_types: Dict[str, Dict[str, str]] = {}
 
     @classmethod
     async def create(cls, config: Dict[str, Any]) -> "PostgreSQLSource":
@@ -172,6 +198,9 @@ class PostgreSQLSource(BaseSource):
             Dynamically created entity class for the table
         """
         table_info = await self._get_table_info(schema, table)
+        self.primary_key_types[f"{schema}.{table}"] = {
+            pk: table_info["columns"][pk]["pg_type"] for pk in table_info["primary_keys"]
+        }
 
         return PolymorphicEntity.create_table_entity_class(
             table_name=table,
@@ -194,6 +223,7 @@ class PostgreSQLSource(BaseSource):
             FROM information_schema.tables
             WHERE table_schema = $1
             AND table_type = 'BASE TABLE'
+            ORDER BY table_name
         """
         tables = await self.conn.fetch(query, schema)
         return [table["table_name"] for table in tables]
@@ -239,13 +269,91 @@ class PostgreSQLSource(BaseSource):
 
             yield entity_class(entity_id=entity_id, **data)
 
+    async def _generate_table_entities(
+        self,
+        schema: str,
+        table: str,
+        entity_class: Type[PolymorphicEntity],
+        start_key: Optional[List[str]] = None,
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate entities for a table, in primary key order if it has a usable key.
+
+        Args:
+            schema: Schema name
+            table: Table name
+            entity_class: The entity class of the table
+            start_key: Primary key values (as text) to continue after, used to resume
+        """
+        pk_types = self.primary_key_types[f"{schema}.{table}"]
+        if not pk_types or KEYSET_UNSUPPORTED_TYPES & set(pk_types.values()):
+            # Without a usable key a table can only be resumed from its start
+            self.set_resume_cursor({"table": table, "key": None})
+            offset = 0
+            while True:
+                # Fetch records in batches using LIMIT and OFFSET
+                batch_query = (
+                    f'SELECT * FROM "{schema}"."{table}" LIMIT {BATCH_SIZE} OFFSET {offset}'
+                )
+                records = await self.conn.fetch(batch_query)
+
+                # Break if no more records
+                if not records:
+                    break
+
+                # Process the batch
+                async for entity in self._process_table_batch(schema, table, entity_class, records):
+                    yield entity
+
+                # Increment offset for next batch
+                offset += BATCH_SIZE
+            return
+
+        pk_columns = ", ".join(f'"{pk}"' for pk in pk_types)
+        # Keys are kept as text, so they fit in the JSON resume cursor. asyncpg encodes a
+        # parameter by the type the server infers for it, so it is bound as text and cast.
+        pk_params = ", ".join(
+            f"${i}::text::{pg_type}" for i, pg_type in enumerate(pk_types.values(), start=1)
+        )
+        key = start_key
+        while True:
+            # Resuming from here reads this batch again
+            self.set_resume_cursor({"table": table, "key": key})
+
+            # Fetch records in batches using keyset pagination on the primary key
+            where = f"WHERE ({pk_columns}) > ({pk_params}) " if key else ""
+            batch_query = (
+                f'SELECT * FROM "{schema}"."{table}" {where}'
+                f"ORDER BY {pk_columns} LIMIT {BATCH_SIZE}"
+            )
+            records = await self.conn.fetch(batch_query, *(key or []))
+
+            # Break if no more records
+            if not records:
+                break
+
+            # Process the batch
+            async for entity in self._process_table_batch(schema, table, entity_class, records):
+                yield entity
+
+            key = [_key_text(records[-1][pk]) for pk in pk_types]
+
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
-        """Generate entities for all tables in specified schemas."""
+        """Generate entities for all tables in specified schemas.
+
+        When resuming, tables before the one in the resume cursor are skipped, and that
+        table continues after the key in the cursor.
+        """
         try:
             await self._connect()
             schema = self.config.get("schema", "public")
             tables = await self._get_table_list(schema)
 
+            resume_cursor = self.resume_cursor
+            start_key = None
+            if resume_cursor and resume_cursor["table"] in tables:
+                tables = tables[tables.index(resume_cursor["table"]) :]
+                start_key = resume_cursor["key"]
+
             # Start a transaction
             async with self.conn.transaction():
                 for table in tables:
@@ -256,28 +364,11 @@ class PostgreSQLSource(BaseSource):
                         )
 
                     entity_class = self.entity_classes[f"{schema}.{table}"]
-                    BATCH_SIZE = 50
-                    offset = 0
-
-                    while True:
-                        # Fetch records in batches using LIMIT and OFFSET
-                        batch_query = (
-                            f'SELECT * FROM "{schema}"."{table}" LIMIT {BATCH_SIZE} OFFSET {offset}'
-                        )
-                        records = await self.conn.fetch(batch_query)
-
-                        # Break if no more records
-                        if not records:
-                            break
-
-                        # Process the batch
-                        async for entity in self._process_table_batch(
-                            schema, table, entity_class, records
-                        ):
-                            yield entity
-
-                        # Increment offset for next batch
-                        offset += BATCH_SIZE
+                    async for entity in self._generate_table_entities(
+                        schema, table, entity_class, start_key
+                    ):
+                        yield entity
+                    start_key = None
 
         finally:
             if self.conn:
@@ -13,6 +13,7 @@ from airweave.platform.entities.slack import (
     SlackMessageEntity,
     SlackUserEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -170,7 +171,7 @@ class SlackSource(BaseSource):
 
         Channels, Users, and Messages.
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://slack.com") as client:
             # Yield channel entities
             async for channel_entity in self._generate_channel_entities(client):
                 yield channel_entity
@@ -38,6 +38,7 @@ from airweave.platform.entities.stripe import (
     StripeRefundEntity,
     StripeSubscriptionEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -475,7 +476,7 @@ class StripeSource(BaseSource):
         - Refunds
         - Subscriptions
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.stripe.com") as client:
             # 1) Single Balance resource
             async for balance_entity in self._generate_balance_entity(client):
                 yield balance_entity
@@ -13,6 +13,7 @@ from airweave.platform.entities.todoist import (
     TodoistSectionEntity,
     TodoistTaskEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -209,7 +210,7 @@ class TodoistSource(BaseSource):
           - yield tasks not associated with any section
           - yield TodoistCommentEntities for each task
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.todoist.com") as client:
             # 1) Generate (and yield) all Projects
             async for project_entity in self._generate_project_entities(client):
                 yield project_entity
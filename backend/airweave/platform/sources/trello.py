@@ -15,6 +15,7 @@ from airweave.platform.entities.trello import (
     TrelloMemberEntity,
     TrelloOrganizationEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -250,7 +251,7 @@ class TrelloSource(BaseSource):
         This version includes a breadcrumb path to reflect the hierarchical
         structure: Organization → Board → List → Card, etc.
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://api.trello.com") as client:
             # Yield all organization (workspace) entities
             async for org_entity in self._generate_organization_entities(client):
                 yield org_entity
@@ -31,6 +31,7 @@ from airweave.platform.entities.zendesk import (
     ZendeskTicketEntity,
     ZendeskUserEntity,
 )
+from airweave.platform.http_clients import http_clients
 from airweave.platform.sources._base import BaseSource
 
 
@@ -185,7 +186,7 @@ class ZendeskSource(BaseSource):
         - Tickets
           - Comments for each ticket
         """
-        async with httpx.AsyncClient() as client:
+        async with http_clients.borrow("https://your_subdomain.zendesk.com") as client:
             # 1) Yield organization entities
             async for org_entity in self._generate_organization_entities(client):
                 yield org_entity
@@ -0,0 +1,128 @@
+"""Checkpointing of source positions, so a failed sync job can be resumed."""
+
+from collections import deque
+from datetime import datetime
+from typing import Any, AsyncGenerator, Optional
+from uuid import UUID
+
+from airweave.platform.entities._base import BaseEntity
+from airweave.platform.sources._base import BaseSource
+
+# Progress counters carried over from the checkpoint of the job that is resumed
+RESUMED_STATS = ("inserted", "updated", "deleted", "kept", "failed")
+
+
+class CheckpointTracker:
+    """Tracks which resume cursor of a source is durable.
+
+    A cursor set by the source covers every entity yielded before it. It is durable once
+    all of those entities have left the pipeline: persisted, kept, or given up on. Entities
+    are numbered as the source yields them, and the lowest number still in the pipeline is
+    the watermark every durable cursor must lie below. Entities lost to a failing batch are
+    never completed, which freezes the checkpoint where it is, so nothing is skipped on
+    resume.
+
+    Usage:
+    -----
+    ```python
+    tracker = CheckpointTracker(source, sync_job_id, resumed_from=checkpoint)
+    async for entity in tracker.track(source.generate_entities()):
+        ...  # process the entity
+        tracker.complete(entity)
+    checkpoint = tracker.checkpoint(progress.stats.model_dump())
+    if checkpoint:
+        ...  # persist the checkpoint
+        tracker.mark_saved(checkpoint)
+    ```
+    """
+
+    def __init__(
+        self,
+        source: BaseSource,
+        sync_job_id: UUID,
+        resumed_from: Optional[dict] = None,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            source: The source whose cursor is tracked
+            sync_job_id: The ID of the running sync job
+            resumed_from: The checkpoint of the failed job this job resumes, if any
+        """
+        self.source = source
+        self.sync_job_id = sync_job_id
+        self.resumed_from = resumed_from
+
+        # Jobs whose entities up to the cursor count as seen by this run
+        self.sync_job_ids = [sync_job_id]
+        # The change cursor to store once the run completes, carried over on resume since
+        # it must be taken before the full sync it belongs to started
+        self.change_cursor: Optional[dict] = None
+        self._durable_cursor: Optional[dict] = None
+        if resumed_from:
+            self.sync_job_ids += [UUID(id) for id in resumed_from["sync_job_ids"]]
+            self.change_cursor = resumed_from.get("change_cursor")
+            self._durable_cursor = resumed_from["cursor"]
+
+        self._last_cursor = self._durable_cursor
+        self._next_seq = 0
+        # Sequence numbers of the entities still in the pipeline
+        self._in_flight: set[int] = set()
+        self._cursors: deque[tuple[int, dict]] = deque()
+        # A resumed job saves the inherited cursor too, so it stays resumable if it fails
+        # before getting any further
+        self._saved_cursor: Optional[dict] = None
+
+    @property
+    def is_resumed(self) -> bool:
+        """Whether this job resumes a failed one."""
+        return self.resumed_from is not None
+
+    async def track(
+        self, entities: AsyncGenerator[BaseEntity, None]
+    ) -> AsyncGenerator[BaseEntity, None]:
+        """Number the entities of a source generator and record its cursors along the way."""
+        async for entity in entities:
+            cursor = self.source.resume_cursor
+            if cursor != self._last_cursor:
+                # The cursor was set before this entity, so it only covers earlier ones
+                self._cursors.append((self._next_seq, cursor))
+                self._last_cursor = cursor
+            # Kept on the entity itself, an id() could be reused by a later entity
+            entity._checkpoint_seq = self._next_seq
+            self._in_flight.add(self._next_seq)
+            self._next_seq += 1
+            yield entity
+
+    def complete(self, entity: BaseEntity) -> None:
+        """Mark an entity as done with, whatever the outcome."""
+        if entity._checkpoint_seq is not None:
+            self._in_flight.discard(entity._checkpoint_seq)
+
+    def checkpoint(self, stats: dict[str, Any]) -> Optional[dict]:
+        """Build a checkpoint if the durable cursor moved since the last one.
+
+        Args:
+            stats: The current progress stats of the job
+
+        Returns:
+            The checkpoint to persist, or None if there is nothing new
+        """
+        watermark = min(self._in_flight, default=self._next_seq)
+        while self._cursors and self._cursors[0][0] <= watermark:
+            _, self._durable_cursor = self._cursors.popleft()
+
+        if self._durable_cursor is None or self._durable_cursor == self._saved_cursor:
+            return None
+
+        return {
+            "cursor": self._durable_cursor,
+            "stats": {name: stats.get(name, 0) for name in RESUMED_STATS},
+            "sync_job_ids": [str(id) for id in self.sync_job_ids],
+            "change_cursor": self.change_cursor,
+            "created_at": datetime.utcnow().isoformat(),
+        }
+
+    def mark_saved(self, checkpoint: dict) -> None:
+        """Record that a checkpoint was persisted, so it is not saved again."""
+        self._saved_cursor = checkpoint["cursor"]
@@ -10,15 +10,24 @@ from airweave import crud, schemas
 from airweave.core import credentials
 from airweave.core.config import settings
 from airweave.core.exceptions import NotFoundException
+from airweave.core.logging import logger
+from airweave.core.shared_models import SyncJobStatus
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.auth.services import oauth2_service
 from airweave.platform.destinations._base import BaseDestination, VectorDBDestination
+from airweave.platform.destinations.null import NullDestination
 from airweave.platform.embedding_models._base import BaseEmbeddingModel
+from airweave.platform.embedding_models.fake import FakeEmbeddingModel
 from airweave.platform.embedding_models.local_text2vec import LocalText2Vec
+from airweave.platform.embedding_models.onnx_text2vec import OnnxText2Vec
 from airweave.platform.embedding_models.openai_text2vec import OpenAIText2Vec
 from airweave.platform.entities._base import BaseEntity
 from airweave.platform.locator import resource_locator
 from airweave.platform.sources._base import BaseSource
+from airweave.platform.sync.checkpoint import CheckpointTracker
+from airweave.platform.sync.dry_run import DryRun
+from airweave.platform.sync.entity_index import EntityHashIndex
+from airweave.platform.sync.entity_writer import EntityWriteBuffer, NullEntityWriteBuffer
 from airweave.platform.sync.pubsub import SyncProgress
 from airweave.platform.sync.router import SyncDAGRouter
 
@@ -36,7 +45,13 @@ class SyncContext:
     - dag - the DAG that is created for the sync
     - progress - the progress tracker, interfaces with PubSub
     - router - the DAG router
+    - entity index - in-memory index of the entities stored by previous runs
+    - entity writer - write-behind buffer for entity rows
+    - checkpoint tracker - tracks the durable source position, to resume a failed job from
+    - held files - downloaded files of the entities still in the pipeline
     - white label (optional)
+    - change cursor (optional) - position in the source's change feed, set for incremental runs
+    - dry run (optional) - set when the sync runs without writing its results
     """
 
     source: BaseSource
@@ -49,9 +64,14 @@ class SyncContext:
     progress: SyncProgress
     router: SyncDAGRouter
     entity_map: dict[type[BaseEntity], UUID]
+    entity_index: EntityHashIndex
+    entity_writer: EntityWriteBuffer
+    checkpoint_tracker: CheckpointTracker
     current_user: schemas.User
 
     white_label: Optional[schemas.WhiteLabel] = None
+    change_cursor: Optional[dict] = None
+    dry_run: Optional[DryRun] = None
 
     def __init__(
         self,
@@ -65,8 +85,13 @@ class SyncContext:
         progress: SyncProgress,
         router: SyncDAGRouter,
         entity_map: dict[type[BaseEntity], UUID],
+        entity_index: EntityHashIndex,
+        entity_writer: EntityWriteBuffer,
+        checkpoint_tracker: CheckpointTracker,
         current_user: schemas.User,
         white_label: Optional[schemas.WhiteLabel] = None,
+        change_cursor: Optional[dict] = None,
+        dry_run: Optional[DryRun] = None,
     ):
         """Initialize the sync context."""
         self.source = source
@@ -79,8 +104,16 @@ class SyncContext:
         self.progress = progress
         self.router = router
         self.entity_map = entity_map
+        self.entity_index = entity_index
+        self.entity_writer = entity_writer
+        self.checkpoint_tracker = checkpoint_tracker
         self.current_user = current_user
         self.white_label = white_label
+        self.change_cursor = change_cursor
+        self.dry_run = dry_run
+        # Released once an entity's file is chunked, whatever is left when the run ends
+        # belongs to entities that were lost
+        self.held_files: set[str] = set()
 
 
 class SyncContextFactory:
@@ -95,19 +128,41 @@ class SyncContextFactory:
         dag: schemas.SyncDag,
         current_user: schemas.User,
         white_label: Optional[schemas.WhiteLabel] = None,
+        dry_run: Optional[DryRun] = None,
     ) -> SyncContext:
-        """Create a sync context."""
+        """Create a sync context.
+
+        A dry run gets a fake embedding model and a null destination instead of the
+        configured ones, and starts from scratch: no entity index, checkpoint or change cursor.
+        """
         source = await cls._create_source_instance(db=db, sync=sync, current_user=current_user)
         embedding_model = cls._get_embedding_model(sync=sync)
-        destinations = await cls._create_destination_instances(
-            db=db, sync=sync, current_user=current_user, embedding_model=embedding_model
-        )
+        if dry_run:
+            embedding_model = FakeEmbeddingModel(
+                vector_dimensions=embedding_model.vector_dimensions
+            )
+            dry_run.destination = await NullDestination.create(sync_id=sync.id)
+            destinations = [dry_run.destination]
+        else:
+            destinations = await cls._create_destination_instances(
+                db=db, sync=sync, current_user=current_user, embedding_model=embedding_model
+            )
         transformers = await cls._get_transformer_callables(db=db, sync=sync)
         entity_map = await cls._get_entity_definition_map(db=db)
 
         progress = SyncProgress(sync_job.id)
         router = SyncDAGRouter(dag, entity_map)
 
+        if dry_run:
+            dry_run.stats = progress.stats
+            entity_index, checkpoint, change_cursor = EntityHashIndex(sync.id), None, None
+        else:
+            entity_index, checkpoint, change_cursor = await cls._load_sync_state(
+                db, sync, sync_job, source, progress
+            )
+        # Lets the source skip downloading files that are stored with the same fingerprint
+        source.set_entity_index(entity_index)
+
         return SyncContext(
             source=source,
             destinations=destinations,
@@ -119,9 +174,90 @@ class SyncContextFactory:
             progress=progress,
             router=router,
             entity_map=entity_map,
+            entity_index=entity_index,
+            entity_writer=cls._create_entity_writer(sync, dry_run),
+            checkpoint_tracker=CheckpointTracker(source, sync_job.id, resumed_from=checkpoint),
             current_user=current_user,
             white_label=white_label,
+            change_cursor=change_cursor,
+            dry_run=dry_run,
+        )
+
+    @classmethod
+    async def _load_sync_state(
+        cls,
+        db: AsyncSession,
+        sync: schemas.Sync,
+        sync_job: schemas.SyncJob,
+        source: BaseSource,
+        progress: SyncProgress,
+    ) -> tuple[EntityHashIndex, Optional[dict], Optional[dict]]:
+        """Load what previous runs of the sync left behind.
+
+        Returns:
+            The entity index, the checkpoint to resume from and the change cursor to read
+            changes from, the latter two if any
+        """
+        entity_index = await EntityHashIndex.load(db, sync.id)
+        progress.stats.entity_index_entries = len(entity_index)
+        progress.stats.entity_index_bytes = entity_index.size_bytes
+
+        checkpoint = await cls._get_resume_checkpoint(db, sync, sync_job, source)
+        if checkpoint:
+            source.set_resume_cursor(checkpoint["cursor"])
+            for name, value in checkpoint["stats"].items():
+                setattr(progress.stats, name, value)
+
+        # A resumed job finishes the full sync it resumes, other jobs read only the changes
+        # if the source supports it and a previous run stored where to read them from
+        change_cursor = None
+        if not checkpoint and source.supports_incremental:
+            sync_cursor = await crud.sync_cursor.get_by_sync_id(db, sync.id)
+            change_cursor = sync_cursor.cursor_data if sync_cursor else None
+
+        return entity_index, checkpoint, change_cursor
+
+    @classmethod
+    def _create_entity_writer(
+        cls, sync: schemas.Sync, dry_run: Optional[DryRun]
+    ) -> EntityWriteBuffer:
+        """Create the entity row writer, which rolls back or drops its rows in dry runs."""
+        if not dry_run:
+            return EntityWriteBuffer(sync.organization_id)
+        if dry_run.skip_db_writes:
+            return NullEntityWriteBuffer(sync.organization_id)
+        return EntityWriteBuffer(sync.organization_id, commit=False)
+
+    @classmethod
+    async def _get_resume_checkpoint(
+        cls,
+        db: AsyncSession,
+        sync: schemas.Sync,
+        sync_job: schemas.SyncJob,
+        source: BaseSource,
+    ) -> Optional[dict]:
+        """Get the checkpoint to resume from, if the previous job of the sync did not finish.
+
+        A job that is still marked as in progress was interrupted, e.g. by a restart.
+        """
+        if not source.supports_resume:
+            return None
+
+        previous_job = await crud.sync_job.get_latest_by_sync_id(
+            db, sync.id, exclude_id=sync_job.id
         )
+        if (
+            not previous_job
+            or previous_job.status not in (SyncJobStatus.FAILED, SyncJobStatus.IN_PROGRESS)
+            or not previous_job.checkpoint
+        ):
+            return None
+
+        logger.info(
+            f"Resuming sync {sync.id} from the checkpoint of job {previous_job.id} "
+            f"({previous_job.checkpoint['created_at']})"
+        )
+        return previous_job.checkpoint
 
     @classmethod
     async def _create_source_instance(
@@ -234,7 +370,8 @@ class SyncContextFactory:
     def _get_embedding_model(cls, sync: schemas.Sync) -> BaseEmbeddingModel:
         """Get embedding model instance.
 
-        If OpenAI API key is available, it will use OpenAI embeddings instead of local.
+        If OpenAI API key is available, it will use OpenAI embeddings instead of local. Local
+        embeddings are computed in process if an ONNX model is configured.
 
         Args:
             sync (schemas.Sync): The sync configuration
@@ -249,6 +386,10 @@ class SyncContextFactory:
             logger.info(f"Using OpenAI embedding model (text-embedding-3-small) for sync {sync.id}")
             return OpenAIText2Vec(api_key=settings.OPENAI_API_KEY)
 
+        if settings.ONNX_EMBEDDING_MODEL_DIR:
+            logger.info(f"Using in-process ONNX embedding model (MiniLM-L6-v2) for sync {sync.id}")
+            return OnnxText2Vec()
+
         # Otherwise use the local model
         logger.info(f"Using local embedding model (MiniLM-L6-v2) for sync {sync.id}")
         return LocalText2Vec()
@@ -0,0 +1,145 @@
+"""Dry runs, to measure the throughput of a sync without writing its results."""
+
+import os
+import time
+from collections import deque
+from typing import AsyncGenerator, Optional
+
+from pydantic import BaseModel
+
+from airweave.platform.destinations.null import NullDestination
+from airweave.platform.entities._base import BaseEntity, FileEntity
+from airweave.platform.sync.pipeline import LATENCY_SAMPLES, StagedPipeline, latency_percentiles
+from airweave.platform.sync.pubsub import SyncProgressUpdate
+
+
+class StageReport(BaseModel):
+    """Throughput and latency of a single stage of a dry run.
+
+    Latencies are per call: per entity for the source, per batch for the pipeline stages.
+    """
+
+    processed: int = 0
+    failed: int = 0
+    workers: Optional[int] = None
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+
+
+class DryRunReport(BaseModel):
+    """Report of a dry run.
+
+    The stage with the most busy seconds per worker is the one bounding the sync.
+    """
+
+    duration_seconds: float
+    entities: int
+    entities_per_second: float
+    bytes: int  # Bytes read from the source: file sizes, or serialized entity sizes
+    bytes_per_second: float
+    bytes_written: int  # Bytes of payload the destinations would have received
+    stages: dict[str, StageReport]
+    stats: SyncProgressUpdate
+
+
+class DryRun:
+    """Settings and measurements of a dry run of a sync.
+
+    A dry run reads the source and converts and chunks its entities as a real run does,
+    but embeds with a fake model and writes to a null destination. It always runs as a full
+    sync from scratch, so every entity goes through every stage. Entity rows are written in
+    a transaction that is rolled back, or not at all with `skip_db_writes`.
+
+    Usage:
+    -----
+    ```python
+    dry_run = DryRun()
+    await sync_service.run(sync, sync_job, dag, current_user, dry_run=dry_run)
+    report = dry_run.report()
+    ```
+    """
+
+    def __init__(self, skip_db_writes: bool = False):
+        """Initialize the dry run.
+
+        Args:
+            skip_db_writes: Whether to skip writing entity rows entirely, instead of
+                writing and rolling them back
+        """
+        self.skip_db_writes = skip_db_writes
+        self.destination: Optional[NullDestination] = None
+        self.pipeline: Optional[StagedPipeline] = None
+        # The progress stats of the run, shared with its sync context
+        self.stats = SyncProgressUpdate()
+
+        self._entities = 0
+        self._bytes = 0
+        self._source_seconds = 0.0
+        self._source_latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    async def measure_source(
+        self, entities: AsyncGenerator[BaseEntity, None]
+    ) -> AsyncGenerator[BaseEntity, None]:
+        """Pass the entities of a source through, timing how long each takes to produce.
+
+        Only the time spent inside the source is measured, not the time the pipeline
+        holds it back.
+        """
+        self._started_at = time.monotonic()
+        while True:
+            start = time.monotonic()
+            try:
+                entity = await anext(entities)
+            except StopAsyncIteration:
+                return
+            latency = time.monotonic() - start
+            self._source_seconds += latency
+            self._source_latencies.append(latency)
+            self._entities += 1
+            self._bytes += self._entity_size(entity)
+            yield entity
+
+    def finish(self) -> None:
+        """Record that the run has drained its pipeline."""
+        self._finished_at = time.monotonic()
+
+    def report(self) -> DryRunReport:
+        """Build the report of the finished dry run."""
+        duration = max((self._finished_at or time.monotonic()) - (self._started_at or 0.0), 1e-9)
+        stages = {
+            "source": StageReport(
+                processed=self._entities,
+                workers=1,
+                busy_seconds=round(self._source_seconds, 3),
+                **latency_percentiles(self._source_latencies),
+            )
+        }
+        if self.pipeline:
+            stages.update(
+                {name: StageReport(**stats) for name, stats in self.pipeline.stats().items()}
+            )
+
+        return DryRunReport(
+            duration_seconds=round(duration, 3),
+            entities=self._entities,
+            entities_per_second=round(self._entities / duration, 2),
+            bytes=self._bytes,
+            bytes_per_second=round(self._bytes / duration, 2),
+            bytes_written=self.destination.bytes_written if self.destination else 0,
+            stages=stages,
+            stats=self.stats,
+        )
+
+    @staticmethod
+    def _entity_size(entity: BaseEntity) -> int:
+        """Size of what the source produced for an entity, in bytes."""
+        if isinstance(entity, FileEntity):
+            if entity.local_path and os.path.exists(entity.local_path):
+                return os.path.getsize(entity.local_path)
+            return entity.size or 0
+        return len(entity.model_dump_json())
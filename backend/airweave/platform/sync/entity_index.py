@@ -0,0 +1,124 @@
+"""In-memory index of the entities a sync has already stored, used for change detection."""
+
+import sys
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave import crud
+from airweave.core.logging import logger
+
+# Number of (entity_id, hash, id) rows fetched per query while building the index
+INDEX_PAGE_SIZE = 10000
+
+_UUID_SIZE = 16
+
+
+class EntityHashIndex:
+    """Per-job index of entity id -> (db entity id, hash).
+
+    Built once at sync start by paging through the `entity` table, so the orchestrator can
+    decide INSERT / UPDATE / KEEP from memory instead of issuing a SELECT per entity.
+
+    Entries are stored compactly: keys are interned entity ids, values are a single bytes
+    object holding the 16-byte primary key followed by the hash (hex hashes are stored as
+    raw digest bytes, halving their size).
+    """
+
+    def __init__(self, sync_id: UUID):
+        """Initialize an empty index for a sync.
+
+        Args:
+            sync_id: The ID of the sync the index belongs to
+        """
+        self.sync_id = sync_id
+        self._entries: dict[str, bytes] = {}
+        # Running total of key and value sizes, the dict itself is added on read
+        self._items_size_bytes = 0
+
+    @classmethod
+    async def load(
+        cls, db: AsyncSession, sync_id: UUID, page_size: int = INDEX_PAGE_SIZE
+    ) -> "EntityHashIndex":
+        """Build the index for a sync by streaming its stored entities in pages.
+
+        Args:
+            db: The database session
+            sync_id: The ID of the sync
+            page_size: Number of rows fetched per query
+
+        Returns:
+            The populated index
+        """
+        index = cls(sync_id)
+        async for rows in crud.entity.iter_hashes_by_sync_id(db, sync_id, page_size=page_size):
+            for db_entity_id, entity_id, hash in rows:
+                index.put(entity_id, hash, db_entity_id)
+
+        logger.info(
+            f"Loaded entity index for sync {sync_id}: {len(index)} entities, "
+            f"{index.size_bytes / (1024 * 1024):.1f}MB"
+        )
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of indexed entities."""
+        return len(self._entries)
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the index holds no entities, e.g. on the first run of a sync."""
+        return not self._entries
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory used by the index, in bytes."""
+        return self._items_size_bytes + sys.getsizeof(self._entries)
+
+    def get_db_entity_id(self, entity_id: str) -> Optional[UUID]:
+        """Get the stored db entity id for an entity id, if any."""
+        value = self._entries.get(entity_id)
+        return UUID(bytes=value[:_UUID_SIZE]) if value is not None else None
+
+    def get_hash(self, entity_id: str) -> Optional[str]:
+        """Get the stored hash for an entity id, if any.
+
+        Hashes come back as hex, which encodes to the same stored bytes as the original.
+        """
+        value = self._entries.get(entity_id)
+        return value[_UUID_SIZE:].hex() if value is not None else None
+
+    def has_changed(self, entity_id: str, hash: str) -> bool:
+        """Whether the given hash differs from the stored one.
+
+        Entities that are not in the index are reported as changed.
+        """
+        value = self._entries.get(entity_id)
+        return value is None or value[_UUID_SIZE:] != self.encode_hash(hash)
+
+    def put(self, entity_id: str, hash: str, db_entity_id: UUID) -> None:
+        """Add or replace the entry for an entity id."""
+        value = db_entity_id.bytes + self.encode_hash(hash)
+        previous = self._entries.get(entity_id)
+        if previous is None:
+            entity_id = sys.intern(entity_id)
+            self._items_size_bytes += sys.getsizeof(entity_id)
+        else:
+            self._items_size_bytes -= sys.getsizeof(previous)
+        self._entries[entity_id] = value
+        self._items_size_bytes += sys.getsizeof(value)
+
+    def remove(self, entity_id: str) -> None:
+        """Remove the entry for an entity id, if any."""
+        value = self._entries.pop(entity_id, None)
+        if value is not None:
+            self._items_size_bytes -= sys.getsizeof(entity_id) + sys.getsizeof(value)
+
+    @staticmethod
+    def encode_hash(hash: str) -> bytes:
+        """Encode a hash compactly: hex digests as raw bytes, anything else as UTF-8."""
+        try:
+            return bytes.fromhex(hash)
+        except ValueError:
+            return hash.encode()
@@ -0,0 +1,157 @@
+"""Write-behind buffer for entity bookkeeping rows."""
+
+import asyncio
+from typing import Optional
+from uuid import UUID
+
+from airweave import crud, schemas
+from airweave.core.logging import logger
+from airweave.db.session import get_db_context
+from airweave.db.unit_of_work import UnitOfWork
+
+# Flush once this many rows are buffered
+DEFAULT_FLUSH_SIZE = 1000
+# Flush at least this often, so rows of slow syncs are not held back for long
+DEFAULT_FLUSH_INTERVAL = 2.0  # seconds
+# Flushes of at least this many rows are written through COPY instead of a multi-row INSERT:
+# full buffers go through COPY, the small flushes of the timer through INSERT. Must not
+# exceed the flush size, or COPY is never used. Also keeps the INSERT path well under
+# Postgres' limit of 32767 bind parameters.
+DEFAULT_COPY_THRESHOLD = 500
+
+
+class EntityWriteBuffer:
+    """Buffers entity rows of a sync job and writes them in bulk.
+
+    Rows are flushed with `INSERT ... ON CONFLICT (sync_id, entity_id) DO UPDATE`, or with
+    COPY into a staging table for very large batches. A flush happens when the buffer is
+    full, on a timer, and when the job completes. Every flush uses its own short-lived
+    session, so a sync holds at most one connection for its bookkeeping writes, no matter
+    how many workers it runs.
+
+    Usage:
+    -----
+    ```python
+    async with EntityWriteBuffer(organization_id) as writer:
+        await writer.add(db_entity_id, schemas.EntityCreate(...))
+    # Everything is flushed once the context manager exits.
+    ```
+    """
+
+    def __init__(
+        self,
+        organization_id: UUID,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        copy_threshold: int = DEFAULT_COPY_THRESHOLD,
+        commit: bool = True,
+    ):
+        """Initialize the write buffer.
+
+        Args:
+            organization_id: The organization the rows belong to
+            flush_size: Number of buffered rows that triggers a flush
+            flush_interval: Maximum time in seconds between flushes
+            copy_threshold: Number of rows from which a flush uses COPY
+            commit: Whether to commit the writes, dry runs roll them back instead
+        """
+        self.organization_id = organization_id
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.copy_threshold = copy_threshold
+        self.commit = commit
+
+        # Keyed by entity id: a later write for the same entity replaces the earlier one,
+        # since a single upsert statement cannot touch the same row twice
+        self._rows: dict[str, tuple[UUID, schemas.EntityCreate]] = {}
+        self._lock = asyncio.Lock()
+        self._flusher_task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "EntityWriteBuffer":
+        """Start the periodic flusher."""
+        self._flusher_task = asyncio.create_task(self._flush_periodically())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop the periodic flusher and flush the remaining rows.
+
+        Rows are flushed on failure too, since their points have already been written to
+        the destinations.
+        """
+        if self._flusher_task:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._flusher_task = None
+        await self.flush()
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return len(self._rows)
+
+    async def add(self, db_entity_id: UUID, obj_in: schemas.EntityCreate) -> None:
+        """Buffer a row, flushing if the buffer is full.
+
+        Args:
+            db_entity_id: The primary key to use if the row is new
+            obj_in: The entity row to write
+        """
+        self._rows[obj_in.entity_id] = (db_entity_id, obj_in)
+        if len(self._rows) >= self.flush_size:
+            await self.flush()
+
+    async def discard(self, entity_ids: list[str]) -> None:
+        """Drop buffered rows of entities that are about to be deleted.
+
+        Waits for a running flush, so no row of these entities is written after the call.
+        """
+        async with self._lock:
+            for entity_id in entity_ids:
+                self._rows.pop(entity_id, None)
+
+    async def flush(self) -> None:
+        """Write all buffered rows to the database."""
+        async with self._lock:
+            if not self._rows:
+                return
+            rows, self._rows = self._rows, {}
+            objs_in = dict(rows.values())
+
+            try:
+                async with get_db_context() as db:
+                    uow = None if self.commit else UnitOfWork(db)
+                    if len(objs_in) >= self.copy_threshold:
+                        await crud.entity.bulk_upsert_copy(
+                            db, objs_in=objs_in, organization_id=self.organization_id, uow=uow
+                        )
+                    else:
+                        await crud.entity.bulk_upsert(
+                            db, objs_in=objs_in, organization_id=self.organization_id, uow=uow
+                        )
+                    if uow:
+                        await uow.rollback()
+            except Exception:
+                # Put the rows back without overwriting newer writes, so a retry can pick
+                # them up
+                self._rows = {**rows, **self._rows}
+                raise
+
+    async def _flush_periodically(self) -> None:
+        """Flush the buffer on a timer."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing entity rows: {e}")
+
+
+class NullEntityWriteBuffer(EntityWriteBuffer):
+    """Write buffer that drops its rows, for dry runs that skip database writes."""
+
+    async def flush(self) -> None:
+        """Drop all buffered rows."""
+        async with self._lock:
+            self._rows = {}
@@ -0,0 +1,177 @@
+"""Process-wide fair-share scheduling of sync work across concurrently running jobs."""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+
+
+@dataclass
+class _JobShare:
+    """Bookkeeping for one registered sync job."""
+
+    job_id: UUID
+    organization_id: UUID
+    weight: float
+    in_use: int = 0
+    waiters: deque = field(default_factory=deque)
+
+
+class FairShareScheduler:
+    """Divides a global concurrency budget across active sync jobs and organizations.
+
+    Every unit of sync work (a batch handled by one of a job's pipeline stages) holds one
+    slot while it runs. While slots are free they are granted immediately, so a lone job can
+    use the whole budget. Once the budget is exhausted, each freed slot goes to the
+    organization with the lowest weighted usage (slots in use / organization weight), and
+    within it to the job with the lowest weighted usage. A huge sync therefore gives up slots
+    to a newly started small one as its batches complete, instead of starving it.
+
+    Usage:
+    -----
+    ```python
+    async with fair_share_scheduler.job(sync_job.id, organization_id):
+        async with fair_share_scheduler.slot(sync_job.id):
+            ...  # process a batch
+    ```
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        organization_weights: Optional[dict[str, float]] = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: Global number of slots shared by all jobs in this process
+            organization_weights: Relative weight per organization id, defaults to 1.0
+        """
+        self.max_concurrency = max_concurrency
+        self.organization_weights = {
+            UUID(organization_id): weight
+            for organization_id, weight in (organization_weights or {}).items()
+        }
+        self._jobs: dict[UUID, _JobShare] = {}
+        self._in_use = 0
+
+    @property
+    def active_jobs(self) -> int:
+        """Number of registered jobs."""
+        return len(self._jobs)
+
+    @property
+    def in_use(self) -> int:
+        """Number of slots currently held."""
+        return self._in_use
+
+    def set_organization_weight(self, organization_id: UUID, weight: float) -> None:
+        """Set the relative weight of an organization."""
+        if weight <= 0:
+            raise ValueError("Weight must be positive")
+        self.organization_weights[organization_id] = weight
+
+    @asynccontextmanager
+    async def job(
+        self, job_id: UUID, organization_id: UUID, weight: float = 1.0
+    ) -> AsyncIterator[None]:
+        """Register a job for the duration of the context.
+
+        Args:
+            job_id: The sync job ID
+            organization_id: The organization the job belongs to
+            weight: Relative weight of the job within its organization
+        """
+        if weight <= 0:
+            raise ValueError("Weight must be positive")
+        self._jobs[job_id] = _JobShare(job_id, organization_id, weight)
+        logger.info(f"Registered sync job {job_id} with scheduler ({self.active_jobs} active)")
+        try:
+            yield
+        finally:
+            share = self._jobs.pop(job_id)
+            for waiter in share.waiters:
+                waiter.cancel()
+
+    @asynccontextmanager
+    async def slot(self, job_id: UUID) -> AsyncIterator[None]:
+        """Hold one slot of the global budget for a job for the duration of the context."""
+        await self._acquire(job_id)
+        try:
+            yield
+        finally:
+            self._release(job_id)
+
+    async def _acquire(self, job_id: UUID) -> None:
+        share = self._jobs[job_id]
+        if self._in_use < self.max_concurrency and not self._has_waiters():
+            self._grant(share)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        share.waiters.append(waiter)
+        try:
+            # The slot is accounted to this job by the releaser before the waiter resolves
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted and cancelled at the same time: hand the slot on
+                self._release(job_id)
+            elif waiter in share.waiters:
+                share.waiters.remove(waiter)
+            raise
+
+    def _release(self, job_id: UUID) -> None:
+        self._in_use -= 1
+        share = self._jobs.get(job_id)
+        if share:
+            share.in_use -= 1
+
+        while next_share := self._pick_next():
+            waiter = next_share.waiters.popleft()
+            if waiter.done():
+                # Cancelled, its task has not run its cleanup yet: skip it
+                continue
+            self._grant(next_share)
+            waiter.set_result(None)
+            return
+
+    def _grant(self, share: _JobShare) -> None:
+        self._in_use += 1
+        share.in_use += 1
+
+    def _has_waiters(self) -> bool:
+        return any(not waiter.done() for share in self._jobs.values() for waiter in share.waiters)
+
+    def _pick_next(self) -> Optional[_JobShare]:
+        """Pick the waiting job that is furthest below its fair share."""
+        if self._in_use >= self.max_concurrency:
+            return None
+
+        organization_usage: dict[UUID, int] = {}
+        for share in self._jobs.values():
+            organization_usage[share.organization_id] = (
+                organization_usage.get(share.organization_id, 0) + share.in_use
+            )
+
+        def weighted_usage(share: _JobShare) -> tuple[float, float]:
+            organization_weight = self.organization_weights.get(share.organization_id, 1.0)
+            return (
+                organization_usage[share.organization_id] / organization_weight,
+                share.in_use / share.weight,
+            )
+
+        waiting = [share for share in self._jobs.values() if share.waiters]
+        return min(waiting, key=weighted_usage, default=None)
+
+
+# Singleton instance
+fair_share_scheduler = FairShareScheduler(
+    max_concurrency=settings.SYNC_MAX_CONCURRENCY,
+    organization_weights=settings.SYNC_ORGANIZATION_WEIGHTS,
+)
@@ -0,0 +1,213 @@
+"""Adaptive concurrency limiting for sync work that calls external services."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Optional
+
+import httpx
+
+from airweave.core.logging import logger
+
+# HTTP status codes that mean the service wants us to slow down
+OVERLOAD_STATUS_CODES = {429, 503}
+
+# Defaults of the AIMD controller
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_LATENCY_TOLERANCE = 2.0  # cut when p95 exceeds this multiple of the baseline
+DEFAULT_LATENCY_WINDOW = 50  # number of latency samples the p95 is computed over
+# How fast the latency baseline follows a lasting change in p95, per evaluation
+_BASELINE_SMOOTHING = 0.1
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether an error signals an overloaded service: a timeout, a 429 or a 503.
+
+    The cause chain is followed, so errors wrapped by a client library are recognized.
+    Status codes are read from `status_code` (OpenAI, Qdrant) or `response.status_code`
+    (httpx).
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException)):
+            return True
+        status_code = getattr(error, "status_code", None)
+        response = getattr(error, "response", None)
+        if status_code is None and response is not None:
+            status_code = getattr(response, "status_code", None)
+        if status_code in OVERLOAD_STATUS_CODES:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class ConcurrencyLimiter:
+    """Limits concurrent work, adapting the limit with AIMD when given a range.
+
+    With `min_limit == max_limit` the limiter is a plain fixed-size limit. Otherwise the
+    limit is additively increased by one after every full round of successful calls (as
+    many successes as the current limit), and multiplicatively decreased when a call fails
+    with an overload error (see `is_overload_error`) or when the p95 latency over the recent
+    window rises above `latency_tolerance` times its baseline.
+
+    Calls that started before the latest decrease cannot trigger another one, so a burst of
+    failures caused by a single overload cuts the limit once instead of collapsing it.
+
+    Usage:
+    -----
+    ```python
+    limiter = ConcurrencyLimiter(initial_limit=4, min_limit=1, max_limit=32)
+    await limiter.acquire()
+    start = time.monotonic()
+    try:
+        await call_service()
+    except Exception as e:
+        limiter.record_error(e, start)
+    else:
+        limiter.record_success(time.monotonic() - start, start)
+    finally:
+        limiter.release()
+    ```
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+        latency_window: int = DEFAULT_LATENCY_WINDOW,
+        name: str = "limiter",
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: The starting concurrency limit
+            min_limit: Lowest limit to decrease to, defaults to the initial limit
+            max_limit: Highest limit to increase to, defaults to the initial limit
+            decrease_factor: Factor the limit is multiplied with on overload
+            latency_tolerance: Multiple of the baseline p95 latency that counts as overload
+            latency_window: Number of recent latencies the p95 is computed over
+            name: Name used in log messages
+        """
+        self.min_limit = min_limit if min_limit is not None else initial_limit
+        self.max_limit = max_limit if max_limit is not None else initial_limit
+        if not 1 <= self.min_limit <= initial_limit <= self.max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("Decrease factor must be between 0 and 1")
+
+        self.limit = initial_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.name = name
+
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self._baseline_p95: Optional[float] = None
+        self._successes = 0
+        self._last_decrease = 0.0
+
+    @property
+    def adaptive(self) -> bool:
+        """Whether the limit can change at all."""
+        return self.min_limit < self.max_limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of acquired slots."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait until the number of calls in flight is below the limit, and take a slot."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # The slot is accounted to this waiter before it resolves
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted and cancelled at the same time: hand the slot on
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Give back a slot."""
+        self._in_flight -= 1
+        self._wake()
+
+    def record_success(self, latency: float, started_at: float) -> None:
+        """Record a successful call and increase the limit after a healthy round.
+
+        Args:
+            latency: Duration of the call in seconds
+            started_at: `time.monotonic()` at the start of the call
+        """
+        if not self.adaptive:
+            return
+        self._latencies.append(latency)
+        self._successes += 1
+        if self._successes < self.limit:
+            return
+        self._successes = 0
+
+        p95 = self._p95()
+        if p95 is not None:
+            if self._baseline_p95 is None or p95 < self._baseline_p95:
+                self._baseline_p95 = p95
+            elif p95 > self._baseline_p95 * self.latency_tolerance:
+                # Let the baseline follow a lasting slowdown, so we don't cut forever
+                self._baseline_p95 += (p95 - self._baseline_p95) * _BASELINE_SMOOTHING
+                if started_at >= self._last_decrease:
+                    self._decrease(f"p95 latency rose to {p95:.2f}s")
+                return
+
+        if self.limit < self.max_limit:
+            self.limit += 1
+            self._wake()
+
+    def record_error(self, error: BaseException, started_at: float) -> None:
+        """Record a failed call, decreasing the limit if the error signals overload.
+
+        Args:
+            error: The error the call failed with
+            started_at: `time.monotonic()` at the start of the call
+        """
+        if not self.adaptive or not is_overload_error(error):
+            return
+        if started_at >= self._last_decrease:
+            self._decrease(f"overload error: {error}")
+
+    def _decrease(self, reason: str) -> None:
+        new_limit = max(self.min_limit, math.floor(self.limit * self.decrease_factor))
+        if new_limit < self.limit:
+            logger.info(f"Decreasing {self.name} concurrency {self.limit} -> {new_limit}: {reason}")
+        self.limit = new_limit
+        self._successes = 0
+        self._latencies.clear()
+        self._last_decrease = time.monotonic()
+
+    def _p95(self) -> Optional[float]:
+        """The p95 of the recent latencies, once the window is at least half full."""
+        if len(self._latencies) < max(1, self._latencies.maxlen // 2):
+            return None
+        latencies = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, math.ceil(0.95 * len(latencies)) - 1)]
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
@@ -2,151 +2,70 @@
 
 import asyncio
 from datetime import datetime
-from typing import Any, Callable, List, Optional
+from typing import AsyncGenerator, List, Optional
+from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import crud, schemas
+from airweave.core.exceptions import CursorExpiredError
 from airweave.core.logging import logger
 from airweave.core.shared_models import SyncJobStatus
 from airweave.core.sync_job_service import sync_job_service
 from airweave.db.session import get_db_context
-from airweave.platform.entities._base import BaseEntity, DestinationAction
+from airweave.platform.embedding_models.batcher import embedding_batchers
+from airweave.platform.embedding_models.cache import embedding_cache
+from airweave.platform.entities._base import (
+    BaseEntity,
+    DeletedEntity,
+    DestinationAction,
+    FileEntity,
+)
+from airweave.platform.file_handling.file_store import file_store
 from airweave.platform.sync.context import SyncContext
+from airweave.platform.sync.fair_share import FairShareScheduler, fair_share_scheduler
+from airweave.platform.sync.pipeline import PipelineStage, StageConfig, StagedPipeline
 from airweave.platform.sync.stream import AsyncSourceStream
 
+# Micro-batching default: flush a batch when it is full or when its first item has waited this
+# long, so slow sources still make steady progress
+DEFAULT_MAX_BATCH_LATENCY = 0.2  # seconds
 
-# Worker Pool Pattern
-class AsyncWorkerPool:
-    """Manages a pool of workers with controlled concurrency.
+# Stages are sized by their bottleneck: preparation is cheap, transformation converts and
+# chunks files one at a time, embedding and persisting batch many entities per request.
+# Stages calling external services adapt their worker count to how those services respond.
+DEFAULT_STAGE_CONFIGS = {
+    "prepare": StageConfig(workers=2, batch_size=100),
+    "transform": StageConfig(workers=10, batch_size=1, max_workers=32),
+    "embed": StageConfig(workers=4, batch_size=50, max_workers=32),
+    "persist": StageConfig(workers=2, batch_size=100, max_workers=16),
+}
 
-    This class limits how many async tasks can run at once using a semaphore,
-    preventing system overload when processing many items in parallel.
-    """
-
-    def __init__(self, max_workers: int = 20):
-        """Initialize worker pool with concurrency control.
-
-        Args:
-            max_workers: Maximum number of tasks allowed to run concurrently
-        """
-        self.semaphore = asyncio.Semaphore(max_workers)
-        self.pending_tasks = set()
-        self.max_workers = max_workers
-
-    async def submit(self, coro: Callable, *args, **kwargs) -> asyncio.Task:
-        """Submit a coroutine to be executed by the worker pool.
-
-        Creates a task, adds it to our tracking set, and returns it.
-        Tasks run with controlled concurrency through the semaphore.
-
-        Args:
-            coro: The coroutine function to execute
-            *args: Arguments to pass to the coroutine
-            **kwargs: Keyword arguments to pass to the coroutine
-
-        Returns:
-            The created task object
-        """
-        # Create a task that will run the coroutine with semaphore control
-        task = asyncio.create_task(self._run_with_semaphore(coro, *args, **kwargs))
-        # Track the task so we can wait for it later
-        self.pending_tasks.add(task)
-        # Set up automatic cleanup when task finishes
-        task.add_done_callback(self._handle_task_completion)
-        return task
-
-    async def _run_with_semaphore(self, coro: Callable, *args, **kwargs) -> Any:
-        """Run a coroutine with semaphore control.
-
-        Acquires a semaphore before running the coroutine, limiting concurrency.
-        Semaphore is automatically released when coroutine completes.
-
-        Args:
-            coro: The coroutine function to execute
-            *args: Arguments to pass to the coroutine
-            **kwargs: Keyword arguments to pass to the coroutine
-
-        Returns:
-            The result of the coroutine - can be anything
-        """
-        # The 'async with' ensures semaphore (or "slot") is released even if an exception occurs
-        async with self.semaphore:
-            # Only N coroutines can be in this block at once (N = max_workers)
-            return await coro(*args, **kwargs)
-
-    def _handle_task_completion(self, task: asyncio.Task) -> None:
-        """Handle task completion and clean up.
-
-        Removes completed task from our tracking set and logs any errors.
-        Called automatically when a task completes.
 
-        Args:
-            task: The completed task
-        """
-        # Remove the task from our tracking set
-        self.pending_tasks.discard(task)
-        # Log if the task failed with an exception
-        if not task.cancelled() and task._exception:
-            logger.error(f"Task failed: {task._exception}")
+# How often a running sync saves how far it got, so a failed job can be resumed
+DEFAULT_CHECKPOINT_INTERVAL = 60.0  # seconds
 
-    async def wait_for_batch(self, timeout: float = 0.5) -> None:
-        """Wait for some tasks to complete.
+# Number of orphaned entities deleted per query and destination request
+ORPHAN_PAGE_SIZE = 1000
 
-        Useful when you want to throttle submission rate or process
-        results in batches without waiting for all tasks to finish.
+# Fields left out of the text an entity is embedded by, since they change between syncs
+EMBEDDING_EXCLUDE_FIELDS = sorted(BaseEntity.hash_exclude_fields | {"sync_id"})
 
-        Args:
-            timeout: Maximum time to wait in seconds
-        """
-        if not self.pending_tasks:
-            return
-
-        # Wait for at least one task to complete or until timeout
-        # FIRST_COMPLETED means we'll return as soon as any task finishes
-        done, _ = await asyncio.wait(
-            self.pending_tasks, return_when=asyncio.FIRST_COMPLETED, timeout=timeout
-        )
-
-        # Process completed tasks, extracting results or catching exceptions
-        for task in done:
-            try:
-                # Await the task to get its result or propagate any exceptions
-                await task
-            except Exception as e:
-                logger.error(f"Error in worker task: {e}")
-
-    async def wait_for_completion(self) -> None:
-        """Wait for all tasks to complete.
-
-        Processes tasks in batches to avoid memory issues with large sets.
-        Should be called before ending a program to ensure all work is done.
-        """
-        while self.pending_tasks:
-            # Process in batches to avoid memory issues with large task sets
-            # Take a slice of the pending tasks equal to double the max worker count
-            current_batch = list(self.pending_tasks)[: self.max_workers * 2]
-            if not current_batch:
-                break
-
-            # Wait for all tasks in this batch to complete (with a timeout for safety)
-            # ALL_COMPLETED means we'll wait until every task in the batch is done
-            done, _ = await asyncio.wait(
-                current_batch, return_when=asyncio.ALL_COMPLETED, timeout=10
-            )
-
-            # Check for exceptions in completed tasks
-            for task in done:
-                try:
-                    # Await the task to get its result or propagate any exceptions
-                    await task
-                except Exception as e:
-                    logger.error(f"Task error during completion: {e}")
+# Items passed between the stages: (entity, db entity id, action) after preparation, and
+# (parent entity, processed entities, db entity id, action) after transformation
+PreparedEntity = tuple[BaseEntity, Optional[UUID], DestinationAction]
+TransformedEntity = tuple[BaseEntity, List[BaseEntity], Optional[UUID], DestinationAction]
 
 
 # Pipeline Pattern
 class EntityProcessor:
-    """Processes entities through a pipeline of stages."""
+    """Processes entities through a pipeline of stages.
+
+    Entities are processed in micro-batches: every stage runs once for the whole batch, so a
+    batch costs one embedding request and one write per destination, instead of one of each
+    per entity. Each stage is a method of its own, so the orchestrator can run the stages
+    with independent concurrency.
+    """
 
     async def process(
         self,
@@ -155,32 +74,116 @@ class EntityProcessor:
         sync_context: SyncContext,
         db: AsyncSession,
     ) -> List[BaseEntity]:
-        """Process an entity through the complete pipeline."""
-        # Stage 1: Enrich entity with metadata
-        enriched_entity = await self._enrich(entity, sync_context)
-
-        # Stage 2: Determine action for entity
-        db_entity, action = await self._determine_action(enriched_entity, sync_context, db)
-
-        # Stage 2.5: Skip further processing if KEEP
-        if action == DestinationAction.KEEP:
-            await sync_context.progress.increment("kept", 1)
-            return []
+        """Process a single entity through the complete pipeline."""
+        return await self.process_batch([entity], source_node, sync_context, db)
 
-        # Stage 3: Process entity through DAG
-        processed_entities = await self._transform(enriched_entity, source_node, sync_context, db)
+    async def process_batch(
+        self,
+        entities: List[BaseEntity],
+        source_node: schemas.DagNode,
+        sync_context: SyncContext,
+        db: AsyncSession,
+    ) -> List[BaseEntity]:
+        """Process a batch of entities through the complete pipeline."""
+        prepared = await self.prepare(entities, sync_context)
+        transformed = await self.transform(prepared, source_node, sync_context, db)
+        await self.embed(transformed, sync_context)
+        await self.persist(transformed, sync_context)
+
+        return [entity for _, processed, _, _ in transformed for entity in processed]
+
+    async def prepare(
+        self, entities: List[BaseEntity], sync_context: SyncContext
+    ) -> List[PreparedEntity]:
+        """Enrich a batch and determine its actions, dropping entities that need no work."""
+        enriched_entities = [await self._enrich(entity, sync_context) for entity in entities]
+        deduplicated_entities = self._deduplicate(enriched_entities)
+        if len(deduplicated_entities) < len(enriched_entities):
+            remaining = {id(entity) for entity in deduplicated_entities}
+            for entity in enriched_entities:
+                if id(entity) not in remaining:
+                    self._release_file(entity, sync_context)
+                    sync_context.checkpoint_tracker.complete(entity)
+        enriched_entities = deduplicated_entities
+
+        actions = await self._determine_actions(enriched_entities, sync_context)
+
+        # Skip further processing if KEEP
+        prepared = []
+        kept = 0
+        for entity, (db_entity_id, action, entity_hash) in zip(
+            enriched_entities, actions, strict=True
+        ):
+            if action == DestinationAction.DELETE and db_entity_id is None:
+                # Deleted before this sync stored it, nothing to do
+                sync_context.checkpoint_tracker.complete(entity)
+            elif action == DestinationAction.KEEP:
+                kept += 1
+                self._release_file(entity, sync_context)
+                # Mark the entity as seen by this job, so the orphan pass leaves it alone
+                await sync_context.entity_writer.add(
+                    db_entity_id, self._entity_row(entity.entity_id, entity_hash, sync_context)
+                )
+                sync_context.checkpoint_tracker.complete(entity)
+            else:
+                prepared.append((entity, db_entity_id, action))
+        if kept:
+            await sync_context.progress.increment("kept", kept)
+        return prepared
 
-        # Stage 4: Compute vector
-        processed_entities_with_vector = await self._compute_vector(
-            processed_entities, sync_context
+    async def transform(
+        self,
+        prepared: List[PreparedEntity],
+        source_node: schemas.DagNode,
+        sync_context: SyncContext,
+        db: AsyncSession,
+    ) -> List[TransformedEntity]:
+        """Process prepared entities through the DAG."""
+        transformed = []
+        for entity, db_entity_id, action in prepared:
+            if action == DestinationAction.DELETE:
+                transformed.append((entity, [], db_entity_id, action))
+                continue
+            try:
+                processed_entities = await self._transform(entity, source_node, sync_context, db)
+            except Exception as e:
+                # A single broken entity should not fail the rest of the batch
+                logger.error(f"Error transforming entity {entity.entity_id}: {e}")
+                await sync_context.progress.increment("failed", 1)
+                sync_context.checkpoint_tracker.complete(entity)
+                continue
+            finally:
+                # The file has been chunked, nothing reads it anymore
+                self._release_file(entity, sync_context)
+            transformed.append((entity, processed_entities, db_entity_id, action))
+        return transformed
+
+    async def embed(
+        self, transformed: List[TransformedEntity], sync_context: SyncContext
+    ) -> List[TransformedEntity]:
+        """Compute vectors for all processed entities of a batch in one request."""
+        await self._compute_vector(
+            [entity for _, processed, _, _ in transformed for entity in processed], sync_context
         )
-
-        # Stage 5: Persist entities based on action
-        await self._persist(
-            enriched_entity, processed_entities_with_vector, db_entity, action, sync_context, db
+        return transformed
+
+    async def persist(
+        self, transformed: List[TransformedEntity], sync_context: SyncContext
+    ) -> List[TransformedEntity]:
+        """Persist a batch of entities based on their actions."""
+        deletes = [
+            (entity, db_entity_id)
+            for entity, _, db_entity_id, action in transformed
+            if action == DestinationAction.DELETE
+        ]
+        if deletes:
+            await self._delete_entities(deletes, sync_context)
+        await self._persist_batch(
+            [item for item in transformed if item[3] != DestinationAction.DELETE], sync_context
         )
-
-        return processed_entities
+        for parent_entity, *_ in transformed:
+            sync_context.checkpoint_tracker.complete(parent_entity)
+        return transformed
 
     async def _enrich(self, entity: BaseEntity, sync_context: SyncContext) -> BaseEntity:
         """Enrich entity with sync metadata."""
@@ -195,23 +198,58 @@ class EntityProcessor:
 
         return entity
 
-    async def _determine_action(
-        self, entity: BaseEntity, sync_context: SyncContext, db: AsyncSession
-    ) -> tuple[schemas.Entity, DestinationAction]:
-        """Determine what action to take for an entity."""
-        db_entity = await crud.entity.get_by_entity_and_sync_id(
-            db=db, entity_id=entity.entity_id, sync_id=sync_context.sync.id
-        )
+    @staticmethod
+    def _release_file(entity: BaseEntity, sync_context: SyncContext) -> None:
+        """Release the downloaded file of an entity to the file store, once."""
+        if isinstance(entity, FileEntity) and entity.local_path in sync_context.held_files:
+            sync_context.held_files.discard(entity.local_path)
+            file_store.release(entity.local_path)
+
+    def _deduplicate(self, entities: List[BaseEntity]) -> List[BaseEntity]:
+        """Keep only the last occurrence of each entity id within a batch.
+
+        Two copies of the same entity in one batch would both be seen as INSERT and collide
+        on the (sync_id, entity_id) constraint.
+        """
+        by_entity_id = {entity.entity_id: entity for entity in entities}
+        if len(by_entity_id) < len(entities):
+            logger.info(f"Dropped {len(entities) - len(by_entity_id)} duplicate entities in batch")
+        return list(by_entity_id.values())
+
+    async def _determine_actions(
+        self, entities: List[BaseEntity], sync_context: SyncContext
+    ) -> List[tuple[Optional[UUID], DestinationAction, Optional[str]]]:
+        """Determine what action to take for each entity in a batch.
+
+        Decisions are answered from the in-memory entity index built at sync start, so no
+        database lookup is needed.
+
+        Returns:
+            Tuples of (db entity id, action, hash), the hash is only computed for entities
+            that are already stored
+        """
+        entity_index = sync_context.entity_index
 
-        if db_entity:
-            if db_entity.hash != entity.hash():
-                action = DestinationAction.UPDATE
+        actions = []
+        for entity in entities:
+            # On the first run of a sync there is nothing to compare against
+            db_entity_id = (
+                None if entity_index.is_empty else entity_index.get_db_entity_id(entity.entity_id)
+            )
+            entity_hash = None
+            if isinstance(entity, DeletedEntity):
+                action = DestinationAction.DELETE
+            elif db_entity_id is None:
+                action = DestinationAction.INSERT
             else:
-                action = DestinationAction.KEEP
-        else:
-            action = DestinationAction.INSERT
+                entity_hash = entity.hash()
+                if entity_index.has_changed(entity.entity_id, entity_hash):
+                    action = DestinationAction.UPDATE
+                else:
+                    action = DestinationAction.KEEP
+            actions.append((db_entity_id, action, entity_hash))
 
-        return db_entity, action
+        return actions
 
     async def _transform(
         self,
@@ -227,36 +265,6 @@ class EntityProcessor:
             entity=entity,
         )
 
-    async def _persist(
-        self,
-        parent_entity: BaseEntity,
-        processed_entities: List[BaseEntity],
-        db_entity: schemas.Entity,
-        action: DestinationAction,
-        sync_context: SyncContext,
-        db: AsyncSession,
-    ) -> None:
-        """Persist entities to destinations based on action.
-
-        Args:
-            parent_entity: The parent entity of the processed entities
-            processed_entities: The entities to persist
-            db_entity: The database entity to update
-            action: The action to take
-            sync_context: The sync context
-            db: The database session
-        """
-        if action == DestinationAction.KEEP:
-            await self._handle_keep(sync_context)
-        elif action == DestinationAction.INSERT:
-            await self._handle_insert(
-                parent_entity, processed_entities, db_entity, sync_context, db
-            )
-        elif action == DestinationAction.UPDATE:
-            await self._handle_update(
-                parent_entity, processed_entities, db_entity, sync_context, db
-            )
-
     async def _compute_vector(
         self,
         processed_entities: List[BaseEntity],
@@ -271,74 +279,100 @@ class EntityProcessor:
         Returns:
             The entities with vector computed
         """
+        if not processed_entities:
+            return processed_entities
+
+        # Cached vectors are reused, the others are requested in batches shared with other
+        # workers and syncs
         embedding_model = sync_context.embedding_model
-        embeddings = await embedding_model.embed_many(
-            [str(entity.to_storage_dict()) for entity in processed_entities]
+        embeddings = await embedding_cache.embed_many(
+            embedding_model,
+            [self._embedding_text(entity) for entity in processed_entities],
+            embedding_batchers.get(embedding_model).embed_many,
         )
         for processed_entity, vector in zip(processed_entities, embeddings, strict=False):
             processed_entity.vector = vector
 
         return processed_entities
 
-    async def _handle_keep(self, sync_context: SyncContext) -> None:
-        """Handle KEEP action."""
-        await sync_context.progress.increment(kept=1)
+    @staticmethod
+    def _embedding_text(entity: BaseEntity) -> str:
+        """Build the text an entity is embedded by.
 
-    async def _handle_insert(
+        Fields that differ between syncs of an unchanged entity are left out, so the text,
+        and the cached vector of it, stay the same.
+        """
+        return str(entity.to_storage_dict(exclude_fields=EMBEDDING_EXCLUDE_FIELDS))
+
+    async def _persist_batch(
         self,
-        parent_entity: BaseEntity,
-        processed_entities: List[BaseEntity],
-        db_entity: Optional[schemas.Entity],
+        transformed: List[TransformedEntity],
         sync_context: SyncContext,
-        db: AsyncSession,
     ) -> None:
-        """Handle INSERT action."""
-        if len(processed_entities) == 0:
-            logger.info("No processed entities to insert")
-            return
+        """Persist a batch of entities to the database and destinations.
 
-        # Prepare entities with parent reference
-        for processed_entity in processed_entities:
-            if (
-                not hasattr(processed_entity, "parent_entity_id")
-                or not processed_entity.parent_entity_id
-            ):
-                processed_entity.parent_entity_id = parent_entity.entity_id
+        Args:
+            transformed: Tuples of (parent entity, processed entities, db entity id, action)
+            sync_context: The sync context
+        """
+        inserts = []
+        updates = []
+        for parent_entity, processed_entities, db_entity_id, action in transformed:
+            if len(processed_entities) == 0:
+                # TODO: keep track of skipped entities that could not be processed
+                logger.info(f"No processed entities to {action.value}: {parent_entity.entity_id}")
+                if action == DestinationAction.UPDATE:
+                    await self._mark_seen_unchanged(parent_entity, db_entity_id, sync_context)
+                continue
+
+            self._set_parent_reference(parent_entity, processed_entities)
+            if action == DestinationAction.INSERT:
+                inserts.append((parent_entity, processed_entities))
+            elif action == DestinationAction.UPDATE:
+                updates.append((parent_entity, processed_entities, db_entity_id))
+
+        if not inserts and not updates:
+            return
 
-        # Insert into database
-        new_db_entity = await crud.entity.create(
-            db=db,
-            obj_in=schemas.EntityCreate(
-                sync_job_id=sync_context.sync_job.id,
-                sync_id=sync_context.sync.id,
-                entity_id=parent_entity.entity_id,
-                hash=parent_entity.hash(),
-            ),
-            organization_id=sync_context.sync.organization_id,
-        )
-        parent_entity.db_entity_id = new_db_entity.id
+        await self._write_db_entities(inserts, updates, sync_context)
 
-        # Insert to destinations
+        # Update in destinations (delete then insert), then insert everything in one write
+        updated_parent_ids = [parent_entity.entity_id for parent_entity, _, _ in updates]
+        entities_to_insert = [
+            entity
+            for _, processed_entities, *_ in inserts + updates
+            for entity in processed_entities
+        ]
         for destination in sync_context.destinations:
-            await destination.bulk_insert(processed_entities)
+            await destination.bulk_delete_by_parent_ids(updated_parent_ids, sync_context.sync.id)
+            await destination.bulk_insert(entities_to_insert)
 
-        await sync_context.progress.increment("inserted", 1)
+        if inserts:
+            await sync_context.progress.increment("inserted", len(inserts))
+        if updates:
+            await sync_context.progress.increment("updated", len(updates))
 
-    async def _handle_update(
-        self,
-        parent_entity: BaseEntity,
-        processed_entities: List[BaseEntity],
-        db_entity: schemas.Entity,
-        sync_context: SyncContext,
-        db: AsyncSession,
+    async def _delete_entities(
+        self, deletes: List[tuple[BaseEntity, UUID]], sync_context: SyncContext
     ) -> None:
-        """Handle UPDATE action."""
-        if len(processed_entities) == 0:
-            # TODO: keep track of skipped entities that could not be processed
-            logger.info("No processed entities to update")
-            return
+        """Delete entities the source reported as removed, everywhere they are stored."""
+        entity_ids = [entity.entity_id for entity, _ in deletes]
+        for destination in sync_context.destinations:
+            await destination.bulk_delete_by_parent_ids(entity_ids, sync_context.sync.id)
+
+        # A buffered row would bring the entity back after it is removed
+        await sync_context.entity_writer.discard(entity_ids)
+        async with get_db_context() as db:
+            await crud.entity.bulk_remove(db, ids=[db_entity_id for _, db_entity_id in deletes])
+        for entity_id in entity_ids:
+            sync_context.entity_index.remove(entity_id)
+
+        await sync_context.progress.increment("deleted", len(deletes))
 
-        # Prepare entities with parent reference
+    def _set_parent_reference(
+        self, parent_entity: BaseEntity, processed_entities: List[BaseEntity]
+    ) -> None:
+        """Prepare entities with parent reference."""
         for processed_entity in processed_entities:
             if (
                 not hasattr(processed_entity, "parent_entity_id")
@@ -346,31 +380,101 @@ class EntityProcessor:
             ):
                 processed_entity.parent_entity_id = parent_entity.entity_id
 
-        # Update hash in database
-        await crud.entity.update(
-            db=db,
-            db_obj=db_entity,
-            obj_in=schemas.EntityUpdate(hash=parent_entity.hash()),
-        )
-        parent_entity.db_entity_id = db_entity.id
+    async def _write_db_entities(
+        self,
+        inserts: List[tuple[BaseEntity, List[BaseEntity]]],
+        updates: List[tuple[BaseEntity, List[BaseEntity], UUID]],
+        sync_context: SyncContext,
+    ) -> None:
+        """Queue entity rows for the write-behind buffer and update the entity index.
 
-        # Update in destinations (delete then insert)
-        for destination in sync_context.destinations:
-            await destination.bulk_delete_by_parent_id(
-                parent_entity.entity_id, sync_context.sync.id
+        New rows get a client-assigned primary key, so destinations can be written before
+        the buffer is flushed.
+        """
+        for parent_entity, _ in inserts:
+            parent_entity.db_entity_id = uuid4()
+        for parent_entity, _, db_entity_id in updates:
+            parent_entity.db_entity_id = db_entity_id
+
+        for parent_entity, *_ in inserts + updates:
+            entity_hash = parent_entity.hash()
+            await sync_context.entity_writer.add(
+                parent_entity.db_entity_id,
+                self._entity_row(parent_entity.entity_id, entity_hash, sync_context),
+            )
+            # Keep the index current, so later batches of this job see these entities
+            sync_context.entity_index.put(
+                parent_entity.entity_id, entity_hash, parent_entity.db_entity_id
             )
-            await destination.bulk_insert(processed_entities)
 
-        await sync_context.progress.increment("updated", 1)
+    async def _mark_seen_unchanged(
+        self, parent_entity: BaseEntity, db_entity_id: UUID, sync_context: SyncContext
+    ) -> None:
+        """Mark a stored entity as seen by this job, keeping the version it had.
+
+        Used for an update that produced nothing to store: the orphan pass must not delete
+        the entity, and keeping its old hash makes the next run try the update again.
+        """
+        stored_hash = sync_context.entity_index.get_hash(parent_entity.entity_id)
+        await sync_context.entity_writer.add(
+            db_entity_id,
+            self._entity_row(
+                parent_entity.entity_id, stored_hash or parent_entity.hash(), sync_context
+            ),
+        )
+
+    def _entity_row(
+        self, entity_id: str, entity_hash: str, sync_context: SyncContext
+    ) -> schemas.EntityCreate:
+        """Build the entity row recording that this sync job saw an entity."""
+        return schemas.EntityCreate(
+            sync_job_id=sync_context.sync_job.id,
+            sync_id=sync_context.sync.id,
+            entity_id=entity_id,
+            hash=entity_hash,
+        )
 
 
 # Refactored Orchestrator
 class SyncOrchestrator:
-    """Main service for data synchronization with improved architecture."""
+    """Main service for data synchronization with improved architecture.
+
+    A sync runs as a staged pipeline. The source is read by `AsyncSourceStream`, and its
+    entities flow through four stages, connected by bounded queues:
+
+    - prepare: enrich entities and decide INSERT / UPDATE / KEEP (cheap, CPU)
+    - transform: route entities through the DAG, e.g. file conversion and chunking
+    - embed: compute vectors (embedding API)
+    - persist: write to the destinations and the entity table
+
+    Each stage has its own worker count and batch size, see `DEFAULT_STAGE_CONFIGS`.
 
-    def __init__(self):
-        """Initialize the sync orchestrator."""
-        self.worker_pool = AsyncWorkerPool(max_workers=20)
+    Sources that support incremental sync are read in full once, after which every run
+    reads only the changes since the change cursor stored by the previous run.
+    """
+
+    def __init__(
+        self,
+        stage_configs: Optional[dict[str, StageConfig]] = None,
+        max_batch_latency: float = DEFAULT_MAX_BATCH_LATENCY,
+        scheduler: FairShareScheduler = fair_share_scheduler,
+        checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+    ):
+        """Initialize the sync orchestrator.
+
+        Every run gets its own pipeline, so the pending tasks of one sync are never waited
+        on by another. The stages of all runs share the scheduler's global budget.
+
+        Args:
+            stage_configs: Concurrency settings per stage name, overriding the defaults
+            max_batch_latency: Maximum time in seconds to wait for a batch to fill up
+            scheduler: The process-wide scheduler dividing concurrency across syncs
+            checkpoint_interval: How often to save the durable checkpoint, in seconds
+        """
+        self.stage_configs = {**DEFAULT_STAGE_CONFIGS, **(stage_configs or {})}
+        self.max_batch_latency = max_batch_latency
+        self.scheduler = scheduler
+        self.checkpoint_interval = checkpoint_interval
         self.entity_processor = EntityProcessor()
 
     async def run(self, sync_context: SyncContext) -> schemas.Sync:
@@ -379,8 +483,14 @@ class SyncOrchestrator:
             # Get source node from DAG
             source_node = sync_context.dag.get_source_node()
 
-            # Process entity stream
-            await self._process_entity_stream(source_node, sync_context)
+            # Process entity stream with a pipeline of its own
+            async with self.scheduler.job(
+                sync_context.sync_job.id, sync_context.sync.organization_id
+            ):
+                pipeline = self._create_pipeline(source_node, sync_context)
+                if sync_context.dry_run:
+                    sync_context.dry_run.pipeline = pipeline
+                await self._process_entity_stream(sync_context, pipeline)
 
             # Use sync_job_service to update job status
             await sync_job_service.update_status(
@@ -412,52 +522,228 @@ class SyncOrchestrator:
 
             raise
 
-    async def _process_entity_stream(
+    def _create_pipeline(
         self, source_node: schemas.DagNode, sync_context: SyncContext
+    ) -> StagedPipeline:
+        """Create the stages of a sync run."""
+
+        async def transform(prepared: List[PreparedEntity]) -> List[TransformedEntity]:
+            # The session only checks out a connection when the DAG router needs to look up
+            # a transformer it has not cached
+            async with get_db_context() as db:
+                return await self.entity_processor.transform(
+                    prepared, source_node, sync_context, db
+                )
+
+        handlers = {
+            "prepare": lambda entities: self.entity_processor.prepare(entities, sync_context),
+            "transform": transform,
+            "embed": lambda transformed: self.entity_processor.embed(transformed, sync_context),
+            "persist": lambda transformed: self.entity_processor.persist(transformed, sync_context),
+        }
+        return StagedPipeline(
+            [
+                PipelineStage(
+                    name=name,
+                    handler=handler,
+                    config=self.stage_configs[name],
+                    max_batch_latency=self.max_batch_latency,
+                    scheduler=self.scheduler,
+                    job_id=sync_context.sync_job.id,
+                )
+                for name, handler in handlers.items()
+            ]
+        )
+
+    async def _process_entity_stream(
+        self, sync_context: SyncContext, pipeline: StagedPipeline
     ) -> None:
-        """Process stream of entities from source."""
+        """Process stream of entities from source, then delete the ones it no longer has."""
         error_occurred = False
+        tracker = sync_context.checkpoint_tracker
+        entities = self._hold_files(self._generate_entities(sync_context), sync_context)
+        if sync_context.dry_run:
+            entities = sync_context.dry_run.measure_source(entities)
+
+        try:
+            # Use the stream as a context manager
+            async with AsyncSourceStream(tracker.track(entities)) as stream:
+                # Entity rows are written behind, and flushed when the job completes
+                async with sync_context.entity_writer:
+                    checkpointer = asyncio.create_task(self._checkpoint_periodically(sync_context))
+                    try:
+                        # The source stream feeds the first stage in micro-batches
+                        await pipeline.run(
+                            stream.get_entity_batches(
+                                batch_size=pipeline.stages[0].config.batch_size,
+                                max_latency=self.max_batch_latency,
+                            )
+                        )
+                    finally:
+                        checkpointer.cancel()
+
+            await self._complete_stream(sync_context, pipeline)
+
+        except Exception as e:
+            logger.error(f"Error during entity stream processing: {e}")
+            error_occurred = True
+            # Record how far we got, so the next job can resume from there
+            try:
+                await self._save_checkpoint(sync_context)
+            except Exception as checkpoint_error:
+                logger.error(f"Error saving final checkpoint: {checkpoint_error}")
+            raise
+        finally:
+            self._release_held_files(sync_context)
+            if sync_context.dry_run:
+                sync_context.dry_run.finish()
+            # Finalize progress
+            await sync_context.progress.finalize(is_complete=not error_occurred)
+
+    async def _complete_stream(self, sync_context: SyncContext, pipeline: StagedPipeline) -> None:
+        """Delete orphaned entities and store the change cursor after a processed stream."""
+        if sync_context.dry_run:
+            # A dry run leaves nothing behind for later runs
+            return
+
+        # Files the source failed to download were not marked as seen either
+        download_failures = sync_context.source.download_failures
+        if download_failures:
+            await sync_context.progress.increment("failed", download_failures)
+
+        # An entity that could not be processed was not marked as seen, deleting it would
+        # throw away its last good version. Keeping the change cursor where it was makes
+        # the next run read the failed changes again.
+        if pipeline.failed or sync_context.progress.stats.failed:
+            logger.warning(
+                f"Skipping orphan deletion and keeping the change cursor of sync "
+                f"{sync_context.sync.id}: {pipeline.failed} batches and "
+                f"{sync_context.progress.stats.failed} entities failed"
+            )
+            return
+
+        # An incremental run only sees changes, the source reports deletions itself
+        if sync_context.change_cursor is None:
+            await self._delete_orphaned_entities(sync_context)
+        await self._save_change_cursor(sync_context)
+
+    async def _generate_entities(
+        self, sync_context: SyncContext
+    ) -> AsyncGenerator[BaseEntity, None]:
+        """Generate the entities of a run: the changes since the change cursor, or all.
 
-        # Use the stream as a context manager
-        async with AsyncSourceStream(sync_context.source.generate_entities()) as stream:
+        An expired change cursor falls back to a full sync. Entities of changes that were
+        already yielded are simply seen again by the full sync.
+        """
+        source = sync_context.source
+        tracker = sync_context.checkpoint_tracker
+
+        if sync_context.change_cursor is not None:
             try:
-                # Process entities as they come
-                async for entity in stream.get_entities():
-                    # Submit each entity for processing in the worker pool
-                    task = await self.worker_pool.submit(
-                        self._process_single_entity,
-                        entity=entity,
-                        source_node=source_node,
-                        sync_context=sync_context,
-                    )
-
-                    # Pythonic way to save entity for error reporting
-                    task.entity = entity
-
-                    # If we have too many pending tasks, wait for some to complete
-                    if len(self.worker_pool.pending_tasks) >= self.worker_pool.max_workers * 2:
-                        await self.worker_pool.wait_for_batch(timeout=0.5)
-
-                # Wait for all remaining tasks
-                await self.worker_pool.wait_for_completion()
+                async for entity in source.generate_changes(sync_context.change_cursor):
+                    yield entity
+                tracker.change_cursor = source.change_cursor
+                return
+            except CursorExpiredError as e:
+                logger.warning(
+                    f"Change cursor of sync {sync_context.sync.id} expired, "
+                    f"falling back to a full sync: {e}"
+                )
+                sync_context.change_cursor = None
+
+        if source.supports_incremental and not tracker.is_resumed:
+            # Taken before listing, so changes made during the listing are read next run
+            tracker.change_cursor = await source.get_change_cursor()
+        async for entity in source.generate_entities():
+            yield entity
+
+    async def _hold_files(
+        self, entities: AsyncGenerator[BaseEntity, None], sync_context: SyncContext
+    ) -> AsyncGenerator[BaseEntity, None]:
+        """Record the downloaded files of the entities entering the pipeline."""
+        async for entity in entities:
+            if isinstance(entity, FileEntity) and entity.local_path:
+                sync_context.held_files.add(entity.local_path)
+            yield entity
+
+    def _release_held_files(self, sync_context: SyncContext) -> None:
+        """Release the files of entities lost in the pipeline, e.g. in a failed batch."""
+        if sync_context.held_files:
+            logger.info(
+                f"Releasing {len(sync_context.held_files)} files of entities that were not "
+                f"processed in sync {sync_context.sync.id}"
+            )
+        for path in sync_context.held_files:
+            file_store.release(path)
+        sync_context.held_files.clear()
+
+    async def _save_change_cursor(self, sync_context: SyncContext) -> None:
+        """Store where the next run of the sync reads changes from."""
+        change_cursor = sync_context.checkpoint_tracker.change_cursor
+        if change_cursor is None:
+            return
 
+        async with get_db_context() as db:
+            await crud.sync_cursor.upsert(
+                db,
+                obj_in=schemas.SyncCursorCreate(
+                    sync_id=sync_context.sync.id, cursor_data=change_cursor
+                ),
+                organization_id=sync_context.sync.organization_id,
+            )
+
+    async def _checkpoint_periodically(self, sync_context: SyncContext) -> None:
+        """Save the durable checkpoint of a run on a timer."""
+        while True:
+            await asyncio.sleep(self.checkpoint_interval)
+            try:
+                await self._save_checkpoint(sync_context)
             except Exception as e:
-                logger.error(f"Error during entity stream processing: {e}")
-                error_occurred = True
-                raise
-            finally:
-                # Finalize progress
-                await sync_context.progress.finalize(is_complete=not error_occurred)
+                logger.error(f"Error saving checkpoint: {e}")
 
-    async def _process_single_entity(
-        self, entity: BaseEntity, source_node: schemas.DagNode, sync_context: SyncContext
-    ) -> None:
-        """Process a single entity through the pipeline."""
-        # Create a new database session scope for this task
+    async def _save_checkpoint(self, sync_context: SyncContext) -> None:
+        """Persist the durable checkpoint of a run, if it moved since the last save."""
+        if sync_context.dry_run:
+            return
+        tracker = sync_context.checkpoint_tracker
+        checkpoint = tracker.checkpoint(sync_context.progress.stats.model_dump())
+        if not checkpoint:
+            return
+
+        # The rows of the entities the checkpoint covers must be stored before it is
+        await sync_context.entity_writer.flush()
+        await sync_job_service.update_checkpoint(
+            sync_job_id=sync_context.sync_job.id,
+            checkpoint=checkpoint,
+            current_user=sync_context.current_user,
+        )
+        tracker.mark_saved(checkpoint)
+
+    async def _delete_orphaned_entities(self, sync_context: SyncContext) -> None:
+        """Delete the entities a full run did not see, since the source no longer has them.
+
+        Every entity this job saw has its row stamped with the job's ID, so the rows of
+        other jobs are the set difference. A resumed job also counts the entities the jobs it
+        resumed saw before its checkpoint. Orphans are streamed in pages and deleted page by
+        page, from the destinations first and then from the entity table.
+        """
+        sync = sync_context.sync
         async with get_db_context() as db:
-            # Process the entity through the pipeline
-            await self.entity_processor.process(
-                entity=entity, source_node=source_node, sync_context=sync_context, db=db
+            async for rows in crud.entity.iter_outdated(
+                db,
+                sync.id,
+                sync_context.checkpoint_tracker.sync_job_ids,
+                page_size=ORPHAN_PAGE_SIZE,
+            ):
+                parent_ids = [entity_id for _, entity_id in rows]
+                for destination in sync_context.destinations:
+                    await destination.bulk_delete_by_parent_ids(parent_ids, sync.id)
+                await crud.entity.bulk_remove(db, ids=[id for id, _ in rows])
+                await sync_context.progress.increment("deleted", len(rows))
+
+        if sync_context.progress.stats.deleted:
+            logger.info(
+                f"Deleted {sync_context.progress.stats.deleted} orphaned entities of sync {sync.id}"
             )
 
 
@@ -0,0 +1,277 @@
+"""Module for staged processing with bounded queues between stages."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Optional
+from uuid import UUID
+
+from airweave.core.logging import logger
+from airweave.platform.sync.fair_share import FairShareScheduler
+from airweave.platform.sync.limiter import ConcurrencyLimiter
+from airweave.platform.sync.stream import get_queue_batches
+from airweave.platform.sync.worker_pool import AsyncWorkerPool
+
+# How often the queue depths of a running pipeline are logged
+DEFAULT_MONITOR_INTERVAL = 30.0  # seconds
+
+# Number of recent batch latencies a stage keeps for its latency percentiles
+LATENCY_SAMPLES = 10000
+
+StageHandler = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+def latency_percentiles(latencies: Iterable[float]) -> dict[str, Optional[float]]:
+    """The p50, p95 and p99 of a set of latencies in seconds, None when there are none."""
+    latencies = sorted(latencies)
+    percentiles = {}
+    for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+        if not latencies:
+            percentiles[name] = None
+            continue
+        index = min(len(latencies) - 1, max(0, math.ceil(q * len(latencies)) - 1))
+        percentiles[name] = round(latencies[index], 4)
+    return percentiles
+
+
+@dataclass
+class StageConfig:
+    """Concurrency settings of a single pipeline stage.
+
+    Attributes:
+        workers: Number of batches the stage processes concurrently, the starting point
+            when the stage is adaptive
+        batch_size: Maximum number of items handed to the stage handler at once
+        queue_size: Maximum number of items waiting in front of the stage
+        max_workers: Upper bound of an adaptive worker count, None keeps it fixed
+        min_workers: Lower bound of an adaptive worker count
+    """
+
+    workers: int
+    batch_size: int
+    queue_size: int = 500
+    max_workers: Optional[int] = None
+    min_workers: int = 1
+
+    def create_limiter(self, name: str) -> ConcurrencyLimiter:
+        """Create the concurrency limiter of a stage with these settings."""
+        if self.max_workers is None:
+            return ConcurrencyLimiter(initial_limit=self.workers, name=name)
+        return ConcurrencyLimiter(
+            initial_limit=self.workers,
+            min_limit=self.min_workers,
+            max_limit=self.max_workers,
+            name=name,
+        )
+
+
+class PipelineStage:
+    """A stage of a pipeline, with its own input queue and worker pool.
+
+    The stage reads micro-batches from its bounded input queue, runs its handler on them in
+    its worker pool and puts the handler's results on the next stage's queue. When the next
+    stage falls behind, its full queue blocks this stage's workers, which in turn stops this
+    stage from taking new input: backpressure travels up to the source.
+
+    Adaptive stages feed the latency and errors of every handler call to their limiter, so
+    their worker count grows while the services they call stay healthy and is cut on
+    rate limits, timeouts and rising latency.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: StageHandler,
+        config: StageConfig,
+        max_batch_latency: float,
+        scheduler: Optional[FairShareScheduler] = None,
+        job_id: Optional[UUID] = None,
+    ):
+        """Initialize the stage.
+
+        Args:
+            name: Name of the stage, used in logs and stats
+            handler: Coroutine function processing a batch and returning the items for the
+                next stage
+            config: The stage's concurrency settings
+            max_batch_latency: Maximum time in seconds to wait for a batch to fill up
+            scheduler: Optional process-wide scheduler to take a slot from for every batch
+            job_id: The sync job the stage belongs to, required with a scheduler
+        """
+        self.name = name
+        self.handler = handler
+        self.config = config
+        self.max_batch_latency = max_batch_latency
+        self.scheduler = scheduler
+        self.job_id = job_id
+
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        self.worker_pool = AsyncWorkerPool(limiter=config.create_limiter(name))
+        self.next_stage: Optional["PipelineStage"] = None
+
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    @property
+    def workers(self) -> int:
+        """Current worker count of the stage."""
+        return self.worker_pool.limiter.limit
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of items waiting in front of the stage."""
+        return self.queue.qsize()
+
+    async def put(self, item: Any) -> None:
+        """Put an item on the stage's input queue, waiting while the queue is full."""
+        await self.queue.put(item)
+        self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+
+    async def run(self, batches: Optional[AsyncIterator[List[Any]]] = None) -> None:
+        """Process batches until the input ends, then signal the end to the next stage.
+
+        Args:
+            batches: Batches to process instead of reading them from the input queue, used
+                to feed the first stage straight from a source stream
+        """
+        if batches is None:
+            batches = get_queue_batches(self.queue, self.config.batch_size, self.max_batch_latency)
+
+        try:
+            async for batch in batches:
+                # Waits for a free worker, so the stage never reads ahead of its workers
+                await self.worker_pool.submit(self._process_batch, batch)
+
+            await self.worker_pool.wait_for_completion()
+        except BaseException:
+            for task in list(self.worker_pool.pending_tasks):
+                task.cancel()
+            raise
+
+        if self.next_stage:
+            # None is the end of stream sentinel
+            await self.next_stage.queue.put(None)
+
+    async def _process_batch(self, batch: List[Any]) -> None:
+        """Run the handler on a batch and forward its results to the next stage."""
+        if self.scheduler:
+            # Only the handler holds a slot of the global budget: a worker blocked on a full
+            # downstream queue must not keep slots from the stages that would drain it
+            async with self.scheduler.slot(self.job_id):
+                outputs = await self._handle(batch)
+        else:
+            outputs = await self._handle(batch)
+        self.processed += len(batch)
+
+        if self.next_stage:
+            for item in outputs:
+                await self.next_stage.put(item)
+
+    async def _handle(self, batch: List[Any]) -> List[Any]:
+        """Run the handler on a batch, reporting its outcome to the stage's limiter."""
+        limiter = self.worker_pool.limiter
+        start = time.monotonic()
+        try:
+            outputs = await self.handler(batch)
+        except Exception as e:
+            self.failed += 1
+            limiter.record_error(e, start)
+            raise
+        latency = time.monotonic() - start
+        self.busy_seconds += latency
+        self.latencies.append(latency)
+        limiter.record_success(latency, start)
+        return outputs
+
+
+class StagedPipeline:
+    """Runs a chain of stages connected by bounded queues.
+
+    Every stage scales independently through its own worker count and batch size. The
+    stage whose queue keeps filling up is the bottleneck, and the one to scale.
+
+    Usage:
+    -----
+    ```python
+    pipeline = StagedPipeline([PipelineStage("a", handle_a, ...), PipelineStage("b", ...)])
+    await pipeline.run(stream.get_entity_batches(batch_size, max_latency))
+    ```
+    """
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        monitor_interval: float = DEFAULT_MONITOR_INTERVAL,
+    ):
+        """Initialize the pipeline and link its stages.
+
+        Args:
+            stages: The stages, in processing order
+            monitor_interval: How often to log the queue depths, in seconds
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.monitor_interval = monitor_interval
+        for stage, next_stage in zip(stages, stages[1:], strict=False):
+            stage.next_stage = next_stage
+
+    @property
+    def queue_depths(self) -> dict[str, int]:
+        """Current number of items waiting in front of each stage."""
+        return {stage.name: stage.queue_depth for stage in self.stages}
+
+    @property
+    def failed(self) -> int:
+        """Number of batches whose handler raised, across all stages."""
+        return sum(stage.failed for stage in self.stages)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-stage throughput, queueing and batch latency stats."""
+        return {
+            stage.name: {
+                "processed": stage.processed,
+                "failed": stage.failed,
+                "workers": stage.workers,
+                "busy_seconds": round(stage.busy_seconds, 3),
+                "queue_depth": stage.queue_depth,
+                "max_queue_depth": stage.max_queue_depth,
+                **latency_percentiles(stage.latencies),
+            }
+            for stage in self.stages
+        }
+
+    async def run(self, batches: AsyncIterator[List[Any]]) -> None:
+        """Run all stages until the input is exhausted and every stage has drained.
+
+        If any stage fails, the other stages are cancelled and the error is raised.
+
+        Args:
+            batches: The input batches of the first stage
+        """
+        first_stage, *other_stages = self.stages
+        tasks = [asyncio.create_task(first_stage.run(batches))]
+        tasks += [asyncio.create_task(stage.run()) for stage in other_stages]
+        monitor = asyncio.create_task(self._monitor())
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            monitor.cancel()
+            logger.info(f"Pipeline stats: {self.stats()}")
+
+    async def _monitor(self) -> None:
+        """Log the queue depths on a timer."""
+        while True:
+            await asyncio.sleep(self.monitor_interval)
+            logger.info(f"Pipeline queue depths: {self.queue_depths}")
@@ -17,6 +17,9 @@ class SyncProgressUpdate(BaseModel):
     updated: int = 0
     deleted: int = 0
     kept: int = 0
+    failed: int = 0  # Entities that could not be processed
+    entity_index_entries: int = 0  # Entities loaded into the change-detection index
+    entity_index_bytes: int = 0  # Approximate memory used by that index
     is_complete: bool = False  # Add completion flag
     is_failed: bool = False  # Add failure flag
 
@@ -1,6 +1,6 @@
 """DAG router."""
 
-from typing import Optional
+from typing import Callable, Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,6 +23,8 @@ class SyncDAGRouter:
         self.dag = dag
         self.entity_map = entity_map
         self.route = self._build_execution_route()
+        # Transformer callables by transformer id, looked up once per sync
+        self._transformers: dict[UUID, Callable] = {}
 
     def _build_execution_route(self) -> dict[tuple[UUID, UUID], list[Optional[UUID]]]:
         """Construct an execution route for the DAG.
@@ -159,11 +161,14 @@ class SyncDAGRouter:
     ) -> list[BaseEntity]:
         """Apply the transformer to the entity."""
         if consumer.transformer_id:
-            transformer = await crud.transformer.get(
-                db,
-                id=consumer.transformer_id,
-            )
-            transformer_callable = resource_locator.get_transformer(transformer)
+            transformer_callable = self._transformers.get(consumer.transformer_id)
+            if transformer_callable is None:
+                transformer = await crud.transformer.get(
+                    db,
+                    id=consumer.transformer_id,
+                )
+                transformer_callable = resource_locator.get_transformer(transformer)
+                self._transformers[consumer.transformer_id] = transformer_callable
             return await transformer_callable(entity)
         else:
             raise ValueError(f"No transformer found for node {consumer.id}")
@@ -122,3 +122,83 @@ class AsyncSourceStream(Generic[T]):
             if self.producer_exception:
                 logger.error("Producer encountered an error, stopping consumer")
                 raise self.producer_exception
+
+    async def get_entity_batches(
+        self, batch_size: int, max_latency: float
+    ) -> AsyncGenerator[list[T], None]:
+        """Get entities from the queue in micro-batches.
+
+        A batch is yielded as soon as it holds `batch_size` entities, or when `max_latency`
+        seconds have passed since its first entity arrived, whichever comes first. This keeps
+        batches full on fast sources without stalling slow ones.
+
+        Args:
+            batch_size: Maximum number of entities per batch
+            max_latency: Maximum time in seconds to wait for a batch to fill up
+        """
+        if not self.producer_task:
+            await self.start()
+
+        async for batch in get_queue_batches(self.queue, batch_size, max_latency):
+            yield batch
+            if self.producer_exception:
+                logger.error("Producer encountered an error, stopping consumer")
+                raise self.producer_exception
+
+        if self.producer_exception:
+            logger.error("Producer failed with error, stopping consumer")
+            raise self.producer_exception
+
+
+async def get_queue_batches(
+    queue: asyncio.Queue, batch_size: int, max_latency: float
+) -> AsyncGenerator[list, None]:
+    """Get items from a queue in micro-batches until the None sentinel arrives.
+
+    A batch is yielded as soon as it holds `batch_size` items, or when `max_latency` seconds
+    have passed since its first item arrived, whichever comes first.
+
+    Args:
+        queue: The queue to read from, terminated by a None sentinel
+        batch_size: Maximum number of items per batch
+        max_latency: Maximum time in seconds to wait for a batch to fill up
+    """
+    loop = asyncio.get_running_loop()
+    batch: list = []
+    deadline = 0.0
+    # Keep the pending get across timeouts, so no item is lost when a batch is flushed early
+    getter: Optional[asyncio.Task] = None
+
+    try:
+        while True:
+            if getter is None:
+                getter = asyncio.ensure_future(queue.get())
+
+            timeout = max(0.0, deadline - loop.time()) if batch else None
+            done, _ = await asyncio.wait({getter}, timeout=timeout)
+            if not done:
+                # Linger window expired, flush what we have
+                yield batch
+                batch = []
+                continue
+
+            item = getter.result()
+            getter = None
+            queue.task_done()
+
+            # None is our sentinel value for end of stream
+            if item is None:
+                if batch:
+                    yield batch
+                break
+
+            if not batch:
+                deadline = loop.time() + max_latency
+            batch.append(item)
+
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    finally:
+        if getter is not None:
+            getter.cancel()
@@ -0,0 +1,126 @@
+"""Module for running async tasks with bounded concurrency."""
+
+import asyncio
+from typing import Callable, Optional
+
+from airweave.core.logging import logger
+from airweave.platform.sync.limiter import ConcurrencyLimiter
+
+
+# Worker Pool Pattern
+class AsyncWorkerPool:
+    """Manages a pool of workers with controlled concurrency.
+
+    This class limits how many async tasks can run at once using a concurrency limiter,
+    preventing system overload when processing many items in parallel. The limit is fixed
+    by default; with an adaptive limiter it follows the health of the services the tasks
+    call, see `ConcurrencyLimiter`.
+    """
+
+    def __init__(self, max_workers: int = 20, limiter: Optional[ConcurrencyLimiter] = None):
+        """Initialize worker pool with concurrency control.
+
+        Args:
+            max_workers: Maximum number of tasks allowed to run concurrently, used for a
+                fixed limit when no limiter is given
+            limiter: Optional limiter deciding how many tasks may run concurrently
+        """
+        self.limiter = limiter or ConcurrencyLimiter(initial_limit=max_workers)
+        self.pending_tasks = set()
+        self.max_workers = self.limiter.max_limit
+
+    async def submit(self, coro: Callable, *args, **kwargs) -> asyncio.Task:
+        """Submit a coroutine to be executed by the worker pool.
+
+        Waits until the limiter has a free slot, then creates a task, adds it to our
+        tracking set, and returns it. Waiting here is what applies backpressure to the
+        submitter, so it never runs ahead of the workers.
+
+        Args:
+            coro: The coroutine function to execute
+            *args: Arguments to pass to the coroutine
+            **kwargs: Keyword arguments to pass to the coroutine
+
+        Returns:
+            The created task object
+        """
+        await self.limiter.acquire()
+        try:
+            task = asyncio.create_task(coro(*args, **kwargs))
+        except BaseException:
+            self.limiter.release()
+            raise
+        # Track the task so we can wait for it later
+        self.pending_tasks.add(task)
+        # Set up automatic cleanup when task finishes, this also releases the slot
+        task.add_done_callback(self._handle_task_completion)
+        return task
+
+    def _handle_task_completion(self, task: asyncio.Task) -> None:
+        """Handle task completion and clean up.
+
+        Removes completed task from our tracking set, releases its slot and logs any errors.
+        Called automatically when a task completes.
+
+        Args:
+            task: The completed task
+        """
+        # Remove the task from our tracking set and free its slot
+        self.pending_tasks.discard(task)
+        self.limiter.release()
+        # Log if the task failed with an exception
+        if not task.cancelled() and task._exception:
+            logger.error(f"Task failed: {task._exception}")
+
+    async def wait_for_batch(self, timeout: float = 0.5) -> None:
+        """Wait for some tasks to complete.
+
+        Useful when you want to throttle submission rate or process
+        results in batches without waiting for all tasks to finish.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        if not self.pending_tasks:
+            return
+
+        # Wait for at least one task to complete or until timeout
+        # FIRST_COMPLETED means we'll return as soon as any task finishes
+        done, _ = await asyncio.wait(
+            self.pending_tasks, return_when=asyncio.FIRST_COMPLETED, timeout=timeout
+        )
+
+        # Process completed tasks, extracting results or catching exceptions
+        for task in done:
+            try:
+                # Await the task to get its result or propagate any exceptions
+                await task
+            except Exception as e:
+                logger.error(f"Error in worker task: {e}")
+
+    async def wait_for_completion(self) -> None:
+        """Wait for all tasks to complete.
+
+        Processes tasks in batches to avoid memory issues with large sets.
+        Should be called before ending a program to ensure all work is done.
+        """
+        while self.pending_tasks:
+            # Process in batches to avoid memory issues with large task sets
+            # Take a slice of the pending tasks equal to double the max worker count
+            current_batch = list(self.pending_tasks)[: self.max_workers * 2]
+            if not current_batch:
+                break
+
+            # Wait for all tasks in this batch to complete (with a timeout for safety)
+            # ALL_COMPLETED means we'll wait until every task in the batch is done
+            done, _ = await asyncio.wait(
+                current_batch, return_when=asyncio.ALL_COMPLETED, timeout=10
+            )
+
+            # Check for exceptions in completed tasks
+            for task in done:
+                try:
+                    # Await the task to get its result or propagate any exceptions
+                    await task
+                except Exception as e:
+                    logger.error(f"Task error during completion: {e}")
@@ -87,7 +87,8 @@ async def file_chunker(file: FileEntity) -> list[ParentEntity | ChunkEntity]:
 
     try:
         # Convert file to markdown
-        result = await document_converter.convert(file.local_path)
+        # Reuses the conversion of an earlier file with the same contents, if any
+        result = await document_converter.convert(file.local_path, checksum=file.checksum)
 
         if not result or not result.text_content:
             logger.warning(f"No content extracted from file {file.name}")
@@ -74,6 +74,7 @@ from .sync import (
     SyncWithoutConnections,
     SyncWithSourceConnection,
 )
+from .sync_cursor import SyncCursor, SyncCursorCreate, SyncCursorInDBBase, SyncCursorUpdate
 from .sync_job import SyncJob, SyncJobCreate, SyncJobInDBBase, SyncJobUpdate
 from .transformer import Transformer, TransformerCreate, TransformerUpdate
 from .user import (
@@ -0,0 +1,51 @@
+"""Sync cursor schema."""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SyncCursorBase(BaseModel):
+    """Base schema for SyncCursor."""
+
+    sync_id: UUID
+    cursor_data: dict
+
+    class Config:
+        """Pydantic config for SyncCursorBase."""
+
+        from_attributes = True
+
+
+class SyncCursorCreate(SyncCursorBase):
+    """Schema for creating a SyncCursor object."""
+
+    pass
+
+
+class SyncCursorUpdate(BaseModel):
+    """Schema for updating a SyncCursor object."""
+
+    cursor_data: Optional[dict] = None
+
+
+class SyncCursorInDBBase(SyncCursorBase):
+    """Base schema for SyncCursor stored in DB."""
+
+    id: UUID
+    organization_id: UUID
+    created_at: datetime
+    modified_at: datetime
+
+    class Config:
+        """Pydantic config for SyncCursorInDBBase."""
+
+        from_attributes = True
+
+
+class SyncCursor(SyncCursorInDBBase):
+    """Schema for SyncCursor."""
+
+    pass
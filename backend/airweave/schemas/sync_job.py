@@ -43,6 +43,7 @@ class SyncJobUpdate(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     failed_at: Optional[datetime] = None
+    checkpoint: Optional[dict] = None
 
 
 class SyncJobInDBBase(SyncJobBase):
@@ -57,6 +58,7 @@ class SyncJobInDBBase(SyncJobBase):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     failed_at: Optional[datetime] = None
+    checkpoint: Optional[dict] = None
     sync_name: Optional[str] = Field(
         None, description="Name of the sync, populated from join query"
     )
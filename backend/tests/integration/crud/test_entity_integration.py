@@ -0,0 +1,89 @@
+"""Integration tests for the Entity bulk upsert CRUD operations.
+
+These tests use a real database connection, since the COPY path relies on a Postgres
+staging table and asyncpg's binary COPY protocol.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave.crud.crud_entity import entity as crud_entity
+from airweave.db.unit_of_work import UnitOfWork
+from airweave.models import Entity, Organization, Sync, SyncJob, User
+from airweave.schemas.entity import EntityCreate
+
+
+async def _create_sync_job(db: AsyncSession) -> SyncJob:
+    """Create the organization, user and sync an entity row refers to."""
+    unique_id = uuid.uuid4().hex[:8]
+    organization = Organization(name=f"Test Organization {unique_id}")
+    db.add(organization)
+    await db.flush()
+    user = User(email=f"test_{unique_id}@example.com", organization_id=organization.id)
+    db.add(user)
+    await db.flush()
+    sync = Sync(
+        name=f"Test Sync {unique_id}",
+        organization_id=organization.id,
+        created_by_email=user.email,
+        modified_by_email=user.email,
+    )
+    db.add(sync)
+    await db.flush()
+    sync_job = SyncJob(
+        sync_id=sync.id,
+        organization_id=organization.id,
+        created_by_email=user.email,
+        modified_by_email=user.email,
+    )
+    db.add(sync_job)
+    await db.flush()
+    return sync_job
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_bulk_upsert_copy_merges_on_sync_and_entity_id(
+    db_session: AsyncSession, skip_if_no_db
+):
+    """Test that COPY inserts new rows and updates existing ones in place."""
+    sync_job = await _create_sync_job(db_session)
+    next_job = await _create_sync_job(db_session)
+    organization_id = sync_job.organization_id
+    uow = UnitOfWork(db_session)
+
+    def row(entity_id: str, hash: str, job: SyncJob) -> EntityCreate:
+        return EntityCreate(
+            sync_job_id=job.id, sync_id=sync_job.sync_id, entity_id=entity_id, hash=hash
+        )
+
+    first_ids = {uuid.uuid4(): row("a", "a1", sync_job), uuid.uuid4(): row("b", "b1", sync_job)}
+    await crud_entity.bulk_upsert_copy(
+        db_session, objs_in=first_ids, organization_id=organization_id, uow=uow
+    )
+    # The second upsert runs in the same transaction, so the staging table still has rows
+    await crud_entity.bulk_upsert_copy(
+        db_session,
+        objs_in={uuid.uuid4(): row("b", "b2", next_job), uuid.uuid4(): row("c", "c1", next_job)},
+        organization_id=organization_id,
+        uow=uow,
+    )
+
+    rows = (
+        await db_session.execute(
+            select(Entity.id, Entity.entity_id, Entity.hash, Entity.sync_job_id)
+            .where(Entity.sync_id == sync_job.sync_id)
+            .order_by(Entity.entity_id)
+        )
+    ).all()
+    assert [(entity_id, hash) for _, entity_id, hash, _ in rows] == [
+        ("a", "a1"),
+        ("b", "b2"),
+        ("c", "c1"),
+    ]
+    # An updated row keeps its primary key, and is stamped with the job that wrote it last
+    assert rows[1].id in first_ids
+    assert [row.sync_job_id for row in rows] == [sync_job.id, next_job.id, next_job.id]
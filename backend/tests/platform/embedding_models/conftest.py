@@ -2,3 +2,13 @@
 
 # This file is here to ensure pytest can discover test modules correctly
 # Any shared fixtures should be defined here if needed
+
+import pytest
+
+from airweave.platform.embedding_models import openai_client
+
+
+@pytest.fixture(autouse=True)
+def estimated_tokens(monkeypatch):
+    """Estimate tokens of OpenAI models, so tests do not download the tokenizer."""
+    monkeypatch.setattr(openai_client, "_encoding", lambda model: None)
@@ -2,9 +2,12 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from tenacity import wait_none
 
 from airweave.core.config import settings
+from airweave.core.exceptions import EmbeddingError
 from airweave.platform.embedding_models.local_text2vec import LocalText2Vec
 
 
@@ -80,7 +83,7 @@ class TestLocalText2Vec:
 
         # Verify the API call
         mock_post.assert_called_once_with(
-            f"{model.inference_url}/vectors", json={"text": "Test text"}
+            f"{model.inference_url}/vectors/", json={"text": "Test text"}
         )
 
     @pytest.mark.asyncio
@@ -102,9 +105,7 @@ class TestLocalText2Vec:
         # Mock response
         mock_response = MagicMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json.return_value = {
-            "vectors": [[0.1, 0.2, 0.3] * 128, [0.4, 0.5, 0.6] * 128]
-        }
+        mock_response.json.return_value = {"vector": [0.1, 0.2, 0.3] * 128}
         mock_post.return_value = mock_response
 
         texts = ["Text 1", "Text 2"]
@@ -115,8 +116,7 @@ class TestLocalText2Vec:
         assert len(result) == 2
         assert all(len(vec) == 384 for vec in result)
 
-        # Verify the API call - updated to match the actual implementation
-        # The method is making individual calls for each text rather than a batch call
+        # Verify the API calls, one per text without a batch endpoint
         assert mock_post.call_count == 2
         mock_post.assert_any_call(f"{model.inference_url}/vectors/", json={"text": "Text 1"})
         mock_post.assert_any_call(f"{model.inference_url}/vectors/", json={"text": "Text 2"})
@@ -128,7 +128,7 @@ class TestLocalText2Vec:
         # Mock response
         mock_response = MagicMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json.return_value = {"vectors": [[0.1, 0.2, 0.3] * 128]}
+        mock_response.json.return_value = {"vector": [0.1, 0.2, 0.3] * 128}
         mock_post.return_value = mock_response
 
         texts = ["", "Text 2"]
@@ -146,6 +146,52 @@ class TestLocalText2Vec:
             json={"text": "Text 2"},  # Only non-empty text should be sent
         )
 
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.post")
+    async def test_embed_many_batch_endpoint(self, mock_post, model):
+        """Test that texts are sent in batches when a batch size is set."""
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.json.side_effect = lambda: [[0.1, 0.2, 0.3] * 128] * 2
+        mock_post.return_value = mock_response
+        model.batch_size = 2
+
+        result = await model.embed_many(["Text 1", "", "Text 2", "Text 3", "Text 4"])
+
+        assert len(result) == 5
+        assert all(v == 0.0 for v in result[1])
+        assert mock_post.call_count == 2
+        mock_post.assert_any_call(
+            f"{model.inference_url}/embed", json={"inputs": ["Text 1", "Text 2"]}
+        )
+        mock_post.assert_any_call(
+            f"{model.inference_url}/embed", json={"inputs": ["Text 3", "Text 4"]}
+        )
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.post")
+    async def test_embed_many_failures_are_retried_and_reported(
+        self, mock_post, model, monkeypatch
+    ):
+        """Test that failed texts are retried, and raise instead of getting zero vectors."""
+        monkeypatch.setattr(LocalText2Vec._post.retry, "wait", wait_none())
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.json.return_value = {"vector": [0.1, 0.2, 0.3] * 128}
+
+        def post(url, json):
+            if json["text"] == "Broken":
+                raise httpx.ConnectError("Connection refused")
+            return mock_response
+
+        mock_post.side_effect = post
+
+        with pytest.raises(EmbeddingError) as exc_info:
+            await model.embed_many(["Text 1", "Broken"])
+
+        assert list(exc_info.value.failures) == [1]
+        assert mock_post.call_count == 4  # One call for the first text, three for the second
+
     @pytest.mark.asyncio
     async def test_embed_many_with_model_override(self, model):
         """Test that model override raises an error."""
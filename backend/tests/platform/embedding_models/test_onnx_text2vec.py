@@ -0,0 +1,68 @@
+"""Tests for the OnnxText2Vec embedding model."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from airweave.platform.embedding_models import onnx_text2vec
+from airweave.platform.embedding_models.onnx_text2vec import OnnxEmbeddingEngine, OnnxText2Vec
+
+np = pytest.importorskip("numpy")
+
+
+class _Tokenizer:
+    """Tokenizer with one token per word, padding batches to their longest text."""
+
+    def encode_batch(self, texts):
+        words = [text.split() for text in texts]
+        length = max(len(w) for w in words)
+        return [
+            SimpleNamespace(
+                ids=[len(word) for word in w] + [0] * (length - len(w)),
+                attention_mask=[1] * len(w) + [0] * (length - len(w)),
+            )
+            for w in words
+        ]
+
+
+class _Session:
+    """Session embedding a token as [its id, 1, 0], padding tokens as garbage."""
+
+    def __init__(self):
+        self.batches = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input_ids"), SimpleNamespace(name="attention_mask")]
+
+    def run(self, output_names, inputs):
+        assert set(inputs) == {"input_ids", "attention_mask"}
+        ids = inputs["input_ids"]
+        self.batches.append(ids.shape)
+        padding = inputs["attention_mask"] == 0
+        embeddings = np.stack([ids, np.ones_like(ids), np.zeros_like(ids)], axis=-1)
+        embeddings[padding] = 100
+        return [embeddings.astype(np.float32)]
+
+
+@pytest.mark.asyncio
+async def test_texts_are_embedded_in_length_sorted_batches(monkeypatch):
+    """Test mean pooling over real tokens, normalization, batching and empty texts."""
+    session = _Session()
+    engine = OnnxEmbeddingEngine(session, _Tokenizer(), workers=2, batch_size=2)
+
+    async def get(model_dir, quantized):
+        return engine
+
+    monkeypatch.setattr(onnx_text2vec.onnx_engines, "get", get)
+    model = OnnxText2Vec(model_dir="/models/minilm")
+
+    vectors = await model.embed_many(["aaa b c d", "", "aaaa", "bb cc"])
+
+    assert len(vectors) == 4 and len(vectors[1]) == 384
+    assert not any(vectors[1])
+    # Texts sorted by length share batches, padded to the longest text of their batch only
+    assert sorted(session.batches) == [(1, 4), (2, 2)]
+    # "aaa b c d" pools to [1.5, 1, 0], normalized
+    assert vectors[0] == pytest.approx([1.5 / 3.25**0.5, 1 / 3.25**0.5, 0.0])
+    assert vectors[2] == pytest.approx([4 / 17**0.5, 1 / 17**0.5, 0.0])
+    engine.close()
@@ -0,0 +1,67 @@
+"""Unit tests for the OpenAI embedding client."""
+
+import json
+
+import httpx
+import pytest
+
+from airweave.platform.embedding_models.openai_client import OpenAIEmbeddingClient, RateGovernor
+
+
+def _client(handler, **kwargs) -> OpenAIEmbeddingClient:
+    return OpenAIEmbeddingClient(
+        "sk-test",
+        RateGovernor(requests_per_minute=6000, tokens_per_minute=1_000_000),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        backoff_base=0.01,
+        **kwargs,
+    )
+
+
+def _embeddings(inputs):
+    # The vector of an input is [its length, 0]
+    return {"data": [{"index": i, "embedding": [len(text), 0.0]} for i, text in enumerate(inputs)]}
+
+
+@pytest.mark.asyncio
+async def test_texts_are_split_into_requests_and_pieces_within_limits():
+    """Test that requests stay within the limits, and oversized texts are split and averaged."""
+    requests = []
+
+    def handler(request):
+        inputs = json.loads(request.content)["input"]
+        requests.append(inputs)
+        return httpx.Response(200, json=_embeddings(inputs))
+
+    client = _client(handler, max_input_tokens=11, max_request_tokens=40, max_request_inputs=3)
+    texts = ["a" * 9, "b" * 9, "c" * 60, "d" * 9]
+
+    vectors = await client.embed(texts, "text-embedding-3-small")
+
+    # Inputs of at most 30 bytes are within 11 estimated tokens
+    assert requests == [["a" * 9, "b" * 9, "c" * 30], ["c" * 30, "d" * 9]]
+    assert vectors[0] == [9, 0.0] and vectors[3] == [9, 0.0]
+    assert vectors[2] == pytest.approx([1.0, 0.0])  # Mean of its pieces, normalized
+    assert client.stats.requests == 2 and client.stats.inputs == 5
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_requests_are_retried_after_retry_after():
+    """Test that a rate limit pauses the governor for its Retry-After, then succeeds."""
+    responses = [
+        httpx.Response(429, headers={"retry-after-ms": "50"}),
+        httpx.Response(503),
+    ]
+
+    def handler(request):
+        if responses:
+            return responses.pop(0)
+        return httpx.Response(200, json=_embeddings(json.loads(request.content)["input"]))
+
+    client = _client(handler)
+    assert await client.embed(["hello"], "text-embedding-3-small") == [[5, 0.0]]
+    assert (client.stats.retries, client.stats.rate_limited) == (2, 1)
+
+    quota = httpx.Response(429, json={"error": {"code": "insufficient_quota"}})
+    with pytest.raises(httpx.HTTPStatusError):
+        await _client(lambda request: quota).embed(["hello"], "text-embedding-3-small")
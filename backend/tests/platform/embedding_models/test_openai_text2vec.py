@@ -1,6 +1,6 @@
 """Tests for OpenAIText2Vec embedding model."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -64,7 +64,9 @@ class TestOpenAIText2Vec:
         # Mock response
         mock_response = MagicMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json.return_value = {"data": [{"embedding": [0.1, 0.2, 0.3] * 512}]}
+        mock_response.json.return_value = {
+            "data": [{"index": 0, "embedding": [0.1, 0.2, 0.3] * 512}]
+        }
         mock_post.return_value = mock_response
 
         result = await model.embed("Test text")
@@ -78,10 +80,11 @@ class TestOpenAIText2Vec:
             "https://api.openai.com/v1/embeddings",
             headers={"Authorization": "Bearer test-api-key", "Content-Type": "application/json"},
             json={
-                "input": "Test text",
+                "input": ["Test text"],
                 "model": "text-embedding-3-small",
                 "encoding_format": "float",
             },
+            timeout=ANY,
         )
 
     @pytest.mark.asyncio
@@ -91,7 +94,9 @@ class TestOpenAIText2Vec:
         # Mock response
         mock_response = MagicMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json.return_value = {"data": [{"embedding": [0.1, 0.2, 0.3] * 512}]}
+        mock_response.json.return_value = {
+            "data": [{"index": 0, "embedding": [0.1, 0.2, 0.3] * 512}]
+        }
         mock_post.return_value = mock_response
 
         _ = await model.embed("Test text", model="text-embedding-3-large")
@@ -101,10 +106,11 @@ class TestOpenAIText2Vec:
             "https://api.openai.com/v1/embeddings",
             headers={"Authorization": "Bearer test-api-key", "Content-Type": "application/json"},
             json={
-                "input": "Test text",
+                "input": ["Test text"],
                 "model": "text-embedding-3-large",
                 "encoding_format": "float",
             },
+            timeout=ANY,
         )
 
     @pytest.mark.asyncio
@@ -121,7 +127,10 @@ class TestOpenAIText2Vec:
         mock_response = MagicMock()
         mock_response.raise_for_status = AsyncMock()
         mock_response.json.return_value = {
-            "data": [{"embedding": [0.1, 0.2, 0.3] * 512}, {"embedding": [0.4, 0.5, 0.6] * 512}]
+            "data": [
+                {"index": 0, "embedding": [0.1, 0.2, 0.3] * 512},
+                {"index": 1, "embedding": [0.4, 0.5, 0.6] * 512},
+            ]
         }
         mock_post.return_value = mock_response
 
@@ -138,6 +147,7 @@ class TestOpenAIText2Vec:
             "https://api.openai.com/v1/embeddings",
             headers={"Authorization": "Bearer test-api-key", "Content-Type": "application/json"},
             json={"input": texts, "model": "text-embedding-3-small", "encoding_format": "float"},
+            timeout=ANY,
         )
 
     @pytest.mark.asyncio
@@ -147,7 +157,9 @@ class TestOpenAIText2Vec:
         # Mock response
         mock_response = MagicMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json.return_value = {"data": [{"embedding": [0.1, 0.2, 0.3] * 512}]}
+        mock_response.json.return_value = {
+            "data": [{"index": 0, "embedding": [0.1, 0.2, 0.3] * 512}]
+        }
         mock_post.return_value = mock_response
 
         texts = ["", "Text 2"]
@@ -168,6 +180,7 @@ class TestOpenAIText2Vec:
                 "model": "text-embedding-3-small",
                 "encoding_format": "float",
             },
+            timeout=ANY,
         )
 
     @pytest.mark.asyncio
@@ -177,7 +190,9 @@ class TestOpenAIText2Vec:
         # Mock response
         mock_response = MagicMock()
         mock_response.raise_for_status = AsyncMock()
-        mock_response.json.return_value = {"data": [{"embedding": [0.1, 0.2, 0.3] * 512}]}
+        mock_response.json.return_value = {
+            "data": [{"index": 0, "embedding": [0.1, 0.2, 0.3] * 512}]
+        }
         mock_post.return_value = mock_response
 
         _ = await model.embed_many(["Test text"], model="text-embedding-3-large")
@@ -191,6 +206,7 @@ class TestOpenAIText2Vec:
                 "model": "text-embedding-3-large",
                 "encoding_format": "float",
             },
+            timeout=ANY,
         )
 
     @pytest.mark.asyncio
@@ -0,0 +1,90 @@
+"""Unit tests for the CheckpointTracker class."""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from airweave.platform.entities._base import BaseEntity
+from airweave.platform.sync.checkpoint import CheckpointTracker
+
+
+def _source(pages):
+    """Create a source that sets a cursor before yielding each page of entities."""
+    source = SimpleNamespace(resume_cursor=None)
+
+    async def generate_entities():
+        for page, entities in enumerate(pages):
+            source.resume_cursor = {"page": page}
+            for entity in entities:
+                yield entity
+
+    source.generate_entities = generate_entities
+    return source
+
+
+def _entity(entity_id):
+    """Create an entity to track."""
+    return BaseEntity(entity_id=entity_id)
+
+
+@pytest.mark.asyncio
+class TestCheckpointTracker:
+    """Tests for CheckpointTracker."""
+
+    async def test_cursor_is_durable_once_earlier_entities_complete(self):
+        """Test that a cursor is only checkpointed when every entity before it is done."""
+        pages = [[_entity("a"), _entity("b")], [_entity("c")], [_entity("d")]]
+        source = _source(pages)
+        tracker = CheckpointTracker(source, uuid.uuid4())
+
+        entities = [entity async for entity in tracker.track(source.generate_entities())]
+        # Nothing is done yet, so only the cursor before the first entity is durable
+        assert tracker.checkpoint({})["cursor"] == {"page": 0}
+
+        # The cursor of page 1 covers page 0, which still has an entity in flight
+        tracker.complete(entities[0])
+        tracker.complete(entities[2])
+        assert tracker.checkpoint({})["cursor"] == {"page": 0}
+
+        # With pages 0 and 1 done, the cursor of page 2 is durable
+        tracker.complete(entities[1])
+        checkpoint = tracker.checkpoint({"inserted": 3, "skipped": 1})
+        assert checkpoint["cursor"] == {"page": 2}
+        assert checkpoint["stats"]["inserted"] == 3
+        assert "skipped" not in checkpoint["stats"]
+
+        tracker.mark_saved(checkpoint)
+        assert tracker.checkpoint({}) is None
+
+    async def test_resumed_tracker_carries_over_job_chain(self):
+        """Test that a resumed job saves the inherited cursor and extends the job chain."""
+        previous_job_id = uuid.uuid4()
+        resumed_from = {"cursor": {"page": 1}, "sync_job_ids": [str(previous_job_id)]}
+        sync_job_id = uuid.uuid4()
+        tracker = CheckpointTracker(_source([]), sync_job_id, resumed_from=resumed_from)
+
+        assert tracker.is_resumed
+        assert tracker.sync_job_ids == [sync_job_id, previous_job_id]
+
+        checkpoint = tracker.checkpoint({})
+        assert checkpoint["cursor"] == {"page": 1}
+        assert checkpoint["sync_job_ids"] == [str(sync_job_id), str(previous_job_id)]
+
+    async def test_lost_entity_freezes_checkpoint(self):
+        """Test that an entity lost in the pipeline holds the checkpoint, also once freed."""
+        source = SimpleNamespace(resume_cursor=None)
+        tracker = CheckpointTracker(source, uuid.uuid4())
+
+        async def generate_entities():
+            for page in range(20):
+                source.resume_cursor = {"page": page}
+                yield _entity(str(page))
+
+        async for entity in tracker.track(generate_entities()):
+            if entity.entity_id != "0":
+                tracker.complete(entity)
+            # The lost entity is freed, later entities may get its memory and id()
+            del entity
+
+        assert tracker.checkpoint({})["cursor"] == {"page": 0}
@@ -0,0 +1,64 @@
+"""Unit tests for dry runs."""
+
+import math
+
+import pytest
+
+from airweave.platform.embedding_models.fake import FakeEmbeddingModel
+from airweave.platform.entities._base import BaseEntity
+from airweave.platform.sync.dry_run import DryRun
+from airweave.platform.sync.pipeline import PipelineStage, StageConfig, StagedPipeline
+
+
+@pytest.mark.asyncio
+async def test_fake_embeddings_are_deterministic_unit_vectors():
+    """Test that the fake model returns the same unit vector for the same text."""
+    model = FakeEmbeddingModel(vector_dimensions=16)
+    first, second, other = await model.embed_many(["hello", "hello", "world"])
+
+    assert len(first) == 16
+    assert first == second
+    assert first != other
+    assert math.isclose(sum(value * value for value in first), 1.0)
+
+
+@pytest.mark.asyncio
+async def test_report_covers_source_and_stages():
+    """Test that a dry run reports source throughput and the latencies of every stage."""
+
+    async def entities():
+        for i in range(10):
+            yield BaseEntity(entity_id=str(i))
+
+    async def batches(stream):
+        batch = []
+        async for entity in stream:
+            batch.append(entity)
+        yield batch
+
+    async def passthrough(batch):
+        return batch
+
+    dry_run = DryRun()
+    dry_run.pipeline = StagedPipeline(
+        [
+            PipelineStage(
+                name=name,
+                handler=passthrough,
+                config=StageConfig(workers=1, batch_size=5),
+                max_batch_latency=0.01,
+            )
+            for name in ("prepare", "persist")
+        ]
+    )
+    await dry_run.pipeline.run(batches(dry_run.measure_source(entities())))
+    dry_run.finish()
+
+    report = dry_run.report()
+    assert report.entities == 10
+    assert report.bytes > 0
+    assert report.entities_per_second > 0
+    assert list(report.stages) == ["source", "prepare", "persist"]
+    assert report.stages["source"].processed == 10
+    assert report.stages["persist"].processed == 10
+    assert report.stages["persist"].p95 is not None
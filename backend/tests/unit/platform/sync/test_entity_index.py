@@ -0,0 +1,52 @@
+"""Unit tests for the EntityHashIndex class."""
+
+import hashlib
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from airweave.platform.sync.entity_index import EntityHashIndex
+
+
+def _sha(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_load_pages_and_lookups(mock_db_session):
+    """Test that the index is built from paged rows and answers change checks."""
+    sync_id = uuid.uuid4()
+    db_ids = [uuid.uuid4(), uuid.uuid4()]
+
+    async def pages(*args, **kwargs):
+        yield [(db_ids[0], "a", _sha("a"))]
+        yield [(db_ids[1], "b", "not-a-hex-hash")]
+
+    with patch("airweave.crud.entity.iter_hashes_by_sync_id", side_effect=pages):
+        index = await EntityHashIndex.load(mock_db_session, sync_id)
+
+    assert len(index) == 2
+    assert not index.is_empty
+    assert index.size_bytes > 0
+    assert index.get_db_entity_id("a") == db_ids[0]
+    assert index.get_db_entity_id("missing") is None
+    assert not index.has_changed("a", _sha("a"))
+    assert index.has_changed("a", _sha("changed"))
+    assert not index.has_changed("b", "not-a-hex-hash")
+    assert index.has_changed("missing", _sha("a"))
+
+
+def test_put_replaces_entry():
+    """Test that putting an existing entity id replaces its hash without growing the index."""
+    index = EntityHashIndex(uuid.uuid4())
+    assert index.is_empty
+
+    db_entity_id = uuid.uuid4()
+    index.put("a", _sha("v1"), db_entity_id)
+    size = index.size_bytes
+    index.put("a", _sha("v2"), db_entity_id)
+
+    assert len(index) == 1
+    assert index.size_bytes == size
+    assert not index.has_changed("a", _sha("v2"))
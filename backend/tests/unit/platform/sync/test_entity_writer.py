@@ -0,0 +1,83 @@
+"""Unit tests for the EntityWriteBuffer class."""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from airweave import schemas
+from airweave.platform.sync.entity_writer import DEFAULT_FLUSH_SIZE, EntityWriteBuffer
+
+
+def _row(entity_id: str, hash: str = "h") -> schemas.EntityCreate:
+    return schemas.EntityCreate(
+        sync_job_id=uuid.uuid4(), sync_id=uuid.uuid4(), entity_id=entity_id, hash=hash
+    )
+
+
+@pytest.fixture
+def mock_crud():
+    """Patch the DB session and bulk upsert paths used by the buffer."""
+    with (
+        patch("airweave.platform.sync.entity_writer.get_db_context") as mock_get_db_context,
+        patch("airweave.crud.entity.bulk_upsert", new_callable=AsyncMock) as mock_upsert,
+        patch("airweave.crud.entity.bulk_upsert_copy", new_callable=AsyncMock) as mock_copy,
+    ):
+        mock_get_db_context.return_value.__aenter__.return_value = AsyncMock()
+        yield mock_upsert, mock_copy
+
+
+@pytest.mark.asyncio
+class TestEntityWriteBuffer:
+    """Tests for EntityWriteBuffer."""
+
+    async def test_flush_on_size_and_exit(self, mock_crud):
+        """Test that rows are flushed when the buffer is full and when the job ends."""
+        mock_upsert, mock_copy = mock_crud
+
+        async with EntityWriteBuffer(uuid.uuid4(), flush_size=2, flush_interval=60) as writer:
+            await writer.add(uuid.uuid4(), _row("a"))
+            mock_upsert.assert_not_called()
+            await writer.add(uuid.uuid4(), _row("b"))
+            assert mock_upsert.call_count == 1
+            await writer.add(uuid.uuid4(), _row("c"))
+
+        assert mock_upsert.call_count == 2
+        assert len(mock_upsert.call_args.kwargs["objs_in"]) == 1
+        mock_copy.assert_not_called()
+
+    async def test_last_write_wins_and_copy_threshold(self, mock_crud):
+        """Test that rows are deduplicated by entity id and large flushes use COPY."""
+        mock_upsert, mock_copy = mock_crud
+
+        async with EntityWriteBuffer(uuid.uuid4(), flush_size=100, copy_threshold=2) as writer:
+            await writer.add(uuid.uuid4(), _row("a", "old"))
+            await writer.add(uuid.uuid4(), _row("a", "new"))
+            await writer.add(uuid.uuid4(), _row("b"))
+            assert len(writer) == 2
+
+        mock_upsert.assert_not_called()
+        objs_in = mock_copy.call_args.kwargs["objs_in"]
+        assert sorted(obj.hash for obj in objs_in.values()) == ["h", "new"]
+
+    async def test_failed_flush_keeps_rows(self, mock_crud):
+        """Test that rows are kept for a retry when a flush fails."""
+        mock_upsert, _ = mock_crud
+        mock_upsert.side_effect = RuntimeError("db down")
+
+        writer = EntityWriteBuffer(uuid.uuid4(), flush_size=100)
+        await writer.add(uuid.uuid4(), _row("a"))
+        with pytest.raises(RuntimeError):
+            await writer.flush()
+        assert len(writer) == 1
+
+    async def test_full_buffer_uses_copy_by_default(self, mock_crud):
+        """Test that with the default settings a full buffer is written through COPY."""
+        mock_upsert, mock_copy = mock_crud
+
+        writer = EntityWriteBuffer(uuid.uuid4())
+        for i in range(DEFAULT_FLUSH_SIZE):
+            await writer.add(uuid.uuid4(), _row(str(i)))
+
+        assert len(mock_copy.call_args.kwargs["objs_in"]) == DEFAULT_FLUSH_SIZE
+        mock_upsert.assert_not_called()
@@ -0,0 +1,102 @@
+"""Unit tests for the FairShareScheduler class."""
+
+import asyncio
+import uuid
+
+import pytest
+
+from airweave.platform.sync.fair_share import FairShareScheduler
+
+
+@pytest.mark.asyncio
+class TestFairShareScheduler:
+    """Tests for FairShareScheduler."""
+
+    async def test_freed_slot_goes_to_starved_job(self):
+        """Test that a newly started job gets the next free slot ahead of a busy job."""
+        scheduler = FairShareScheduler(max_concurrency=2)
+        big_job, small_job = uuid.uuid4(), uuid.uuid4()
+        order = []
+
+        async def work(job_id, release: asyncio.Event):
+            async with scheduler.slot(job_id):
+                order.append(job_id)
+                await release.wait()
+
+        async with (
+            scheduler.job(big_job, uuid.uuid4()),
+            scheduler.job(small_job, uuid.uuid4()),
+        ):
+            release = asyncio.Event()
+            # The big job fills the budget and queues more work
+            tasks = [asyncio.create_task(work(big_job, release)) for _ in range(4)]
+            await asyncio.sleep(0)
+            assert scheduler.in_use == 2
+
+            # The small job arrives later, behind the big job's backlog
+            tasks.append(asyncio.create_task(work(small_job, release)))
+            await asyncio.sleep(0)
+
+            release.set()
+            await asyncio.gather(*tasks)
+
+        # The first slot freed by the big job went to the small job
+        assert order[:3] == [big_job, big_job, small_job]
+        assert scheduler.in_use == 0
+
+    async def test_organization_weights(self):
+        """Test that free slots are divided according to organization weights."""
+        heavy_org, light_org = uuid.uuid4(), uuid.uuid4()
+        scheduler = FairShareScheduler(
+            max_concurrency=4, organization_weights={str(heavy_org): 3.0}
+        )
+        heavy_job, light_job = uuid.uuid4(), uuid.uuid4()
+        blocker = uuid.uuid4()
+        release_blocker, hold = asyncio.Event(), asyncio.Event()
+
+        async def work(job_id, release):
+            async with scheduler.slot(job_id):
+                await release.wait()
+
+        async with (
+            scheduler.job(blocker, uuid.uuid4()),
+            scheduler.job(heavy_job, heavy_org),
+            scheduler.job(light_job, light_org),
+        ):
+            blockers = [asyncio.create_task(work(blocker, release_blocker)) for _ in range(4)]
+            await asyncio.sleep(0)
+            waiting = [asyncio.create_task(work(heavy_job, hold)) for _ in range(4)]
+            waiting += [asyncio.create_task(work(light_job, hold)) for _ in range(4)]
+            await asyncio.sleep(0)
+
+            # Free the whole budget, then look at who got the slots
+            release_blocker.set()
+            await asyncio.gather(*blockers)
+            await asyncio.sleep(0)
+            assert scheduler._jobs[heavy_job].in_use == 3
+            assert scheduler._jobs[light_job].in_use == 1
+
+            hold.set()
+            await asyncio.gather(*waiting)
+
+    async def test_release_skips_waiter_cancelled_in_the_same_tick(self):
+        """Test that a slot released right after its waiter was cancelled is not lost."""
+        scheduler = FairShareScheduler(max_concurrency=1)
+        job_id = uuid.uuid4()
+
+        async with scheduler.job(job_id, uuid.uuid4()):
+            holder = scheduler.slot(job_id)
+            await holder.__aenter__()
+            waiting = asyncio.create_task(scheduler._acquire(job_id))
+            await asyncio.sleep(0)
+
+            # The waiter future is cancelled now, the task's cleanup only runs on a later tick
+            waiting.cancel()
+            scheduler._jobs[job_id].waiters[0].cancel()
+            await holder.__aexit__(None, None, None)
+
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+            assert scheduler.in_use == 0
+            async with scheduler.slot(job_id):
+                assert scheduler.in_use == 1
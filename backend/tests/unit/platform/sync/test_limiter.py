@@ -0,0 +1,94 @@
+"""Unit tests for the ConcurrencyLimiter class."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from airweave.platform.sync.limiter import ConcurrencyLimiter, is_overload_error
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://api.example.com")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+def test_is_overload_error():
+    """Test that timeouts, 429s and 503s are recognized, also when wrapped."""
+    assert is_overload_error(asyncio.TimeoutError())
+    assert is_overload_error(httpx.ReadTimeout("timed out"))
+    assert is_overload_error(_status_error(429))
+    assert is_overload_error(_status_error(503))
+    assert not is_overload_error(_status_error(400))
+    assert not is_overload_error(ValueError("bad input"))
+
+    try:
+        try:
+            raise _status_error(429)
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError("embedding failed") from e
+    except RuntimeError as wrapped:
+        assert is_overload_error(wrapped)
+
+
+def test_additive_increase_and_multiplicative_decrease():
+    """Test that a healthy round raises the limit by one and an overload halves it."""
+    limiter = ConcurrencyLimiter(initial_limit=4, min_limit=1, max_limit=10, latency_window=4)
+
+    start = time.monotonic()
+    for _ in range(4):
+        limiter.record_success(0.1, start)
+    assert limiter.limit == 5
+
+    limiter.record_error(_status_error(429), time.monotonic())
+    assert limiter.limit == 2
+
+    # Calls that started before the cut don't cut again
+    limiter.record_error(_status_error(429), start)
+    assert limiter.limit == 2
+
+    # Errors that are not overload leave the limit alone
+    limiter.record_error(ValueError("bad input"), time.monotonic())
+    assert limiter.limit == 2
+
+
+def test_rising_latency_decreases_limit():
+    """Test that a p95 far above the baseline cuts the limit."""
+    limiter = ConcurrencyLimiter(initial_limit=4, min_limit=1, max_limit=10, latency_window=4)
+
+    for _ in range(4):
+        limiter.record_success(0.1, time.monotonic())
+    assert limiter.limit == 5
+
+    for _ in range(5):
+        limiter.record_success(1.0, time.monotonic())
+    assert limiter.limit == 2
+
+
+def test_fixed_limiter_does_not_adapt():
+    """Test that a limiter without a range keeps its limit."""
+    limiter = ConcurrencyLimiter(initial_limit=3)
+    assert not limiter.adaptive
+
+    for _ in range(10):
+        limiter.record_success(0.1, time.monotonic())
+    limiter.record_error(_status_error(429), time.monotonic())
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_release():
+    """Test that acquiring above the limit waits until a slot is released."""
+    limiter = ConcurrencyLimiter(initial_limit=1)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 1
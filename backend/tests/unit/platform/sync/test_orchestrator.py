@@ -0,0 +1,250 @@
+"""Unit tests for the SyncOrchestrator class."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.core.exceptions import CursorExpiredError
+from airweave.platform.embedding_models.cache import EmbeddingCache
+from airweave.platform.embedding_models.fake import FakeEmbeddingModel
+from airweave.platform.entities._base import (
+    BaseEntity,
+    ChunkEntity,
+    DeletedEntity,
+    DestinationAction,
+    FileEntity,
+)
+from airweave.platform.sources._base import BaseSource
+from airweave.platform.sync.checkpoint import CheckpointTracker
+from airweave.platform.sync.entity_index import EntityHashIndex
+from airweave.platform.sync.orchestrator import EntityProcessor, SyncOrchestrator
+from airweave.platform.sync.pubsub import SyncProgressUpdate
+
+
+@pytest.fixture
+def sync_context():
+    """Create a sync context with one mocked destination."""
+    context = MagicMock()
+    context.sync.id = uuid.uuid4()
+    context.sync_job.id = uuid.uuid4()
+    context.destinations = [AsyncMock()]
+    context.progress.stats = SyncProgressUpdate()
+
+    async def increment(stat_name, amount=1):
+        stats = context.progress.stats
+        setattr(stats, stat_name, getattr(stats, stat_name) + amount)
+
+    context.progress.increment = increment
+    return context
+
+
+@pytest.mark.asyncio
+class TestDeleteOrphanedEntities:
+    """Tests for SyncOrchestrator._delete_orphaned_entities."""
+
+    async def test_deletes_pages_from_destinations_and_db(self, sync_context):
+        """Test that every page of outdated entities is deleted everywhere and counted."""
+        pages = [
+            [(uuid.uuid4(), "a"), (uuid.uuid4(), "b")],
+            [(uuid.uuid4(), "c")],
+        ]
+
+        async def iter_outdated(*args, **kwargs):
+            for page in pages:
+                yield page
+
+        with (
+            patch("airweave.platform.sync.orchestrator.get_db_context") as mock_get_db_context,
+            patch("airweave.crud.entity.iter_outdated", side_effect=iter_outdated),
+            patch("airweave.crud.entity.bulk_remove", new_callable=AsyncMock) as mock_remove,
+        ):
+            mock_get_db_context.return_value.__aenter__.return_value = AsyncMock()
+            await SyncOrchestrator()._delete_orphaned_entities(sync_context)
+
+        destination = sync_context.destinations[0]
+        assert [call.args[0] for call in destination.bulk_delete_by_parent_ids.call_args_list] == [
+            ["a", "b"],
+            ["c"],
+        ]
+        assert [call.kwargs["ids"] for call in mock_remove.call_args_list] == [
+            [id for id, _ in page] for page in pages
+        ]
+        assert sync_context.progress.stats.deleted == 3
+
+
+class IncrementalSource(BaseSource):
+    """Source with a change feed, whose stored cursor may have expired."""
+
+    _supports_incremental = True
+
+    def __init__(self, expired: bool = False):
+        self.expired = expired
+
+    @classmethod
+    async def create(cls, credentials=None):
+        return cls()
+
+    async def generate_entities(self):
+        for entity_id in ("a", "b"):
+            yield BaseEntity(entity_id=entity_id)
+
+    async def get_change_cursor(self):
+        return {"page_token": "2"}
+
+    async def generate_changes(self, cursor):
+        if self.expired:
+            raise CursorExpiredError()
+        yield BaseEntity(entity_id="a")
+        yield DeletedEntity(entity_id="b")
+        self.set_change_cursor({"page_token": "3"})
+
+
+@pytest.mark.asyncio
+class TestGenerateEntities:
+    """Tests for SyncOrchestrator._generate_entities."""
+
+    async def _generate(self, sync_context, source):
+        sync_context.source = source
+        sync_context.checkpoint_tracker = CheckpointTracker(source, sync_context.sync_job.id)
+        return [entity async for entity in SyncOrchestrator()._generate_entities(sync_context)]
+
+    async def test_reads_changes_from_stored_cursor(self, sync_context):
+        """Test that an incremental run yields the changes and moves the change cursor."""
+        sync_context.change_cursor = {"page_token": "1"}
+        entities = await self._generate(sync_context, IncrementalSource())
+
+        assert [type(entity) for entity in entities] == [BaseEntity, DeletedEntity]
+        assert sync_context.change_cursor == {"page_token": "1"}
+        assert sync_context.checkpoint_tracker.change_cursor == {"page_token": "3"}
+
+    async def test_expired_cursor_falls_back_to_full_sync(self, sync_context):
+        """Test that an expired change cursor runs a full sync and takes a new cursor."""
+        sync_context.change_cursor = {"page_token": "1"}
+        entities = await self._generate(sync_context, IncrementalSource(expired=True))
+
+        assert [entity.entity_id for entity in entities] == ["a", "b"]
+        # A full run, so the orphan pass runs
+        assert sync_context.change_cursor is None
+        assert sync_context.checkpoint_tracker.change_cursor == {"page_token": "2"}
+
+
+@pytest.mark.asyncio
+class TestOrphanProtection:
+    """Tests that entities the source still has are never deleted as orphans."""
+
+    async def test_download_failures_skip_orphan_deletion(self, sync_context):
+        """Test that a file the source failed to download keeps the orphan pass from running."""
+        source = IncrementalSource()
+        source._download_failures = 1
+        sync_context.source = source
+        sync_context.dry_run = None
+        sync_context.change_cursor = None
+        pipeline = MagicMock(failed=0)
+
+        orchestrator = SyncOrchestrator()
+        with patch.object(orchestrator, "_delete_orphaned_entities") as mock_delete:
+            await orchestrator._complete_stream(sync_context, pipeline)
+
+        mock_delete.assert_not_called()
+        assert sync_context.progress.stats.failed == 1
+
+    async def test_update_without_chunks_keeps_stored_version(self, sync_context):
+        """Test that an update that produced no chunks is marked seen with its old hash."""
+        db_entity_id = uuid.uuid4()
+        old_hash = "ab" * 32
+        sync_context.entity_index = EntityHashIndex(sync_context.sync.id)
+        sync_context.entity_index.put("a", old_hash, db_entity_id)
+        sync_context.entity_writer = AsyncMock()
+        entity = BaseEntity(entity_id="a")
+
+        await EntityProcessor()._persist_batch(
+            [(entity, [], db_entity_id, DestinationAction.UPDATE)], sync_context
+        )
+
+        sync_context.entity_writer.add.assert_awaited_once()
+        row_id, row = sync_context.entity_writer.add.call_args.args
+        assert row_id == db_entity_id
+        assert (row.sync_job_id, row.hash) == (sync_context.sync_job.id, old_hash)
+        # The destinations still hold the old chunks
+        sync_context.destinations[0].bulk_delete_by_parent_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestFileRelease:
+    """Tests that the downloaded file of every entity is released once."""
+
+    def _file(self, name):
+        return FileEntity(
+            entity_id=name,
+            file_id=name,
+            name=name,
+            download_url=f"https://example.com/{name}",
+            local_path=f"/tmp/airweave/{name}",
+        )
+
+    async def test_files_of_lost_entities_are_released_when_the_run_ends(self, sync_context):
+        """Test that files of a failed batch are released at the end, and others only once."""
+        sync_context.held_files = set()
+        sync_context.checkpoint_tracker = MagicMock()
+        kept, lost = self._file("kept"), self._file("lost")
+
+        async def entities():
+            yield kept
+            yield lost
+
+        orchestrator = SyncOrchestrator()
+        with patch("airweave.platform.sync.orchestrator.file_store") as mock_file_store:
+            held = [entity async for entity in orchestrator._hold_files(entities(), sync_context)]
+            assert sync_context.held_files == {kept.local_path, lost.local_path}
+
+            # The batch with the kept entity is processed, the lost one's batch fails
+            processor = orchestrator.entity_processor
+            processor._release_file(held[0], sync_context)
+            processor._release_file(held[0], sync_context)
+            with patch.object(processor, "_determine_actions", side_effect=RuntimeError):
+                with pytest.raises(RuntimeError):
+                    await processor.prepare([held[1]], sync_context)
+
+            orchestrator._release_held_files(sync_context)
+
+        assert [call.args[0] for call in mock_file_store.release.call_args_list] == [
+            kept.local_path,
+            lost.local_path,
+        ]
+        assert not sync_context.held_files
+
+
+class _CachedFakeModel(FakeEmbeddingModel):
+    CACHEABLE = True
+
+
+class _Chunk(ChunkEntity):
+    content: str
+
+
+@pytest.mark.asyncio
+class TestEmbed:
+    """Tests for the embed stage of EntityProcessor."""
+
+    async def test_unchanged_entity_hits_cache_on_next_sync(self, tmp_path):
+        """Test that fields set per sync job do not keep an entity's vector from the cache."""
+        cache = EmbeddingCache(str(tmp_path / "embeddings.db"), max_size=1024 * 1024)
+        processor = EntityProcessor()
+        sync_id = uuid.uuid4()
+
+        with patch("airweave.platform.sync.orchestrator.embedding_cache", cache):
+            for _ in range(2):
+                context = MagicMock()
+                context.sync.id = sync_id
+                context.sync.sync_metadata = None
+                context.sync.white_label_id = None
+                context.sync_job.id = uuid.uuid4()
+                context.source._name = "test"
+                context.embedding_model = _CachedFakeModel(vector_dimensions=8)
+
+                entity = await processor._enrich(_Chunk(entity_id="a", content="hello"), context)
+                entity.db_entity_id = uuid.uuid4()
+                await processor.embed([(entity, [entity], None, DestinationAction.UPDATE)], context)
+
+        assert (cache.stats.misses, cache.stats.hits) == (1, 1)
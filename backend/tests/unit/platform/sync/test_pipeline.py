@@ -0,0 +1,96 @@
+"""Unit tests for the StagedPipeline class."""
+
+import asyncio
+
+import pytest
+
+from airweave.platform.sync.pipeline import PipelineStage, StageConfig, StagedPipeline
+
+
+async def _batches(items, batch_size):
+    """Yield `items` in batches of `batch_size`."""
+    for i in range(0, len(items), batch_size):
+        yield items[i : i + batch_size]
+
+
+def _stage(name, handler, workers=2, batch_size=3, queue_size=5):
+    return PipelineStage(
+        name=name,
+        handler=handler,
+        config=StageConfig(workers=workers, batch_size=batch_size, queue_size=queue_size),
+        max_batch_latency=0.01,
+    )
+
+
+@pytest.mark.asyncio
+class TestStagedPipeline:
+    """Tests for StagedPipeline."""
+
+    async def test_items_flow_through_all_stages(self):
+        """Test that every item passes every stage, with each stage's own batch size."""
+        received = []
+        seen_batch_sizes = []
+
+        async def double(batch):
+            return [item * 2 for item in batch]
+
+        async def collect(batch):
+            seen_batch_sizes.append(len(batch))
+            received.extend(batch)
+            return []
+
+        pipeline = StagedPipeline(
+            [_stage("double", double), _stage("collect", collect, workers=1, batch_size=4)]
+        )
+        await pipeline.run(_batches(list(range(20)), batch_size=3))
+
+        assert sorted(received) == [i * 2 for i in range(20)]
+        assert max(seen_batch_sizes) <= 4
+        stats = pipeline.stats()
+        assert stats["double"]["processed"] == 20
+        assert stats["collect"]["processed"] == 20
+        assert pipeline.queue_depths == {"double": 0, "collect": 0}
+
+    async def test_slow_stage_applies_backpressure(self):
+        """Test that a slow stage's bounded queue limits how far upstream stages run ahead."""
+        produced = 0
+        max_ahead = 0
+        consumed = 0
+
+        async def produce(batch):
+            nonlocal produced
+            produced += len(batch)
+            return batch
+
+        async def slow(batch):
+            nonlocal consumed, max_ahead
+            max_ahead = max(max_ahead, produced - consumed)
+            await asyncio.sleep(0.01)
+            consumed += len(batch)
+            return []
+
+        pipeline = StagedPipeline(
+            [
+                _stage("produce", produce, workers=1, batch_size=1),
+                _stage("slow", slow, workers=1, batch_size=1, queue_size=2),
+            ]
+        )
+        await pipeline.run(_batches(list(range(30)), batch_size=1))
+
+        assert consumed == 30
+        # The queue, the batch being collected and the blocked put of the producer
+        assert max_ahead <= 5
+
+    async def test_stage_error_is_raised(self):
+        """Test that a failing input cancels the pipeline and propagates the error."""
+
+        async def failing_batches():
+            yield [1]
+            raise RuntimeError("source failed")
+
+        async def passthrough(batch):
+            return batch
+
+        pipeline = StagedPipeline([_stage("a", passthrough), _stage("b", passthrough)])
+        with pytest.raises(RuntimeError, match="source failed"):
+            await pipeline.run(failing_batches())
@@ -114,7 +114,7 @@ class TestSyncServiceRun:
                     # Assert
                     mock_get_db_context.assert_called_once()
                     mock_create_context.assert_called_once_with(
-                        mock_db, mock_sync, mock_sync_job, mock_sync_dag, mock_user
+                        mock_db, mock_sync, mock_sync_job, mock_sync_dag, mock_user, dry_run=None
                     )
                     mock_run.assert_called_once_with(mock_sync_context)
                     assert result == mock_sync_result
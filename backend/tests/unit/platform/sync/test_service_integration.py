@@ -118,7 +118,7 @@ class TestSyncServiceIntegration:
             # Run assertions
             mock_get_db_context.assert_called_once()
             mock_create_context.assert_called_once_with(
-                mock_db, created_sync, sync_job, mock_sync_dag, mock_user
+                mock_db, created_sync, sync_job, mock_sync_dag, mock_user, dry_run=None
             )
             mock_run.assert_called_once_with(mock_sync_context)
 
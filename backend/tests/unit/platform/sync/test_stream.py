@@ -0,0 +1,54 @@
+"""Unit tests for the AsyncSourceStream class."""
+
+import asyncio
+
+import pytest
+
+from airweave.platform.entities._base import BaseEntity
+from airweave.platform.sync.stream import AsyncSourceStream
+
+
+async def _generate(count: int, delay: float = 0.0):
+    """Yield `count` entities, optionally sleeping between them."""
+    for i in range(count):
+        if delay:
+            await asyncio.sleep(delay)
+        yield BaseEntity(entity_id=str(i))
+
+
+@pytest.mark.asyncio
+class TestGetEntityBatches:
+    """Tests for AsyncSourceStream.get_entity_batches."""
+
+    async def test_batches_by_size(self):
+        """Test that full batches are yielded and the remainder is flushed at the end."""
+        async with AsyncSourceStream(_generate(7)) as stream:
+            batches = [
+                batch async for batch in stream.get_entity_batches(batch_size=3, max_latency=5)
+            ]
+
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert [e.entity_id for batch in batches for e in batch] == [str(i) for i in range(7)]
+
+    async def test_batches_by_latency(self):
+        """Test that a partial batch is flushed when the linger window expires."""
+        async with AsyncSourceStream(_generate(3, delay=0.05)) as stream:
+            batches = [
+                batch
+                async for batch in stream.get_entity_batches(batch_size=100, max_latency=0.01)
+            ]
+
+        assert len(batches) == 3
+        assert [e.entity_id for batch in batches for e in batch] == ["0", "1", "2"]
+
+    async def test_producer_error_is_raised(self):
+        """Test that an error in the source generator propagates to the consumer."""
+
+        async def failing():
+            yield BaseEntity(entity_id="0")
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError, match="source failed"):
+            async with AsyncSourceStream(failing()) as stream:
+                async for _ in stream.get_entity_batches(batch_size=10, max_latency=5):
+                    pass
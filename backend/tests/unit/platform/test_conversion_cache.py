@@ -0,0 +1,59 @@
+"""Unit tests for the conversion cache."""
+
+import os
+
+import pytest
+
+from airweave.platform.file_handling.conversion._base import (
+    DocumentConverter,
+    DocumentConverterResult,
+)
+from airweave.platform.file_handling.conversion.cache import ConversionCache
+
+
+class _Converter(DocumentConverter):
+    async def convert(self, local_path, **kwargs):
+        return None
+
+
+class _NewerConverter(_Converter):
+    VERSION = "2"
+
+
+def _result(text: str) -> DocumentConverterResult:
+    return DocumentConverterResult(title="Title", text_content=text, metadata={"pages": 1})
+
+
+@pytest.mark.asyncio
+async def test_conversions_are_cached_per_checksum_and_converter_version(tmp_path):
+    """Test that a cached conversion is found again, also by a new cache on the same dir."""
+    cache = ConversionCache(str(tmp_path), max_size=1024 * 1024)
+    key = cache.key("checksum", _Converter(), ".pdf", {})
+    await cache.put(key, _result("# Hello"))
+
+    cached = await ConversionCache(str(tmp_path), max_size=1024 * 1024).get(key)
+    assert (cached.title, cached.text_content, cached.metadata) == (
+        "Title",
+        "# Hello",
+        {"pages": 1},
+    )
+
+    assert await cache.get(cache.key("other checksum", _Converter(), ".pdf", {})) is None
+    assert await cache.get(cache.key("checksum", _NewerConverter(), ".pdf", {})) is None
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_conversions_are_evicted(tmp_path):
+    """Test that the cache stays within its size by evicting least recently used entries."""
+    text = os.urandom(400).hex()  # Incompressible
+    cache = ConversionCache(str(tmp_path), max_size=1300)
+    keys = [cache.key(str(i), _Converter(), ".txt", {}) for i in range(3)]
+
+    await cache.put(keys[0], _result(text))
+    await cache.put(keys[1], _result(text))
+    await cache.get(keys[0])
+    await cache.put(keys[2], _result(text))
+
+    assert await cache.get(keys[0]) is not None
+    assert await cache.get(keys[1]) is None
+    assert await cache.get(keys[2]) is not None
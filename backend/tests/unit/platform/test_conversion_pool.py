@@ -0,0 +1,47 @@
+"""Unit tests for the conversion process pool."""
+
+import os
+import time
+
+import pytest
+
+from airweave.platform.file_handling.conversion.process_pool import (
+    ConversionPool,
+    ConversionTimeoutError,
+    ConversionWorkerError,
+)
+
+
+@pytest.fixture
+def pool():
+    """A pool with a single worker."""
+    pool = ConversionPool(max_workers=1, timeout=30.0, memory_limit=0)
+    yield pool
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_a_reused_worker_process(pool):
+    """Test that results and errors of jobs are returned, and workers are reused."""
+    worker_pid = await pool.run(os.getpid)
+    assert worker_pid != os.getpid()
+    assert await pool.run(os.getpid) == worker_pid
+
+    with pytest.raises(ValueError):
+        await pool.run(int, "not a number")
+    assert await pool.run(os.getpid) == worker_pid
+
+
+@pytest.mark.asyncio
+async def test_hanging_and_crashing_jobs_only_fail_themselves(pool):
+    """Test that a worker is replaced after a job times out or kills it."""
+    worker_pid = await pool.run(os.getpid)
+
+    with pytest.raises(ConversionTimeoutError):
+        await pool.run(time.sleep, 10, timeout=0.5)
+    replacement_pid = await pool.run(os.getpid)
+    assert replacement_pid != worker_pid
+
+    with pytest.raises(ConversionWorkerError):
+        await pool.run(os._exit, 1)
+    assert await pool.run(os.getpid) not in (worker_pid, replacement_pid)
@@ -0,0 +1,76 @@
+"""Unit tests for the download manager."""
+
+import asyncio
+
+import pytest
+
+from airweave.platform.entities._base import BaseEntity, FileEntity
+from airweave.platform.file_handling.download_manager import DownloadManager
+from airweave.platform.sources._base import BaseSource
+
+
+async def _items(items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.asyncio
+async def test_downloads_complete_out_of_order_within_limits():
+    """Test that small files overtake a slow one, and the limits are never exceeded."""
+    manager = DownloadManager(max_concurrency=3, max_bytes_in_flight=100)
+    running = []
+    max_running = 0
+    max_bytes = 0
+
+    async def download(item):
+        nonlocal max_running, max_bytes
+        running.append(item)
+        max_running = max(max_running, len(running))
+        max_bytes = max(max_bytes, manager.bytes_in_flight)
+        await asyncio.sleep(0.05 if item == "slow" else 0.001)
+        running.remove(item)
+        return item
+
+    items = ["slow"] + [f"small-{i}" for i in range(6)]
+    sizes = {"slow": 60}
+    results = [
+        result
+        async for result in manager.prefetch(
+            _items(items), download, size=lambda item: sizes.get(item, 20)
+        )
+    ]
+
+    assert sorted(results) == sorted(items)
+    assert results[-1] == "slow"
+    assert max_running <= 3
+    assert max_bytes <= 100
+
+
+@pytest.mark.asyncio
+async def test_resume_cursor_waits_for_files_still_downloading():
+    """Test that the resume cursor never covers a file that has not been yielded yet."""
+
+    class Source(BaseSource):
+        async def generate_entities(self):
+            for page in range(3):
+                self.set_resume_cursor({"page": page})
+                yield FileEntity(
+                    entity_id=str(page), file_id=str(page), name="f", download_url="https://x"
+                )
+                yield BaseEntity(entity_id=f"{page}-meta")
+
+    source = Source()
+
+    async def download(file_entity):
+        # The file of the first page is the last one to finish
+        await asyncio.sleep(0.05 if file_entity.entity_id == "0" else 0.001)
+        return file_entity
+
+    yielded = []
+    async for entity in source.process_file_entities(source.generate_entities(), download):
+        yielded.append((entity.entity_id, source.resume_cursor))
+
+    # Until the file of the first page is yielded, the cursor stays at the first page
+    first_file = [entity_id for entity_id, _ in yielded].index("0")
+    assert all(cursor == {"page": 0} for _, cursor in yielded[: first_file + 1])
+    assert source.resume_cursor == {"page": 2}
@@ -0,0 +1,51 @@
+"""Unit tests for the embedding batcher."""
+
+import asyncio
+from typing import ClassVar, List
+
+import pytest
+
+from airweave.platform.embedding_models.batcher import EmbeddingBatcher
+from airweave.platform.embedding_models.fake import FakeEmbeddingModel
+
+
+class _RecordingModel(FakeEmbeddingModel):
+    """Fake model recording its requests, failing those with a text containing "bad"."""
+
+    MAX_BATCH_ITEMS: ClassVar[int] = 5
+    requests: List[List[str]] = []
+
+    async def embed_many(self, texts, model=None, encoding_format="float", dimensions=None):
+        self.requests.append(list(texts))
+        if any("bad" in text for text in texts):
+            raise ValueError("bad text")
+        return await super().embed_many(texts)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_batches_within_limits():
+    """Test that concurrent callers are batched together, and get their own vectors in order."""
+    model = _RecordingModel(requests=[])
+    batcher = EmbeddingBatcher(model, linger=0.05)
+    calls = [[f"call {i} text {j}" for j in range(3)] for i in range(4)]
+
+    results = await asyncio.gather(*(batcher.embed_many(texts) for texts in calls))
+
+    assert [len(request) for request in model.requests] == [5, 5, 2]
+    for texts, vectors in zip(calls, results, strict=True):
+        assert vectors == await FakeEmbeddingModel().embed_many(texts)
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_only_fails_the_caller_that_caused_it():
+    """Test that a failing shared batch is retried per caller."""
+    model = _RecordingModel(requests=[])
+    batcher = EmbeddingBatcher(model, linger=0.05)
+
+    good, bad = await asyncio.gather(
+        batcher.embed_many(["fine"]), batcher.embed_many(["bad"]), return_exceptions=True
+    )
+
+    assert len(good) == 1
+    assert isinstance(bad, ValueError)
+    assert model.requests == [["fine", "bad"], ["fine"], ["bad"]]
@@ -0,0 +1,59 @@
+"""Unit tests for the embedding cache."""
+
+from typing import ClassVar
+
+import pytest
+
+from airweave.platform.embedding_models.cache import EmbeddingCache
+from airweave.platform.embedding_models.fake import FakeEmbeddingModel
+
+
+class _CachedFakeModel(FakeEmbeddingModel):
+    CACHEABLE: ClassVar[bool] = True
+
+
+class _Embedder:
+    """Embeds with a model, recording the texts it was asked for."""
+
+    def __init__(self, model):
+        self.model = model
+        self.requested = []
+
+    async def __call__(self, texts):
+        self.requested.extend(texts)
+        return await self.model.embed_many(texts)
+
+
+@pytest.mark.asyncio
+async def test_only_texts_not_cached_are_embedded(tmp_path):
+    """Test that cached vectors are reused, also after a restart, and hits are counted."""
+    model = _CachedFakeModel(vector_dimensions=8)
+    path = str(tmp_path / "embeddings.db")
+    embed = _Embedder(model)
+
+    first = await EmbeddingCache(path, max_size=1024 * 1024).embed_many(model, ["a", "b"], embed)
+    cache = EmbeddingCache(path, max_size=1024 * 1024)
+    second = await cache.embed_many(model, ["b ", "c", "a"], embed)
+
+    assert embed.requested == ["a", "b", "c"]
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+    assert second[0] == pytest.approx(first[1]) and second[2] == pytest.approx(first[0])
+    # A model with other dimensions does not reuse the vectors
+    await cache.embed_many(_CachedFakeModel(vector_dimensions=4), ["a"], embed)
+    assert embed.requested[-1] == "a"
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_vectors_are_evicted(tmp_path):
+    """Test that the cache stays within its size by evicting least recently used vectors."""
+    model = _CachedFakeModel(vector_dimensions=64)  # 256 bytes per vector, plus overhead
+    cache = EmbeddingCache(str(tmp_path / "embeddings.db"), max_size=1000)
+    embed = _Embedder(model)
+
+    for text in ["a", "b", "c", "a", "d"]:
+        await cache.embed_many(model, [text], embed)
+    embed.requested.clear()
+
+    # "d" went over the size, evicting down to 90% of it: "b" and "c" were least recently used
+    await cache.embed_many(model, ["a", "b", "c", "d"], embed)
+    assert embed.requested == ["b", "c"]
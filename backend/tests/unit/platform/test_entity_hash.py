@@ -0,0 +1,123 @@
+"""Unit tests for entity hashing."""
+
+import importlib.util
+import os
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from airweave.core.config import Settings
+from airweave.platform.entities._base import BaseEntity, Breadcrumb, FileEntity
+from airweave.platform.entities._hashing import field_plan, new_hasher
+from airweave.platform.file_handling.file_manager import FileManager
+from airweave.platform.sources._base import BaseSource
+from airweave.platform.sync.entity_index import EntityHashIndex
+
+
+def _entity() -> BaseEntity:
+    return BaseEntity(
+        entity_id="1",
+        breadcrumbs=[Breadcrumb(entity_id="0", name="root", type="folder")],
+        sync_metadata={"b": 1, "a": [1, 2]},
+    )
+
+
+def test_hash_ignores_volatile_fields():
+    """Test that fields differing between runs of an unchanged entity do not change the hash."""
+    entity, other = _entity(), _entity()
+    other.sync_job_id = uuid4()
+    other.vector = [0.1, 0.2]
+
+    assert entity.db_entity_id != other.db_entity_id
+    assert entity.hash() == other.hash()
+
+
+def test_hash_is_memoized_until_a_hashed_field_changes():
+    """Test that the hash is cached and recomputed after a hashed field is assigned."""
+    entity = _entity()
+    original = entity.hash()
+    entity.db_entity_id = uuid4()
+    assert entity._hash == original
+
+    entity.url = "https://example.com"
+    assert entity._hash is None
+    assert entity.hash() != original
+
+
+def test_field_plan_depends_on_exclusions():
+    """Test that a field plan is cached per set of excluded fields, not per class only."""
+    default = [name for name, _ in field_plan(BaseEntity, BaseEntity.hash_exclude_fields)]
+    fewer = [name for name, _ in field_plan(BaseEntity, {"vector"})]
+
+    assert "sync_job_id" not in default
+    assert "sync_job_id" in fewer and "vector" not in fewer
+
+
+def test_settings_reject_unusable_hash_algorithm(monkeypatch):
+    """Test that an unknown or uninstalled hash algorithm fails at startup, not on first use."""
+    with pytest.raises(ValidationError, match="ENTITY_HASH_ALGORITHM"):
+        Settings(ENTITY_HASH_ALGORITHM="sha-256")
+
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    with pytest.raises(ValidationError, match="xxhash"):
+        Settings(ENTITY_HASH_ALGORITHM="xxh3_128")
+    assert Settings(ENTITY_HASH_ALGORITHM="blake2b").ENTITY_HASH_ALGORITHM == "blake2b"
+
+
+def test_file_hash_requires_download(tmp_path):
+    """Test that file entities are hashed by the contents of their downloaded file."""
+    entity = FileEntity(entity_id="1", file_id="1", name="a.txt", download_url="https://x")
+    with pytest.raises(ValueError):
+        entity.hash()
+
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"content")
+    entity.local_path = str(path)
+    same_content = entity.model_copy(update={"name": "b.txt"})
+    assert entity.hash() == same_content.hash()
+
+
+@pytest.mark.asyncio
+async def test_file_hash_reuses_download_checksum():
+    """Test that the checksum computed while downloading is the file's hash."""
+
+    async def stream():
+        for chunk in (b"first ", b"second"):
+            yield chunk
+
+    entity = FileEntity(entity_id="1", file_id="1", name="a.txt", download_url="https://x")
+    entity = await FileManager().handle_file_entity(stream(), entity)
+    try:
+        hasher = new_hasher()
+        hasher.update(b"first second")
+        assert entity.checksum == hasher.hexdigest()
+        assert entity.hash() == entity.checksum
+    finally:
+        os.remove(entity.local_path)
+
+
+def test_file_with_unchanged_fingerprint_needs_no_download():
+    """Test that a stored fingerprint lets the source skip the download of a file."""
+
+    class Source(BaseSource):
+        async def generate_entities(self):
+            yield
+
+    def file(fingerprint):
+        return FileEntity(
+            entity_id="1",
+            file_id="1",
+            name="a.txt",
+            download_url="https://x",
+            fingerprint=fingerprint,
+        )
+
+    index = EntityHashIndex(uuid4())
+    index.put("1", file("v1").hash(), uuid4())
+    source = Source()
+    assert not source.is_file_unchanged(file("v1"))
+
+    source.set_entity_index(index)
+    assert source.is_file_unchanged(file("v1"))
+    assert not source.is_file_unchanged(file("v2"))
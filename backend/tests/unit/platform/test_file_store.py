@@ -0,0 +1,104 @@
+"""Unit tests for the file store."""
+
+import asyncio
+import errno
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from airweave.platform.file_handling import file_store
+from airweave.platform.file_handling.file_store import FileStore
+
+
+async def _store_file(store: FileStore, name: str, size: int) -> str:
+    writer = await store.open(name, expected_size=size)
+    await writer.write(b"x" * size)
+    return await writer.commit()
+
+
+@pytest.mark.asyncio
+async def test_small_files_are_kept_in_memory(tmp_path):
+    """Test that files under the threshold go to the memory directory, larger ones to disk."""
+    store = FileStore(
+        root_dir=str(tmp_path / "disk"),
+        disk_budget=1000,
+        memory_threshold=10,
+        memory_dir=str(tmp_path / "memory"),
+    )
+    small = await _store_file(store, "small", 5)
+    large = await _store_file(store, "large", 50)
+
+    assert small.startswith(store.memory_dir)
+    assert large.startswith(store.disk_dir)
+    assert (store.memory_bytes, store.disk_bytes) == (5, 50)
+
+
+@pytest.mark.asyncio
+async def test_released_files_are_evicted_and_downloads_wait_for_space(tmp_path):
+    """Test that released files make room, and that a full store holds back downloads."""
+    store = FileStore(
+        root_dir=str(tmp_path / "disk"),
+        disk_budget=100,
+        memory_threshold=0,
+        memory_dir=None,
+        backpressure_timeout=5.0,
+    )
+    first = await _store_file(store, "first", 50)
+    second = await _store_file(store, "second", 50)
+
+    # Nothing is released yet, so the next download waits
+    waiting = asyncio.create_task(_store_file(store, "third", 40))
+    await asyncio.sleep(0.2)
+    assert not waiting.done()
+
+    store.release(second)
+    store.release(first)
+    third = await asyncio.wait_for(waiting, timeout=1.0)
+
+    # The least recently released file was evicted, the other one was not needed
+    assert not os.path.exists(second)
+    assert os.path.exists(first)
+    assert os.path.exists(third)
+    assert store.disk_bytes == 90
+
+
+@pytest.mark.asyncio
+async def test_process_dir_is_created_on_first_download(tmp_path):
+    """Test that creating a store touches no files, and the first download sets up its dir."""
+    root_dir = tmp_path / "disk"
+    # Left behind by a process that is gone
+    stale_dir = root_dir / "999999999"
+    stale_dir.mkdir(parents=True)
+
+    store = FileStore(root_dir=str(root_dir), disk_budget=100, memory_threshold=0)
+    assert os.listdir(root_dir) == ["999999999"]
+
+    path = await _store_file(store, "first", 10)
+    assert os.path.dirname(path) == str(root_dir / str(os.getpid()))
+    assert not stale_dir.exists()
+
+
+@pytest.mark.asyncio
+async def test_full_memory_dir_spills_to_disk(tmp_path, monkeypatch):
+    """Test that the memory budget fits the memory dir, and a full memory dir spills to disk."""
+    monkeypatch.setattr(
+        file_store.os, "statvfs", lambda path: SimpleNamespace(f_bavail=8, f_frsize=4)
+    )
+    store = FileStore(
+        root_dir=str(tmp_path / "disk"),
+        disk_budget=1000,
+        memory_threshold=10,
+        memory_dir=str(tmp_path / "memory"),
+    )
+    assert store.memory_dir and store.memory_budget == 32
+
+    def open_full(path, mode="r"):
+        raise OSError(errno.ENOSPC, "No space left on device", path)
+
+    monkeypatch.setattr(file_store, "open", open_full, raising=False)
+    path = await _store_file(store, "small", 5)
+
+    assert path.startswith(store.disk_dir)
+    assert os.listdir(store.memory_dir) == []
+    assert (store.memory_bytes, store.disk_bytes) == (0, 5)
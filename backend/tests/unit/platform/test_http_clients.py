@@ -0,0 +1,29 @@
+"""Unit tests for the HTTP client registry."""
+
+import httpx
+import pytest
+
+from airweave.platform.http_clients import HttpClientRegistry
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_per_host_and_scope():
+    """Test that a host gets one client per scope, and that it reuses connections."""
+    registry = HttpClientRegistry(http2=False)
+    client = registry.get("https://api.example.com/v1/items")
+    assert registry.get("api.example.com") is client
+    assert registry.get("https://api.example.com", scope="tenant") is not client
+    assert registry.get("https://files.example.com") is not client
+
+    # Swap in a mock transport, the request hook still counts the requests
+    client._transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    async with registry.borrow("https://api.example.com") as borrowed:
+        response = await borrowed.get("https://api.example.com/v1/items")
+        response.raise_for_status()
+    assert not client.is_closed
+
+    stats = registry.stats()["api.example.com"]
+    assert stats["requests"] == 1
+    assert stats["connections_open"] == 0
+    await registry.aclose()
+    assert client.is_closed
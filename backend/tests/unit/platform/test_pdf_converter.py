@@ -0,0 +1,130 @@
+"""Unit tests for the PDF converter's Mistral OCR processing."""
+
+import asyncio
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from tenacity import wait_none
+
+from airweave.core.config import settings
+from airweave.platform.file_handling.conversion.converters import pdf_converter
+from airweave.platform.file_handling.conversion.converters.pdf_converter import PdfConverter
+
+
+class FakeOcr:
+    """Mistral OCR that returns the name of a file as its markdown, after a delay per file."""
+
+    def __init__(self, delays=None, failures=None):
+        self.delays = delays or {}
+        # Number of times each file fails before it succeeds
+        self.failures = dict(failures or {})
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def process(self, model, document):
+        name = document["document_url"]
+        self.calls.append(name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(name, 0.01))
+            if self.failures.get(name):
+                self.failures[name] -= 1
+                raise RuntimeError(f"OCR of {name} failed")
+            return SimpleNamespace(pages=[SimpleNamespace(markdown=name)], metadata=None)
+        finally:
+            self.in_flight -= 1
+
+
+def _mistral_client(ocr: FakeOcr) -> MagicMock:
+    """Create an async Mistral client whose signed URL of a file is its name."""
+    client = MagicMock()
+    client.files.upload_async = AsyncMock(
+        side_effect=lambda file, purpose: SimpleNamespace(id=file["file_name"])
+    )
+    client.files.get_signed_url_async = AsyncMock(
+        side_effect=lambda file_id: SimpleNamespace(url=file_id)
+    )
+    client.ocr.process_async = AsyncMock(side_effect=ocr.process)
+    return client
+
+
+def _pdfs(directory, count):
+    """Write placeholder PDF files, OCR is faked so their contents do not matter."""
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"pages_{i + 1}-{i + 1}.pdf")
+        with open(path, "wb") as f:
+            f.write(b"%PDF")
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture(autouse=True)
+def no_retry_wait(monkeypatch):
+    """Retry failed OCR attempts without waiting."""
+    monkeypatch.setattr(PdfConverter._ocr_pdf.retry, "wait", wait_none())
+
+
+def _converter(monkeypatch, ocr: FakeOcr, max_concurrency: int = 4) -> PdfConverter:
+    monkeypatch.setattr(settings, "MISTRAL_OCR_MAX_CONCURRENCY", max_concurrency)
+    converter = PdfConverter()
+    converter.mistral_client = _mistral_client(ocr)
+    return converter
+
+
+@pytest.mark.asyncio
+async def test_ocr_requests_are_limited(monkeypatch, tmp_path):
+    """Test that no more than MISTRAL_OCR_MAX_CONCURRENCY files are in OCR at once."""
+    ocr = FakeOcr()
+    converter = _converter(monkeypatch, ocr, max_concurrency=2)
+
+    results = await asyncio.gather(
+        *(converter._process_single_pdf(path) for path in _pdfs(tmp_path, 6))
+    )
+
+    assert len(ocr.calls) == 6
+    assert ocr.max_in_flight == 2
+    assert [md for md, _ in results] == [f"pages_{i}-{i}.pdf" for i in range(1, 7)]
+
+
+@pytest.mark.asyncio
+async def test_large_pdf_keeps_page_order(monkeypatch, tmp_path):
+    """Test that batches finishing out of order are joined in page order."""
+    batch_paths = _pdfs(tmp_path, 3)
+    # The first batch finishes last
+    ocr = FakeOcr(delays={"pages_1-1.pdf": 0.1, "pages_2-2.pdf": 0.05})
+    converter = _converter(monkeypatch, ocr)
+    conversion_pool = MagicMock()
+    conversion_pool.run = AsyncMock(return_value=("Title", batch_paths))
+    monkeypatch.setattr(pdf_converter, "conversion_pool", conversion_pool)
+    monkeypatch.setattr(pdf_converter, "MAX_MISTRAL_FILE_SIZE", 0)
+
+    result = await converter.convert(batch_paths[0], file_extension=".pdf")
+
+    assert ocr.calls[0] == "pages_1-1.pdf"
+    assert result.title == "Title"
+    assert result.text_content == "pages_1-1.pdf\n\npages_2-2.pdf\n\npages_3-3.pdf"
+    assert result.cacheable
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried(monkeypatch, tmp_path):
+    """Test that a batch whose OCR fails once is retried, without splitting it into pages."""
+    batch_paths = _pdfs(tmp_path, 2)
+    ocr = FakeOcr(failures={"pages_2-2.pdf": 1})
+    converter = _converter(monkeypatch, ocr)
+    conversion_pool = MagicMock()
+    conversion_pool.run = AsyncMock(return_value=("Title", batch_paths))
+    monkeypatch.setattr(pdf_converter, "conversion_pool", conversion_pool)
+
+    result = await converter._process_large_pdf(batch_paths[0])
+
+    assert sorted(ocr.calls) == ["pages_1-1.pdf", "pages_2-2.pdf", "pages_2-2.pdf"]
+    assert result.text_content == "pages_1-1.pdf\n\npages_2-2.pdf"
+    assert result.cacheable
+    # Only the split into batches ran in the pool, not a split into pages
+    conversion_pool.run.assert_awaited_once()
@@ -0,0 +1,94 @@
+"""Unit tests for the PostgreSQL source."""
+
+import re
+
+import asyncpg
+import pytest
+
+from airweave.platform.sources import postgresql
+from airweave.platform.sources.postgresql import PostgreSQLSource
+
+
+def _cast_bytea(text):
+    """Cast text to bytea the way Postgres does for its hex format."""
+    assert text.startswith("\\x"), text
+    return bytes.fromhex(text[2:])
+
+
+class FakeConnection:
+    """Serves one table keyed by item_id, checking parameters the way asyncpg encodes them."""
+
+    def __init__(self, ids, data_type="integer", cast=int):
+        self.ids = ids
+        self.data_type = data_type
+        # Casts a key bound as text to the key type, as the server does
+        self.cast = cast
+        self.queries = []
+
+    async def fetch(self, query, *args):
+        if "information_schema.columns" in query:
+            return [
+                {
+                    "column_name": "item_id",
+                    "data_type": self.data_type,
+                    "is_nullable": "NO",
+                    "column_default": None,
+                },
+                {
+                    "column_name": "name",
+                    "data_type": "text",
+                    "is_nullable": "YES",
+                    "column_default": None,
+                },
+            ]
+        if "pg_index" in query:
+            return [{"attname": "item_id"}]
+
+        self.queries.append((query, args))
+        # asyncpg encodes a parameter as the type the server infers for it, e.g. integer
+        for i, pg_type in re.findall(r"\$(\d+)::(\w+)", query):
+            if pg_type != "text" and isinstance(args[int(i) - 1], str):
+                raise asyncpg.DataError(f"invalid input for query argument ${i}")
+        after = self.cast(args[0]) if args else None
+        ids = [id for id in self.ids if after is None or id > after]
+        limit = int(re.search(r"LIMIT (\d+)", query).group(1))
+        return [{"item_id": id, "name": f"item {id}"} for id in ids[:limit]]
+
+
+@pytest.mark.asyncio
+async def test_int_keyed_table_is_paged_by_key(monkeypatch):
+    """Test that the key of the last row is bound so the next page continues after it."""
+    monkeypatch.setattr(postgresql, "BATCH_SIZE", 2)
+    source = PostgreSQLSource()
+    source.conn = FakeConnection([1, 2, 3])
+    entity_class = await source._create_entity_class("public", "items")
+
+    entities = [
+        entity async for entity in source._generate_table_entities("public", "items", entity_class)
+    ]
+
+    assert [entity.entity_id for entity in entities] == [
+        "public.items:1",
+        "public.items:2",
+        "public.items:3",
+    ]
+    assert [args for _, args in source.conn.queries] == [(), ("2",), ("3",)]
+    # The key stays text, so it fits in the resume cursor
+    assert source.resume_cursor == {"table": "items", "key": ["3"]}
+
+
+@pytest.mark.asyncio
+async def test_bytea_keyed_table_is_paged_by_key(monkeypatch):
+    """Test that a binary key is bound in the bytea hex format, not as the repr of bytes."""
+    monkeypatch.setattr(postgresql, "BATCH_SIZE", 2)
+    source = PostgreSQLSource()
+    source.conn = FakeConnection([b"\x01", b"\x02\xff", b"\x03"], "bytea", _cast_bytea)
+    entity_class = await source._create_entity_class("public", "items")
+
+    entities = [
+        entity async for entity in source._generate_table_entities("public", "items", entity_class)
+    ]
+
+    assert len(entities) == 3
+    assert [args for _, args in source.conn.queries] == [(), ("\\x02ff",), ("\\x03",)]
+    assert source.resume_cursor == {"table": "items", "key": ["\\x03"]}
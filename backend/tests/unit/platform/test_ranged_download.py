@@ -0,0 +1,69 @@
+"""Unit tests for ranged downloads."""
+
+import re
+
+import httpx
+import pytest
+
+from airweave.platform.file_handling.ranged_download import RangedDownloader
+
+DATA = bytes(range(256)) * 400  # 102400 bytes
+
+
+def _server(supports_ranges: bool, fail_after: int = 0):
+    """Mock file server, whose first response breaks off after `fail_after` bytes if set."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.headers.get("Range"))
+        start, end = 0, len(DATA) - 1
+        match = re.match(r"bytes=(\d+)-(\d*)", request.headers.get("Range", ""))
+        if supports_ranges and match:
+            start = int(match.group(1))
+            end = min(int(match.group(2) or end), end)
+        body = DATA[start : end + 1]
+
+        async def content():
+            if fail_after and len(requests) == 1:
+                yield body[:fail_after]
+                raise httpx.ReadError("connection reset")
+            yield body
+
+        if supports_ranges:
+            return httpx.Response(
+                206,
+                headers={"Content-Range": f"bytes {start}-{end}/{len(DATA)}", "ETag": '"v1"'},
+                content=content(),
+            )
+        return httpx.Response(200, content=content())
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+
+async def _download(downloader: RangedDownloader, client: httpx.AsyncClient) -> bytes:
+    return b"".join([chunk async for chunk in downloader.stream(client, "https://files/f")])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("supports_ranges", [True, False])
+async def test_download_resumes_after_failure(supports_ranges):
+    """Test that a broken download is resumed, from the last byte when ranges are supported."""
+    client, requests = _server(supports_ranges, fail_after=1000)
+    downloader = RangedDownloader(part_size=len(DATA), backoff_base=0.01)
+
+    assert await _download(downloader, client) == DATA
+    assert len(requests) == 2
+    if supports_ranges:
+        assert requests[1] == f"bytes=1000-{len(DATA) - 1}"
+
+
+@pytest.mark.asyncio
+async def test_large_download_is_split_in_parallel_parts():
+    """Test that the rest of a large file is downloaded in parts, and yielded in order."""
+    client, requests = _server(supports_ranges=True)
+    downloader = RangedDownloader(part_size=10000, parallel_threshold=50000, max_parallel_parts=3)
+
+    assert await _download(downloader, client) == DATA
+    # The first part, then one request per part of the rest
+    assert len(requests) == 11
+    assert requests[-1] == f"bytes=100000-{len(DATA) - 1}"